@@ -0,0 +1,259 @@
+import asyncio
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from multiprocessing.connection import wait
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, Set, Union
+from read_batch import Worker, extract_file, stream_file
+
+WORKER_START_METHOD = "spawn"
+_TIMED_OUT = object()
+_CRASHED = object()
+
+
+def handle_job(file_path: str, options: dict):
+    if options.get("stream"):
+        return stream_file(file_path, options)
+    return extract_file(file_path, options)
+
+
+def receive(connection, timeout: Optional[float]):
+    if not wait([connection], timeout=timeout):
+        return _TIMED_OUT
+    try:
+        return connection.recv()
+    except (EOFError, OSError):
+        return _CRASHED
+
+
+def kill_created_worker(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().kill()
+
+
+def failure(file_path: str, error: str, started: float, stream: bool) -> dict:
+    result = {"type": "statistics"} if stream else {}
+    result.update({
+        "success": False,
+        "file_path": file_path,
+        "error": error,
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 2)
+    })
+    return result
+
+
+def timeout_error(started: float, deadline: float) -> str:
+    return "读取超时（{0}秒）".format(round(deadline - started, 3))
+
+
+class ReaderPool:
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        timeout: Optional[float] = None,
+        include_content: bool = True,
+        output_mode: str = "full",
+        use_cache: bool = True
+    ):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.max_pending = max(1, max_pending or self.workers * 2)
+        self.timeout = timeout
+        self.options = {
+            "include_content": include_content,
+            "output_mode": output_mode,
+            "use_cache": use_cache
+        }
+        self._threads = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="reader-wait")
+        self._idle: List[Worker] = []
+        self._busy: Set[Worker] = set()
+        self._pending: Set[Future] = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._closed = False
+
+    async def __aenter__(self) -> "ReaderPool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def deadline_for(self, timeout: Optional[float], deadline: Optional[float]) -> Optional[float]:
+        timeout = self.timeout if timeout is None else timeout
+        if timeout is not None and timeout > 0:
+            limit = time.monotonic() + timeout
+            deadline = limit if deadline is None else min(deadline, limit)
+        return deadline
+
+    async def acquire(self, deadline: Optional[float]) -> Worker:
+        if self._closed:
+            raise RuntimeError("读取池已关闭")
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        if deadline is None:
+            await self._slots.acquire()
+        else:
+            await asyncio.wait_for(self._slots.acquire(), max(0.0, deadline - time.monotonic()))
+        try:
+            if self._idle:
+                worker = self._idle.pop()
+            else:
+                worker = await self.create_worker()
+                if self._closed:
+                    worker.kill()
+                    raise RuntimeError("读取池已关闭")
+        except BaseException:
+            self._slots.release()
+            raise
+        self._busy.add(worker)
+        return worker
+
+    async def create_worker(self) -> Worker:
+        future = self._threads.submit(Worker, self.options, handle_job, WORKER_START_METHOD)
+        self._pending.add(future)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(kill_created_worker)
+            raise
+        finally:
+            self._pending.discard(future)
+
+    def release(self, worker: Worker, reusable: bool, waiter: Optional[Future] = None) -> None:
+        self._busy.discard(worker)
+        if reusable and not self._closed:
+            self._idle.append(worker)
+        elif waiter is not None and not waiter.done():
+            worker.process.terminate()
+            waiter.add_done_callback(lambda _: worker.kill())
+        else:
+            worker.kill()
+        self._slots.release()
+
+    async def receive(self, worker: Worker, deadline: Optional[float]):
+        if self._closed:
+            self.release(worker, False)
+            raise RuntimeError("读取池已关闭")
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        waiter = self._threads.submit(receive, worker.connection, remaining)
+        self._pending.add(waiter)
+        try:
+            return await asyncio.wrap_future(waiter)
+        except BaseException:
+            self.release(worker, False, waiter)
+            raise
+        finally:
+            self._pending.discard(waiter)
+
+    async def extract(
+        self,
+        file_path: str,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        **reader_options
+    ) -> dict:
+        started = time.monotonic()
+        deadline = self.deadline_for(timeout, deadline)
+        try:
+            worker = await self.acquire(deadline)
+        except asyncio.TimeoutError:
+            return failure(file_path, timeout_error(started, deadline), started, False)
+        worker.submit(file_path, {"stream": False, "reader_options": reader_options})
+        result = await self.receive(worker, deadline)
+        if result is _TIMED_OUT:
+            self.release(worker, False)
+            return failure(file_path, timeout_error(started, deadline), started, False)
+        if result is _CRASHED:
+            self.release(worker, False)
+            return failure(file_path, "读取进程异常退出", started, False)
+        self.release(worker, True)
+        return result
+
+    async def iter_units(
+        self,
+        file_path: str,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        **reader_options
+    ) -> AsyncIterator[dict]:
+        started = time.monotonic()
+        deadline = self.deadline_for(timeout, deadline)
+        try:
+            worker = await self.acquire(deadline)
+        except asyncio.TimeoutError:
+            yield failure(file_path, timeout_error(started, deadline), started, True)
+            return
+        worker.submit(file_path, {"stream": True, "reader_options": reader_options})
+        while True:
+            record = await self.receive(worker, deadline)
+            if record is None:
+                self.release(worker, True)
+                return
+            if record is _TIMED_OUT:
+                self.release(worker, False)
+                yield failure(file_path, timeout_error(started, deadline), started, True)
+                return
+            if record is _CRASHED:
+                self.release(worker, False)
+                yield failure(file_path, "读取进程异常退出", started, True)
+                return
+            try:
+                yield record
+            except BaseException:
+                self.release(worker, False)
+                raise
+
+    async def extract_many(
+        self,
+        files: Union[Iterable[str], AsyncIterable[str]],
+        timeout: Optional[float] = None,
+        **reader_options
+    ) -> AsyncIterator[dict]:
+        if hasattr(files, "__aiter__"):
+            pending_files = files.__aiter__()
+        else:
+            pending_files = None
+            file_iterator = iter(files)
+        running = set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(running) < self.max_pending:
+                    if pending_files is not None:
+                        try:
+                            file_path = await pending_files.__anext__()
+                        except StopAsyncIteration:
+                            exhausted = True
+                            break
+                    else:
+                        file_path = next(file_iterator, None)
+                        if file_path is None:
+                            exhausted = True
+                            break
+                    running.add(asyncio.ensure_future(self.extract(file_path, timeout, **reader_options)))
+                if not running:
+                    return
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        idle, self._idle = self._idle, []
+        busy = list(self._busy)
+        for worker in busy:
+            worker.process.terminate()
+        if self._pending:
+            await asyncio.wait([asyncio.wrap_future(future) for future in list(self._pending)])
+        loop = asyncio.get_running_loop()
+        for worker in idle:
+            await loop.run_in_executor(self._threads, worker.stop)
+        for worker in busy:
+            await loop.run_in_executor(self._threads, worker.process.join, 5)
+        self._threads.shutdown(wait=False)
@@ -0,0 +1,327 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+import unicodedata
+import zlib
+from array import array
+from collections import Counter
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Tuple
+from read_batch import READERS, collect_files, parse_bool, run_batch, stream_file
+
+INDEX_VERSION = "2:cjk-bigram-tail"
+CJK_RANGES = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+TOKEN = re.compile("[{0}]+|[^\\W_{0}]+".format(CJK_RANGES))
+CJK_CHARACTER = re.compile("[{0}]".format(CJK_RANGES))
+MAX_TOKEN_LENGTH = 64
+HASH_CHUNK_SIZE = 1024 * 1024
+COMMIT_EVERY = 200
+COMPRESS_MIN_BYTES = 96
+UNIT_PAGE = 0
+UNIT_PARAGRAPH = 1
+UNIT_TABLE_ROW = 2
+UNIT_SLIDE = 3
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    unit_count INTEGER NOT NULL,
+    token_count INTEGER NOT NULL,
+    units BLOB NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    file_id INTEGER NOT NULL,
+    unit_count INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (term, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_file ON postings (file_id);
+"""
+
+
+def default_index_path() -> str:
+    path = os.environ.get("DOC_READER_CORPUS_INDEX")
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "my-agent-skills", "corpus-index.sqlite3")
+
+
+def tokenize(text: str, run_tails: bool = True) -> List[str]:
+    tokens = []
+    for run in TOKEN.findall(unicodedata.normalize("NFKC", text).lower()):
+        if CJK_CHARACTER.match(run):
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+            if run_tails or len(run) == 1:
+                tokens.append(run[-1])
+        elif len(run) <= MAX_TOKEN_LENGTH:
+            tokens.append(run)
+    return tokens
+
+
+def file_digest(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as handle:
+        for block in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def encode_postings(values: array) -> bytes:
+    previous = 0
+    for offset in range(0, len(values), 3):
+        values[offset], previous = values[offset] - previous, values[offset]
+    data = values.tobytes()
+    if len(data) >= COMPRESS_MIN_BYTES:
+        return b"z" + zlib.compress(data)
+    return b"r" + data
+
+
+def decode_postings(data: bytes) -> Dict[int, Tuple[int, int]]:
+    values = array("I")
+    values.frombytes(zlib.decompress(data[1:]) if data[:1] == b"z" else data[1:])
+    return dict(zip(accumulate(values[0::3]), zip(values[1::3], values[2::3])))
+
+
+def open_index(index_path: str) -> sqlite3.Connection:
+    directory = os.path.dirname(os.path.abspath(index_path))
+    os.makedirs(directory, exist_ok=True)
+    connection = sqlite3.connect(index_path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    row = connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    if row is None or row[0] != INDEX_VERSION:
+        connection.executescript("DROP TABLE IF EXISTS postings; DROP TABLE IF EXISTS files;" + SCHEMA)
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (INDEX_VERSION,))
+        connection.commit()
+    return connection
+
+
+def iter_file_units(file_path: str) -> Iterator[Tuple[Tuple[int, int, int], str]]:
+    for record in stream_file(file_path, {"include_content": True}):
+        kind = record["type"]
+        if kind == "page":
+            yield (UNIT_PAGE, record["page_index"], 0), record["text"]
+        elif kind == "paragraph":
+            yield (UNIT_PARAGRAPH, record["paragraph_index"], 0), record["text"]
+        elif kind == "table":
+            for row_index, cells in enumerate(record["rows"], 1):
+                yield (UNIT_TABLE_ROW, record["table_index"], row_index), "\t".join(cells)
+        elif kind == "slide":
+            yield (UNIT_SLIDE, record["slide_index"], 0), record["text"]
+        elif kind == "statistics" and not record["success"]:
+            raise ValueError(record["error"])
+
+
+def index_file(file_path: str, options: dict) -> dict:
+    if os.path.splitext(file_path)[1].lower() not in READERS:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "error": "不支持的文件格式"
+        }
+    units = array("I")
+    postings = {}
+    token_count = 0
+    try:
+        digest = file_digest(file_path)
+        for location, text in iter_file_units(file_path):
+            counts = Counter(tokenize(text))
+            if not counts:
+                continue
+            unit_number = len(units) // 3
+            unit_length = sum(counts.values())
+            units.extend(location)
+            token_count += unit_length
+            for term, count in counts.items():
+                postings.setdefault(term, array("I")).extend((unit_number, count, unit_length))
+    except Exception as exc:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "error": str(exc)
+        }
+    return {
+        "success": True,
+        "file_path": file_path,
+        "sha256": digest,
+        "unit_count": len(units) // 3,
+        "token_count": token_count,
+        "units": units.tobytes(),
+        "postings": {term: (len(data) // 3, encode_postings(data)) for term, data in postings.items()},
+        "error": None
+    }
+
+
+def write_file_entry(connection: sqlite3.Connection, file_path: str, stat: os.stat_result, result: dict) -> None:
+    row = connection.execute("SELECT id FROM files WHERE path = ?", (file_path,)).fetchone()
+    values = (
+        stat.st_mtime_ns,
+        stat.st_size,
+        result.get("sha256", ""),
+        result.get("unit_count", 0),
+        result.get("token_count", 0),
+        result.get("units", b""),
+        None if result.get("success") else (result.get("error") or "读取失败")
+    )
+    if row is None:
+        file_id = connection.execute(
+            "INSERT INTO files (path, mtime_ns, size, sha256, unit_count, token_count, units, error) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (file_path,) + values
+        ).lastrowid
+    else:
+        file_id = row[0]
+        connection.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+        connection.execute(
+            "UPDATE files SET mtime_ns = ?, size = ?, sha256 = ?, unit_count = ?, token_count = ?, units = ?, error = ? "
+            "WHERE id = ?",
+            values + (file_id,)
+        )
+    if result.get("success"):
+        connection.executemany(
+            "INSERT INTO postings (term, file_id, unit_count, data) VALUES (?, ?, ?, ?)",
+            ((term, file_id, unit_count, data) for term, (unit_count, data) in result["postings"].items())
+        )
+
+
+def update_index(
+    index_path: str,
+    files: Iterator[str],
+    workers: int = 1,
+    timeout: Optional[float] = None,
+    prune: bool = True
+) -> Dict[str, object]:
+    started = time.perf_counter()
+    connection = open_index(index_path)
+    known = {
+        row[0]: row[1:]
+        for row in connection.execute("SELECT path, id, mtime_ns, size, sha256 FROM files")
+    }
+    seen = set()
+    stats = {}
+    counts = {
+        "unchanged": 0,
+        "touched": 0,
+        "removed": 0,
+        "missing": []
+    }
+
+    def changed_files() -> Iterator[str]:
+        for file_path in files:
+            file_path = os.path.abspath(file_path)
+            if file_path in seen:
+                continue
+            seen.add(file_path)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                counts["missing"].append({"file_path": file_path, "error": "文件不存在"})
+                continue
+            entry = known.get(file_path)
+            if entry is not None and (entry[1], entry[2]) == (stat.st_mtime_ns, stat.st_size):
+                counts["unchanged"] += 1
+                continue
+            if entry is not None and entry[3] and file_digest(file_path) == entry[3]:
+                connection.execute(
+                    "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                    (stat.st_mtime_ns, stat.st_size, entry[0])
+                )
+                counts["touched"] += 1
+                continue
+            stats[file_path] = stat
+            yield file_path
+
+    pending_writes = [0]
+
+    def emit(result: dict) -> None:
+        file_path = result["file_path"]
+        write_file_entry(connection, file_path, stats.pop(file_path), result)
+        pending_writes[0] += 1
+        if pending_writes[0] >= COMMIT_EVERY:
+            connection.commit()
+            pending_writes[0] = 0
+
+    try:
+        summary = run_batch(changed_files(), {}, workers, timeout, emit, handler=index_file)
+        if prune:
+            for file_path, entry in known.items():
+                if file_path not in seen and not os.path.exists(file_path):
+                    connection.execute("DELETE FROM postings WHERE file_id = ?", (entry[0],))
+                    connection.execute("DELETE FROM files WHERE id = ?", (entry[0],))
+                    counts["removed"] += 1
+        connection.commit()
+        file_count, unit_count = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(unit_count), 0) FROM files WHERE error IS NULL"
+        ).fetchone()
+    finally:
+        connection.close()
+
+    elapsed = time.perf_counter() - started
+    failures = counts["missing"] + summary["failures"]
+    return {
+        "index_path": index_path,
+        "total": len(seen),
+        "indexed": summary["succeeded"],
+        "unchanged": counts["unchanged"],
+        "touched": counts["touched"],
+        "removed": counts["removed"],
+        "failed": len(failures),
+        "timed_out": summary["timed_out"],
+        "failures": failures,
+        "file_count": file_count,
+        "unit_count": unit_count,
+        "index_bytes": sum(
+            os.path.getsize(index_path + suffix)
+            for suffix in ("", "-wal")
+            if os.path.exists(index_path + suffix)
+        ),
+        "elapsed_seconds": round(elapsed, 3),
+        "files_per_second": round(len(seen) / elapsed, 2) if elapsed > 0 else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("inputs", nargs="*")
+    parser.add_argument("--file-list", default=None)
+    parser.add_argument("--recursive", type=parse_bool, default=True)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--index-path", default=default_index_path())
+    parser.add_argument("--prune", type=parse_bool, default=True)
+
+    args = parser.parse_args()
+    if not args.inputs and not args.file_list:
+        parser.error("需要至少一个目录、通配符、文件路径或 --file-list")
+
+    summary = update_index(
+        args.index_path,
+        collect_files(args.inputs, args.file_list, args.recursive),
+        workers=args.workers,
+        timeout=args.timeout if args.timeout > 0 else None,
+        prune=args.prune
+    )
+    print(json.dumps({"summary": summary}, ensure_ascii=False, indent=2))
+
+    if summary["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
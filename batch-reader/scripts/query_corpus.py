@@ -0,0 +1,229 @@
+import argparse
+import heapq
+import json
+import math
+import os
+import sqlite3
+import sys
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+from index_corpus import (
+    CJK_CHARACTER,
+    INDEX_VERSION,
+    UNIT_PAGE,
+    UNIT_PARAGRAPH,
+    UNIT_SLIDE,
+    UNIT_TABLE_ROW,
+    decode_postings,
+    default_index_path,
+    tokenize
+)
+from read_batch import parse_bool
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+PATH_BATCH_SIZE = 500
+
+
+def unit_location(kind: int, first: int, second: int) -> dict:
+    if kind == UNIT_PAGE:
+        return {"page_index": first}
+    if kind == UNIT_PARAGRAPH:
+        return {"type": "paragraph", "paragraph_index": first}
+    if kind == UNIT_TABLE_ROW:
+        return {"type": "table", "table_index": first, "row_index": second}
+    if kind == UNIT_SLIDE:
+        return {"slide_index": first}
+    return {}
+
+
+def load_term_rows(connection: sqlite3.Connection, token: str) -> Tuple[int, Dict[int, List[bytes]]]:
+    if len(token) == 1 and CJK_CHARACTER.match(token):
+        rows = connection.execute(
+            "SELECT file_id, unit_count, data FROM postings WHERE term >= ? AND term < ?",
+            (token, token + "\uffff")
+        )
+    else:
+        rows = connection.execute("SELECT file_id, unit_count, data FROM postings WHERE term = ?", (token,))
+    frequency = 0
+    files = {}
+    for file_id, unit_count, data in rows:
+        frequency += unit_count
+        files.setdefault(file_id, []).append(data)
+    return frequency, files
+
+
+def decode_term_file(blobs: List[bytes]) -> Dict[int, Tuple[int, int]]:
+    postings = decode_postings(blobs[0])
+    for data in blobs[1:]:
+        for unit_number, (term_count, unit_length) in decode_postings(data).items():
+            previous = postings.get(unit_number)
+            postings[unit_number] = (term_count + (previous[0] if previous else 0), unit_length)
+    return postings
+
+
+def query_index(
+    index_path: str,
+    query: str,
+    limit: int = 20,
+    match_all: bool = True,
+    path_prefix: Optional[str] = None
+) -> dict:
+    started = time.perf_counter()
+    error = None
+    tokens = list(dict.fromkeys(tokenize(query, run_tails=False)))
+    if not os.path.isfile(index_path):
+        error = "索引不存在，请先运行 index_corpus.py"
+    elif not tokens:
+        error = "查询中没有可检索的词"
+    elif limit <= 0:
+        error = "limit 必须为正整数"
+    if error:
+        return {
+            "success": False,
+            "query": query,
+            "hits": [],
+            "statistics": {
+                "file_count": 0,
+                "unit_count": 0,
+                "hit_count": 0
+            },
+            "error": error
+        }
+
+    connection = sqlite3.connect(index_path)
+    try:
+        row = connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != INDEX_VERSION:
+            error = "索引版本不匹配，请重新运行 index_corpus.py"
+        else:
+            file_count, unit_count, token_count = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(unit_count), 0), COALESCE(SUM(token_count), 0) "
+                "FROM files WHERE error IS NULL"
+            ).fetchone()
+            term_rows = [load_term_rows(connection, token) for token in tokens]
+            file_ids = set(term_rows[0][1])
+            for _, files in term_rows[1:]:
+                if match_all:
+                    file_ids &= files.keys()
+                else:
+                    file_ids |= files.keys()
+            if path_prefix:
+                file_ids &= {
+                    file_id for file_id, in connection.execute(
+                        "SELECT id FROM files WHERE path >= ? AND path < ?",
+                        (path_prefix, path_prefix + "\uffff")
+                    )
+                }
+            average_length = token_count / unit_count if unit_count else 1.0
+            weights = [
+                math.log(1 + (unit_count - frequency + 0.5) / (frequency + 0.5))
+                for frequency, _ in term_rows
+            ]
+
+            scores = {}
+            matched_terms = {}
+            for file_id in file_ids:
+                decoded = [
+                    decode_term_file(files[file_id]) if file_id in files else {}
+                    for _, files in term_rows
+                ]
+                if match_all:
+                    unit_numbers = set(decoded[0]).intersection(*decoded[1:])
+                else:
+                    unit_numbers = set().union(*decoded)
+                for unit_number in unit_numbers:
+                    score = 0.0
+                    matched = 0
+                    for weight, postings in zip(weights, decoded):
+                        posting = postings.get(unit_number)
+                        if posting is None:
+                            continue
+                        term_count, unit_length = posting
+                        norm = BM25_K1 * (1 - BM25_B + BM25_B * unit_length / average_length)
+                        score += weight * term_count * (BM25_K1 + 1) / (term_count + norm)
+                        matched += 1
+                    scores[(file_id, unit_number)] = score
+                    matched_terms[(file_id, unit_number)] = matched
+
+            ranked = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0][0], -item[0][1]))
+            file_entries = {}
+            selected = sorted({key[0] for key, _ in ranked})
+            for start in range(0, len(selected), PATH_BATCH_SIZE):
+                chunk = selected[start:start + PATH_BATCH_SIZE]
+                for file_id, path, units in connection.execute(
+                    "SELECT id, path, units FROM files WHERE id IN ({0})".format(",".join("?" * len(chunk))),
+                    chunk
+                ):
+                    values = array("I")
+                    values.frombytes(units)
+                    file_entries[file_id] = (path, values)
+            hits = []
+            for (file_id, unit_number), score in ranked:
+                path, values = file_entries[file_id]
+                hit = {"file_path": path}
+                hit.update(unit_location(*values[unit_number * 3:unit_number * 3 + 3]))
+                hit["score"] = round(score, 4)
+                hit["matched_terms"] = matched_terms[(file_id, unit_number)]
+                hits.append(hit)
+    except sqlite3.DatabaseError as exc:
+        error = "索引无法读取: " + str(exc)
+    finally:
+        connection.close()
+    if error:
+        return {
+            "success": False,
+            "query": query,
+            "hits": [],
+            "statistics": {
+                "file_count": 0,
+                "unit_count": 0,
+                "hit_count": 0
+            },
+            "error": error
+        }
+
+    return {
+        "success": True,
+        "query": query,
+        "hits": hits,
+        "statistics": {
+            "file_count": file_count,
+            "unit_count": unit_count,
+            "terms": tokens,
+            "candidate_count": len(scores),
+            "hit_count": len(hits),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+        },
+        "error": None
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("query")
+    parser.add_argument("--index-path", default=default_index_path())
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--match-all", type=parse_bool, default=True)
+    parser.add_argument("--path-prefix", default=None)
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    result = query_index(
+        args.index_path,
+        args.query,
+        limit=args.limit,
+        match_all=args.match_all,
+        path_prefix=os.path.abspath(args.path_prefix) if args.path_prefix else None
+    )
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+    if not result["success"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+import argparse
+import glob
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from multiprocessing.connection import wait
+from typing import Callable, Dict, Iterator, List, Optional
+
+SKILLS_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+READERS = {
+    ".pdf": ("pdf-reader", "read_pdf", "extract_pdf"),
+    ".docx": ("docx-reader", "read_docx", "extract_docx"),
+    ".pptx": ("pptx-reader", "read_pptx", "extract_pptx"),
+    ".doc": ("doc-reader", "read_doc", "extract_doc")
+}
+
+STREAMERS = {
+    ".pdf": "stream_pdf",
+    ".docx": "stream_docx",
+    ".pptx": "stream_pptx",
+    ".doc": "stream_doc"
+}
+
+_modules = {}
+
+
+def parse_bool(value: str) -> bool:
+    value = value.lower()
+    if value in ("true", "1", "yes", "y"):
+        return True
+    if value in ("false", "0", "no", "n"):
+        return False
+    raise ValueError("include-content 仅支持 true/false")
+
+
+def load_reader_module(extension: str):
+    if extension not in _modules:
+        skill_name, module_name, _ = READERS[extension]
+        scripts_dir = os.path.join(SKILLS_DIR, skill_name, "scripts")
+        if scripts_dir not in sys.path:
+            sys.path.insert(0, scripts_dir)
+        _modules[extension] = importlib.import_module(module_name)
+    return _modules[extension]
+
+
+def load_extractor(extension: str):
+    return getattr(load_reader_module(extension), READERS[extension][2])
+
+
+def extract_file(file_path: str, options: dict) -> dict:
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in READERS:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "error": "不支持的文件格式"
+        }
+    try:
+        extractor = load_extractor(extension)
+    except Exception as exc:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "error": "无法加载读取器: " + str(exc)
+        }
+    kwargs = {
+        "include_content": options["include_content"],
+        "use_cache": options["use_cache"]
+    }
+    if extension != ".pdf":
+        kwargs["output_mode"] = options["output_mode"]
+    kwargs.update(options.get("reader_options") or {})
+    try:
+        return extractor(file_path, **kwargs)
+    except Exception as exc:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "error": str(exc)
+        }
+
+
+def stream_file(file_path: str, options: dict) -> Iterator[dict]:
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in STREAMERS:
+        yield {
+            "type": "statistics",
+            "success": False,
+            "file_path": file_path,
+            "error": "不支持的文件格式"
+        }
+        return
+    kwargs = {"include_content": options.get("include_content", True)}
+    kwargs.update(options.get("reader_options") or {})
+    try:
+        streamer = getattr(load_reader_module(extension), STREAMERS[extension])
+        yield from streamer(file_path, **kwargs)
+    except Exception as exc:
+        yield {
+            "type": "statistics",
+            "success": False,
+            "file_path": file_path,
+            "error": str(exc)
+        }
+
+
+def worker_main(connection, options: dict, handler: Callable[[str, dict], dict] = extract_file) -> None:
+    while True:
+        try:
+            job = connection.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        file_path, overrides = job
+        started = time.perf_counter()
+        result = handler(file_path, dict(options, **overrides))
+        if isinstance(result, dict):
+            result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            connection.send(result)
+            continue
+        for record in result:
+            if record.get("type") == "statistics":
+                record["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            connection.send(record)
+        connection.send(None)
+
+
+def collect_files(inputs: List[str], file_list: Optional[str], recursive: bool) -> Iterator[str]:
+    paths = list(inputs)
+    if file_list:
+        with open(file_list, "r", encoding="utf-8") as handle:
+            paths.extend(line.strip() for line in handle if line.strip())
+    seen = set()
+    for path in paths:
+        if os.path.isdir(path):
+            candidates = []
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower() in READERS:
+                        candidates.append(os.path.join(root, name))
+                if not recursive:
+                    break
+        elif glob.has_magic(path):
+            candidates = sorted(glob.glob(path, recursive=True))
+            candidates = [p for p in candidates if os.path.isfile(p)]
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            if candidate not in seen:
+                seen.add(candidate)
+                yield candidate
+
+
+class Worker:
+    def __init__(
+        self,
+        options: dict,
+        handler: Callable[[str, dict], dict] = extract_file,
+        start_method: Optional[str] = None
+    ):
+        context = multiprocessing.get_context(start_method)
+        parent_connection, child_connection = context.Pipe()
+        self.connection = parent_connection
+        self.process = context.Process(
+            target=worker_main, args=(child_connection, options, handler), daemon=True
+        )
+        self.process.start()
+        child_connection.close()
+        self.file_path = None
+        self.started = 0.0
+
+    def submit(self, file_path: str, overrides: Optional[dict] = None) -> None:
+        self.file_path = file_path
+        self.started = time.perf_counter()
+        self.connection.send((file_path, overrides or {}))
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.connection.close()
+
+    def kill(self) -> None:
+        self.process.terminate()
+        self.process.join(timeout=5)
+        self.connection.close()
+
+
+def run_batch(
+    files: Iterator[str],
+    options: dict,
+    workers: int,
+    timeout: Optional[float],
+    emit,
+    handler: Callable[[str, dict], dict] = extract_file
+) -> Dict[str, object]:
+    started = time.perf_counter()
+    summary = {
+        "total": 0,
+        "succeeded": 0,
+        "failed": 0,
+        "timed_out": 0,
+        "failures": []
+    }
+
+    def record(result: dict) -> None:
+        summary["total"] += 1
+        if result.get("success"):
+            summary["succeeded"] += 1
+        else:
+            summary["failed"] += 1
+            summary["failures"].append({
+                "file_path": result.get("file_path"),
+                "error": result.get("error")
+            })
+        emit(result)
+
+    pool = [Worker(options, handler) for _ in range(max(1, workers))]
+    idle = list(pool)
+    busy = {}
+    pending = iter(files)
+    exhausted = False
+    try:
+        while True:
+            while idle and not exhausted:
+                file_path = next(pending, None)
+                if file_path is None:
+                    exhausted = True
+                    break
+                worker = idle.pop()
+                worker.submit(file_path)
+                busy[worker.connection] = worker
+            if not busy:
+                break
+
+            wait_timeout = None
+            if timeout is not None:
+                now = time.perf_counter()
+                nearest = min(worker.started for worker in busy.values()) + timeout
+                wait_timeout = max(0.0, nearest - now)
+            for connection in wait(list(busy), timeout=wait_timeout):
+                worker = busy.pop(connection)
+                try:
+                    result = connection.recv()
+                except EOFError:
+                    result = {
+                        "success": False,
+                        "file_path": worker.file_path,
+                        "error": "读取进程异常退出"
+                    }
+                    worker.kill()
+                    worker = Worker(options, handler)
+                record(result)
+                idle.append(worker)
+
+            if timeout is not None:
+                now = time.perf_counter()
+                for connection, worker in list(busy.items()):
+                    if now - worker.started < timeout:
+                        continue
+                    del busy[connection]
+                    worker.kill()
+                    summary["timed_out"] += 1
+                    record({
+                        "success": False,
+                        "file_path": worker.file_path,
+                        "error": "读取超时（{0}秒）".format(timeout),
+                        "elapsed_ms": round((now - worker.started) * 1000, 2)
+                    })
+                    idle.append(Worker(options, handler))
+    finally:
+        for worker in idle:
+            worker.stop()
+        for worker in busy.values():
+            worker.kill()
+
+    elapsed = time.perf_counter() - started
+    summary["elapsed_seconds"] = round(elapsed, 3)
+    summary["files_per_second"] = round(summary["total"] / elapsed, 2) if elapsed > 0 else 0.0
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("inputs", nargs="*")
+    parser.add_argument("--file-list", default=None)
+    parser.add_argument("--recursive", type=parse_bool, default=True)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--include-content", type=parse_bool, default=True)
+    parser.add_argument("--output-mode", choices=["full", "list"], default="full")
+    parser.add_argument("--cache", type=parse_bool, default=True)
+
+    args = parser.parse_args()
+    if not args.inputs and not args.file_list:
+        parser.error("需要至少一个目录、通配符、文件路径或 --file-list")
+
+    options = {
+        "include_content": args.include_content,
+        "output_mode": args.output_mode,
+        "use_cache": args.cache
+    }
+
+    def emit(result: dict) -> None:
+        sys.stdout.write(json.dumps(result, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+    summary = run_batch(
+        collect_files(args.inputs, args.file_list, args.recursive),
+        options,
+        workers=args.workers,
+        timeout=args.timeout if args.timeout > 0 else None,
+        emit=emit
+    )
+    sys.stderr.write(json.dumps({"summary": summary}, ensure_ascii=False, indent=2) + "\n")
+
+    if summary["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
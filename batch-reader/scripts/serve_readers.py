@@ -0,0 +1,281 @@
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import secrets
+import sys
+import tempfile
+from multiprocessing.connection import Client, Listener
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from read_batch import load_reader_module
+
+READER_EXTENSIONS = {
+    "pdf": ".pdf",
+    "docx": ".docx",
+    "pptx": ".pptx",
+    "doc": ".doc"
+}
+
+FORWARDED_ENV_PREFIX = "DOC_READER_"
+FORWARDED_ENV = ["XDG_CACHE_HOME"]
+
+READER_DEPENDENCIES = {
+    "pdf": ["PyPDF2"],
+    "docx": ["docx"],
+    "pptx": [],
+    "doc": ["word_binary"]
+}
+
+
+def daemon_info_path() -> str:
+    path = os.environ.get("DOC_READER_DAEMON_FILE")
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "my-agent-skills", "reader-daemon.json")
+
+
+def default_address() -> Tuple[str, str]:
+    if sys.platform == "win32":
+        return r"\\.\pipe\my-agent-skills-reader-{0}".format(os.getpid()), "AF_PIPE"
+    directory = os.path.dirname(daemon_info_path())
+    return os.path.join(directory, "reader-daemon.sock"), "AF_UNIX"
+
+
+def is_forwarded(name: str) -> bool:
+    return name.startswith(FORWARDED_ENV_PREFIX) or name in FORWARDED_ENV
+
+
+@contextlib.contextmanager
+def request_environment(env: Optional[Dict[str, str]]) -> Iterator[None]:
+    if env is None:
+        yield
+        return
+    saved = {name: value for name, value in os.environ.items() if is_forwarded(name)}
+    try:
+        for name in saved:
+            os.environ.pop(name, None)
+        os.environ.update({name: str(value) for name, value in env.items() if is_forwarded(name)})
+        yield
+    finally:
+        for name in [name for name in os.environ if is_forwarded(name)]:
+            os.environ.pop(name, None)
+        os.environ.update(saved)
+
+
+class MessageWriter(io.TextIOBase):
+    def __init__(self, send: Callable[[dict], None], key: str):
+        self.send = send
+        self.key = key
+        self.parts = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self.parts.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if self.parts:
+            self.send({self.key: "".join(self.parts)})
+            self.parts = []
+
+
+def collect_records(module, records: Iterable[dict], output_format: str) -> list:
+    return list(records)
+
+
+def run_reader(
+    reader: str,
+    argv: List[str],
+    cwd: Optional[str] = None,
+    consume: Callable[[object, Iterable[dict], str], Union[dict, list]] = collect_records,
+    write: Optional[Callable[[object, dict, str], None]] = None
+) -> Tuple[Union[dict, list, None], str, int, str]:
+    if reader not in READER_EXTENSIONS:
+        return None, "不支持的读取器: {0}\n".format(reader), 2, "pretty"
+    stderr = io.StringIO()
+    previous_cwd = os.getcwd()
+    try:
+        if cwd:
+            os.chdir(cwd)
+        module = load_reader_module(READER_EXTENSIONS[reader])
+        with contextlib.redirect_stderr(stderr):
+            try:
+                parser = module.build_parser()
+                parser.prog = "read_{0}.py".format(reader)
+                args = parser.parse_args(argv)
+            except SystemExit as exc:
+                return None, stderr.getvalue(), exc.code if isinstance(exc.code, int) else 2, "pretty"
+            output_format = getattr(args, "output_format", "pretty")
+            if getattr(args, "stream", False):
+                records = consume(module, module.stream_cli(args), output_format)
+                last = (records[-1] if records else {}) if isinstance(records, list) else records
+                return records, stderr.getvalue(), 0 if last.get("success", True) else 1, output_format
+            result = module.run_cli(
+                args, (lambda result: write(module, result, output_format)) if write is not None else None
+            )
+    except Exception as exc:
+        return None, stderr.getvalue() + str(exc) + "\n", 1, "pretty"
+    finally:
+        os.chdir(previous_cwd)
+    return result, stderr.getvalue(), 0 if result["success"] else 1, output_format
+
+
+def handle_request(request: dict, send: Callable[[dict], None]) -> None:
+    with request_environment(request.get("env")):
+        handle_reader_request(request, send)
+
+
+def handle_reader_request(request: dict, send: Callable[[dict], None]) -> None:
+    reader = request.get("reader", "")
+
+    def stream_records(module, records: Iterable[dict], output_format: str) -> dict:
+        stdout = MessageWriter(send, "stdout")
+        errors = MessageWriter(send, "stderr")
+        try:
+            return module.write_records(records, output_format, stdout, errors)
+        finally:
+            errors.flush()
+            stdout.flush()
+
+    stdout = io.StringIO()
+    errors = io.StringIO()
+
+    def write_output(module, result: dict, output_format: str) -> None:
+        module.write_result(result, output_format, stdout, errors)
+
+    _, stderr, exit_code, _ = run_reader(
+        reader, request.get("argv", []), request.get("cwd"), stream_records, write_output
+    )
+    send({
+        "stdout": stdout.getvalue(),
+        "stderr": stderr + errors.getvalue(),
+        "exit_code": exit_code
+    })
+
+
+def serve_socket() -> None:
+    info_path = daemon_info_path()
+    os.makedirs(os.path.dirname(info_path), exist_ok=True)
+    address, family = default_address()
+    if family == "AF_UNIX" and os.path.exists(address):
+        os.remove(address)
+    authkey = secrets.token_bytes(32)
+    listener = Listener(address, family=family, authkey=authkey)
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(info_path), suffix=".tmp")
+    with os.fdopen(handle, "w", encoding="utf-8") as stream:
+        json.dump({
+            "address": address,
+            "family": family,
+            "authkey": authkey.hex(),
+            "pid": os.getpid()
+        }, stream)
+    os.replace(temp_path, info_path)
+    sys.stderr.write("reader daemon listening on {0}\n".format(address))
+
+    try:
+        while True:
+            try:
+                connection = listener.accept()
+            except Exception:
+                continue
+            with connection:
+                try:
+                    request = connection.recv()
+                except (EOFError, OSError):
+                    continue
+                if request.get("command") == "shutdown":
+                    connection.send({"stdout": "", "stderr": "", "exit_code": 0})
+                    break
+                with contextlib.suppress(OSError):
+                    handle_request(request, connection.send)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        with contextlib.suppress(OSError):
+            with open(info_path, "r", encoding="utf-8") as stream:
+                owner = json.load(stream).get("pid")
+            if owner == os.getpid():
+                os.remove(info_path)
+
+
+def serve_stdio() -> None:
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response = {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32700, "message": "Parse error"}
+            }
+        else:
+            params = request.get("params") or {}
+            with request_environment(params.get("env")):
+                result, stderr, exit_code, _ = run_reader(
+                    request.get("method", ""), params.get("argv", []), params.get("cwd")
+                )
+            if result is None:
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": request.get("id"),
+                    "error": {"code": -32602, "message": stderr.strip()}
+                }
+            else:
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": request.get("id"),
+                    "result": result,
+                    "exit_code": exit_code
+                }
+        sys.stdout.write(json.dumps(response, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+
+def stop_daemon() -> bool:
+    try:
+        with open(daemon_info_path(), "r", encoding="utf-8") as handle:
+            info = json.load(handle)
+        connection = Client(info["address"], family=info["family"], authkey=bytes.fromhex(info["authkey"]))
+    except Exception:
+        return False
+    with connection:
+        connection.send({"command": "shutdown"})
+        connection.recv()
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stdio", action="store_true")
+    parser.add_argument("--stop", action="store_true")
+    parser.add_argument("--preload", default="pdf,docx,pptx,doc")
+
+    args = parser.parse_args()
+    if args.stop:
+        if not stop_daemon():
+            sys.stderr.write("未找到运行中的读取服务\n")
+            sys.exit(1)
+        return
+
+    for reader in [name for name in args.preload.split(",") if name in READER_EXTENSIONS]:
+        with contextlib.suppress(Exception):
+            load_reader_module(READER_EXTENSIONS[reader])
+            for dependency in READER_DEPENDENCIES[reader]:
+                importlib.import_module(dependency)
+    if args.stdio:
+        serve_stdio()
+    else:
+        serve_socket()
+
+
+if __name__ == "__main__":
+    main()
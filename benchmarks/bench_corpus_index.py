@@ -0,0 +1,119 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+sys.path.insert(0, os.path.join(ROOT, "batch-reader", "scripts"))
+
+from synth import make_pdf  # noqa: E402
+
+WORDS = [
+    "项目", "验收", "标准", "系统", "性能", "测试", "报告", "数据", "迁移", "方案", "回滚", "策略",
+    "检索", "服务", "接口", "文档", "需求", "设计", "部署", "监控", "告警", "容量", "规划", "合同",
+    "budget", "release", "schedule", "milestone", "risk", "owner"
+]
+QUERIES = ["验收标准", "数据迁移方案", "性能测试报告", "release schedule", "监控告警", "合同"]
+SINGLE_CHARACTER_CHECKS = [("告", "报告"), ("准", "标准"), ("同", "合同"), ("验", "验收")]
+
+
+def make_cjk_docx(file_path: str, rng: random.Random, paragraph_count: int) -> None:
+    import docx
+
+    document = docx.Document()
+    for _ in range(paragraph_count):
+        document.add_paragraph("".join(rng.choice(WORDS) for _ in range(rng.randint(8, 30))) + "。")
+    table = document.add_table(rows=4, cols=3)
+    for row in table.rows:
+        for cell in row.cells:
+            cell.text = rng.choice(WORDS) + rng.choice(WORDS)
+    document.save(file_path)
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docx-files", type=int, default=200)
+    parser.add_argument("--pdf-files", type=int, default=20)
+    parser.add_argument("--paragraphs", type=int, default=100)
+    parser.add_argument("--pdf-pages", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    from index_corpus import collect_files, update_index
+    from query_corpus import query_index
+
+    rng = random.Random(17)
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.environ["DOC_READER_CACHE_DIR"] = os.path.join(work_dir, "cache")
+        corpus_dir = os.path.join(work_dir, "corpus")
+        os.makedirs(corpus_dir)
+        for index in range(args.docx_files):
+            make_cjk_docx(os.path.join(corpus_dir, "doc{0:05d}.docx".format(index)), rng, args.paragraphs)
+        for index in range(args.pdf_files):
+            make_pdf(os.path.join(corpus_dir, "doc{0:05d}.pdf".format(index)), args.pdf_pages)
+        index_path = os.path.join(work_dir, "corpus.sqlite3")
+
+        def update() -> dict:
+            return update_index(index_path, collect_files([corpus_dir], None, True), workers=args.workers)
+
+        build = update()
+        unchanged = update()
+        touched_path = os.path.join(corpus_dir, "doc00000.docx")
+        os.utime(touched_path, None)
+        touched = update()
+        make_cjk_docx(os.path.join(corpus_dir, "doc00001.docx"), rng, args.paragraphs)
+        modified = update()
+
+        queries = []
+        for query in QUERIES:
+            samples = []
+            for _ in range(args.repeat):
+                result = query_index(index_path, query)
+                samples.append(result["statistics"]["elapsed_ms"])
+            queries.append({
+                "query": query,
+                "candidate_count": result["statistics"]["candidate_count"],
+                "p50_ms": round(percentile(samples, 0.5), 2),
+                "p99_ms": round(percentile(samples, 0.99), 2),
+                "mean_ms": round(statistics.mean(samples), 2)
+            })
+
+        checks = []
+        for character, word in SINGLE_CHARACTER_CHECKS:
+            character_units = query_index(index_path, character)["statistics"]["candidate_count"]
+            word_units = query_index(index_path, word)["statistics"]["candidate_count"]
+            checks.append({
+                "query": character,
+                "contained_in": word,
+                "candidate_count": character_units,
+                "word_candidate_count": word_units,
+                "ok": character_units >= word_units > 0
+            })
+
+    print(json.dumps({
+        "files": build["total"],
+        "units": build["unit_count"],
+        "index_bytes": build["index_bytes"],
+        "build_seconds": build["elapsed_seconds"],
+        "unchanged_update_seconds": unchanged["elapsed_seconds"],
+        "touched_update_seconds": touched["elapsed_seconds"],
+        "touched_counts": {"touched": touched["touched"], "indexed": touched["indexed"]},
+        "modified_update_seconds": modified["elapsed_seconds"],
+        "modified_counts": {"indexed": modified["indexed"], "unchanged": modified["unchanged"]},
+        "queries": queries,
+        "single_character_checks": checks
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from synth import make_pdf  # noqa: E402
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def run_cli(command: list, env: dict, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run(command, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        samples.append(time.perf_counter() - started)
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.decode("utf-8", "replace"))
+    return samples
+
+
+def summarize(samples: list) -> dict:
+    return {
+        "p50_ms": round(percentile(samples, 0.5) * 1000, 2),
+        "p99_ms": round(percentile(samples, 0.99) * 1000, 2),
+        "mean_ms": round(statistics.mean(samples) * 1000, 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        file_path = make_pdf(os.path.join(work_dir, "small.pdf"), args.pages)
+        env = dict(os.environ)
+        env["DOC_READER_DAEMON_FILE"] = os.path.join(work_dir, "daemon.json")
+        env["DOC_READER_NO_CACHE"] = "1"
+        command = [sys.executable, os.path.join(ROOT, "pdf-reader", "scripts", "read_pdf.py"), file_path]
+
+        cold_env = dict(env)
+        cold_env["DOC_READER_DAEMON"] = "0"
+        cold = run_cli(command, cold_env, args.repeat)
+
+        daemon = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "batch-reader", "scripts", "serve_readers.py")],
+            env=env,
+            stderr=subprocess.PIPE
+        )
+        try:
+            daemon.stderr.readline()
+            warm = run_cli(command, env, args.repeat)
+        finally:
+            subprocess.run(
+                [sys.executable, os.path.join(ROOT, "batch-reader", "scripts", "serve_readers.py"), "--stop"],
+                env=env
+            )
+            daemon.wait(timeout=10)
+
+    print(json.dumps({
+        "file_pages": args.pages,
+        "repeat": args.repeat,
+        "cold_cli": summarize(cold),
+        "warm_daemon": summarize(warm)
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+sys.path.insert(0, os.path.join(ROOT, "doc-reader", "scripts"))
+
+from synth import make_doc  # noqa: E402
+from read_doc import extract_doc  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--paragraphs", type=int, default=40)
+    parser.add_argument("--tables", type=int, default=2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        paths = [
+            make_doc(os.path.join(work_dir, "doc_{0}.doc".format(index)), args.paragraphs, args.tables)
+            for index in range(args.files)
+        ]
+        started = time.perf_counter()
+        failures = 0
+        for path in paths:
+            if not extract_doc(path, use_cache=False)["success"]:
+                failures += 1
+        elapsed = time.perf_counter() - started
+
+    print(json.dumps({
+        "files": args.files,
+        "paragraphs_per_file": args.paragraphs,
+        "tables_per_file": args.tables,
+        "failures": failures,
+        "elapsed_seconds": round(elapsed, 3),
+        "files_per_second": round(args.files / elapsed, 1)
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
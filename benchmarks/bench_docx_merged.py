@@ -0,0 +1,116 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+sys.path.insert(0, os.path.join(ROOT, "docx-reader", "scripts"))
+
+from read_docx import extract_docx, read_docx_document_units  # noqa: E402
+from synth import make_table_docx  # noqa: E402
+
+
+def best_of(repeat: int, run):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best, 3), result
+
+
+def row_cells_tables(file_path: str) -> dict:
+    from docx import Document
+
+    document = Document(file_path)
+    cell_reads = 0
+    physical_cells = 0
+    tables = []
+    for table in document.tables:
+        rows = []
+        for row in table.rows:
+            cells = [cell.text.strip() for cell in row.cells]
+            cell_reads += len(cells)
+            rows.append("\t".join(cells))
+        physical_cells += sum(len(tr.tc_lst) for tr in table._tbl.tr_lst)
+        tables.append("\n".join(rows))
+    return {"cell_reads": cell_reads, "physical_cells": physical_cells, "char_count": len("\n\n".join(tables))}
+
+
+def grid_tables(file_path: str) -> dict:
+    model = read_docx_document_units(file_path)
+    return {"char_count": len(model.content((0, 0), (0, model.table_count)))}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--python-docx-rows", type=int, default=3000)
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    worker_counts = [int(count) for count in args.workers.split(",") if count]
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for script in ("latin", "cjk"):
+            small_path = make_table_docx(
+                os.path.join(work_dir, "small-{0}.docx".format(script)),
+                [args.python_docx_rows, 20], args.columns, script=script, merged=True
+            )
+            legacy_seconds, legacy = best_of(args.repeat, lambda: row_cells_tables(small_path))
+            grid_seconds, grid = best_of(args.repeat, lambda: grid_tables(small_path))
+            python_docx = {
+                "rows": args.python_docx_rows + 20,
+                "row_cells_seconds": legacy_seconds,
+                "grid_seconds": grid_seconds,
+                "cell_reads": legacy["cell_reads"],
+                "physical_cells": legacy["physical_cells"],
+                "row_cells_char_count": legacy["char_count"],
+                "grid_char_count": grid["char_count"]
+            }
+
+            file_path = make_table_docx(
+                os.path.join(work_dir, "merged-{0}.docx".format(script)),
+                [args.rows, 20, args.rows], args.columns, script=script, merged=True
+            )
+            baseline_content = None
+            baseline_seconds = None
+            streaming = []
+            for workers in worker_counts:
+                seconds, result = best_of(args.repeat, lambda: extract_docx(
+                    file_path, use_cache=False, use_index=False, workers=workers
+                ))
+                if baseline_content is None:
+                    baseline_content = result["content"]
+                    baseline_seconds = seconds
+                streaming.append({
+                    "workers": workers,
+                    "seconds": seconds,
+                    "speedup": round(baseline_seconds / seconds, 2),
+                    "identical": result["content"] == baseline_content
+                })
+            results.append({
+                "script": script,
+                "python_docx": python_docx,
+                "streaming": {
+                    "rows": args.rows * 2 + 20,
+                    "char_count": len(baseline_content),
+                    "results": streaming
+                }
+            })
+
+    print(json.dumps({
+        "columns": args.columns,
+        "cpu_count": os.cpu_count(),
+        "results": results
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+sys.path.insert(0, os.path.join(ROOT, "docx-reader", "scripts"))
+
+from read_docx import read_docx_document_units, read_docx_units  # noqa: E402
+from synth import make_docx  # noqa: E402
+
+
+def measure(reader, file_path: str) -> tuple:
+    started = time.perf_counter()
+    units = reader(file_path)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    reader(file_path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return units, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--paragraphs", default="500,5000")
+    parser.add_argument("--tables", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=30)
+    parser.add_argument("--columns", type=int, default=8)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for paragraph_count in [int(count) for count in args.paragraphs.split(",") if count]:
+            file_path = make_docx(
+                os.path.join(work_dir, "doc_{0}.docx".format(paragraph_count)),
+                paragraph_count, args.tables, args.rows, args.columns
+            )
+            baseline, baseline_seconds, baseline_peak = measure(read_docx_document_units, file_path)
+            units, seconds, peak = measure(read_docx_units, file_path)
+            rows.append({
+                "paragraphs": paragraph_count,
+                "file_bytes": os.path.getsize(file_path),
+                "identical": units == baseline,
+                "python_docx_seconds": round(baseline_seconds, 3),
+                "iterparse_seconds": round(seconds, 3),
+                "speedup": round(baseline_seconds / seconds, 1) if seconds else None,
+                "python_docx_peak_mb": round(baseline_peak / 1048576, 1),
+                "iterparse_peak_mb": round(peak / 1048576, 1)
+            })
+
+    print(json.dumps({
+        "tables": args.tables,
+        "rows": args.rows,
+        "columns": args.columns,
+        "results": rows
+    }, ensure_ascii=False, indent=2))
+    if not all(row["identical"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+
+def load_reader(kind: str):
+    scripts = os.path.join(ROOT, "{0}-reader".format(kind), "scripts")
+    sys.path.insert(0, scripts)
+    for name in ("daemon_client", "extract_cache", "ooxml_package", "read_" + kind):
+        sys.modules.pop(name, None)
+    module = __import__("read_" + kind)
+    sys.path.remove(scripts)
+    return getattr(module, "extract_" + kind)
+
+
+def measure(extract, file_path: str, kwargs: dict, use_index: bool, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = extract(file_path, use_cache=False, use_index=use_index, **kwargs)
+        samples.append(time.perf_counter() - started)
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pdf-pages", type=int, default=2000)
+    parser.add_argument("--pdf-updates", type=int, default=20)
+    parser.add_argument("--docx-paragraphs", type=int, default=20000)
+    parser.add_argument("--docx-rows", type=int, default=20000)
+    parser.add_argument("--pptx-slides", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.environ["DOC_READER_CACHE_DIR"] = os.path.join(work_dir, "cache")
+        from synth import make_docx, make_pdf, make_pptx, make_table_docx
+
+        cases = [
+            ("pdf", make_pdf(os.path.join(work_dir, "index.pdf"), args.pdf_pages, updates=args.pdf_updates), [
+                dict(page_start=args.pdf_pages - 4, page_end=args.pdf_pages)
+            ]),
+            ("docx", make_docx(os.path.join(work_dir, "index.docx"), args.docx_paragraphs, table_count=20), [
+                dict(paragraph_start=args.docx_paragraphs - 50, paragraph_end=args.docx_paragraphs - 1, table_start=1, table_end=1),
+                dict(paragraph_start=1, paragraph_end=1, table_start=20, table_end=20)
+            ]),
+            ("docx", make_table_docx(os.path.join(work_dir, "rows.docx"), [20, args.docx_rows, 20]), [
+                dict(table_start=2, table_end=2, table_row_start=args.docx_rows - 99, table_row_end=args.docx_rows)
+            ]),
+            ("pptx", make_pptx(os.path.join(work_dir, "index.pptx"), args.pptx_slides), [
+                dict(slide_start=args.pptx_slides - 2, slide_end=args.pptx_slides)
+            ])
+        ]
+        for kind, file_path, ranges in cases:
+            extract = load_reader(kind)
+            started = time.perf_counter()
+            extract(file_path, use_cache=False, use_index=True)
+            build_ms = round((time.perf_counter() - started) * 1000, 2)
+            for kwargs in ranges:
+                expected = extract(file_path, use_cache=False, use_index=False, **kwargs)
+                if extract(file_path, use_cache=False, use_index=True, **kwargs) != expected:
+                    raise RuntimeError("indexed read differs for {0} {1}".format(kind, kwargs))
+                rows.append({
+                    "reader": kind,
+                    "file": os.path.basename(file_path),
+                    "range": kwargs,
+                    "first_read_with_index_build_ms": build_ms,
+                    "no_index_ms": measure(extract, file_path, kwargs, False, args.repeat),
+                    "indexed_ms": measure(extract, file_path, kwargs, True, args.repeat)
+                })
+    print(json.dumps(rows, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+sys.path.insert(0, os.path.join(ROOT, "pptx-reader", "scripts"))
+
+from ooxml_package import MappedFile  # noqa: E402
+from synth import make_docx, make_pptx  # noqa: E402
+
+
+def library_bytes_read(kind: str, file_path: str) -> int:
+    mapped = MappedFile(file_path)
+    try:
+        if kind == "docx":
+            from docx import Document
+            Document(mapped)
+        else:
+            from pptx import Presentation
+            Presentation(mapped)
+        return mapped.bytes_read
+    finally:
+        mapped.close()
+
+
+def reader_bytes_read(kind: str, file_path: str, extra_args: list) -> int:
+    env = dict(os.environ)
+    env["DOC_READER_IO_STATS"] = "1"
+    env["DOC_READER_DAEMON"] = "0"
+    env["DOC_READER_NO_CACHE"] = "1"
+    script = os.path.join(ROOT, "{0}-reader".format(kind), "scripts", "read_{0}.py".format(kind))
+    completed = subprocess.run(
+        [sys.executable, script, file_path] + extra_args,
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True
+    )
+    total = 0
+    for line in completed.stderr.decode("utf-8").splitlines():
+        if line.startswith('{"io"'):
+            total += json.loads(line)["io"]["bytes_read"]
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--slides", type=int, default=200)
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--media-bytes", type=int, default=300000)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        pptx_path = make_pptx(os.path.join(work_dir, "deck.pptx"), args.slides, media_bytes=args.media_bytes)
+        docx_path = make_docx(
+            os.path.join(work_dir, "report.docx"), args.paragraphs, table_count=20, media_bytes=args.media_bytes
+        )
+        cases = [
+            ("pptx", pptx_path, [], "all slides"),
+            ("pptx", pptx_path, ["--slide-start", "10", "--slide-end", "12"], "slides 10-12"),
+            ("docx", docx_path, [], "full document")
+        ]
+        for kind, file_path, extra_args, label in cases:
+            file_size = os.path.getsize(file_path)
+            library = library_bytes_read(kind, file_path)
+            reader = reader_bytes_read(kind, file_path, extra_args)
+            rows.append({
+                "file": kind,
+                "case": label,
+                "file_bytes": file_size,
+                "library_bytes_read": library,
+                "reader_bytes_read": reader,
+                "reader_fraction": round(reader / file_size, 4)
+            })
+
+    print(json.dumps(rows, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
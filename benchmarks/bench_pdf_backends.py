@@ -0,0 +1,101 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from bisect import bisect_left
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "pdf-reader", "scripts"))
+
+from pdf_backends import installed_backends  # noqa: E402
+from read_pdf import stream_pdf  # noqa: E402
+from synth import SCRIPTS, column_lines, make_pdf, page_lines  # noqa: E402
+
+
+def ordered_count(positions: list) -> int:
+    tails = []
+    for position in positions:
+        index = bisect_left(tails, position)
+        if index == len(tails):
+            tails.append(position)
+        else:
+            tails[index] = position
+    return len(tails)
+
+
+def score_page(text: str, expected: list) -> tuple:
+    positions = [text.find(line) for line in expected]
+    found = [position for position in positions if position >= 0]
+    return len(found), ordered_count(found)
+
+
+def run_backend(file_path: str, backend: str, expected_pages: list) -> tuple:
+    started = time.perf_counter()
+    pages = []
+    statistics = {}
+    for record in stream_pdf(file_path, use_index=False, backend=backend):
+        if record["type"] == "page":
+            pages.append(record["text"])
+        else:
+            statistics = record
+    elapsed = time.perf_counter() - started
+    found = 0
+    ordered = 0
+    for text, expected in zip(pages, expected_pages):
+        page_found, page_ordered = score_page(text, expected)
+        found += page_found
+        ordered += page_ordered
+    return elapsed, pages, statistics, found, ordered
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--lines", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backends", default=None)
+    args = parser.parse_args()
+
+    backends = args.backends.split(",") if args.backends else installed_backends() + ["auto"]
+    rows = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for script in SCRIPTS:
+            for columns in (1, 2):
+                file_path = make_pdf(
+                    os.path.join(work_dir, "{0}_{1}col.pdf".format(script, columns)),
+                    args.pages, args.lines, script=script, columns=columns
+                )
+                lines = column_lines if columns > 1 else page_lines
+                expected_pages = [lines(page + 1, args.lines, script) for page in range(args.pages)]
+                expected_lines = args.pages * args.lines
+                for backend in backends:
+                    best = None
+                    for _ in range(args.repeat):
+                        elapsed, pages, statistics, found, ordered = run_backend(file_path, backend, expected_pages)
+                        best = elapsed if best is None else min(best, elapsed)
+                    char_count = sum(len(text) for text in pages)
+                    rows.append({
+                        "script": script,
+                        "columns": columns,
+                        "backend": backend,
+                        "selected_backend": statistics.get("statistics", {}).get("backend"),
+                        "success": statistics.get("success"),
+                        "seconds": round(best, 3),
+                        "pages_per_second": round(args.pages / best, 1) if best else None,
+                        "chars_per_second": round(char_count / best) if best else None,
+                        "line_recall": round(found / expected_lines, 4),
+                        "reading_order": round(ordered / expected_lines, 4)
+                    })
+
+    print(json.dumps({
+        "pages": args.pages,
+        "lines_per_page": args.lines,
+        "installed_backends": installed_backends(),
+        "results": rows
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "pdf-reader", "scripts"))
+
+from read_pdf import extract_pdf  # noqa: E402
+from synth import make_pdf  # noqa: E402
+
+
+def measure(file_path: str, page_start: int, page_end: int, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = extract_pdf(file_path, page_start=page_start, page_end=page_end, use_cache=False)
+        samples.append(time.perf_counter() - started)
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="100,500,1000,2000")
+    parser.add_argument("--page-start", type=int, default=50)
+    parser.add_argument("--page-end", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    rows = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in sizes:
+            file_path = make_pdf(os.path.join(work_dir, "range_{0}.pdf".format(size)), size)
+            samples = measure(file_path, args.page_start, args.page_end, args.repeat)
+            rows.append({
+                "document_pages": size,
+                "page_range": [args.page_start, args.page_end],
+                "median_ms": round(statistics.median(samples) * 1000, 2),
+                "min_ms": round(min(samples) * 1000, 2)
+            })
+    print(json.dumps(rows, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
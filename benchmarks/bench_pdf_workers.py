@@ -0,0 +1,53 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "pdf-reader", "scripts"))
+
+from read_pdf import extract_pdf  # noqa: E402
+from synth import make_pdf  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=600)
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    worker_counts = [int(count) for count in args.workers.split(",") if count]
+    rows = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        file_path = make_pdf(os.path.join(work_dir, "workers.pdf"), args.pages)
+        baseline_content = None
+        baseline_seconds = None
+        for workers in worker_counts:
+            best = None
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                result = extract_pdf(file_path, use_cache=False, workers=workers)
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            if baseline_content is None:
+                baseline_content = result["content"]
+                baseline_seconds = best
+            rows.append({
+                "workers": workers,
+                "seconds": round(best, 3),
+                "speedup": round(baseline_seconds / best, 2),
+                "identical": result["content"] == baseline_content
+            })
+
+    print(json.dumps({
+        "pages": args.pages,
+        "cpu_count": os.cpu_count(),
+        "results": rows
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+sys.path.insert(0, os.path.join(ROOT, "pptx-reader", "scripts"))
+
+from read_pptx import assemble_slide, extract_pptx  # noqa: E402
+from synth import make_pptx  # noqa: E402
+
+
+def python_pptx_slides(file_path: str, slide_start: int, slide_end: int) -> list:
+    from pptx import Presentation
+
+    slides = list(Presentation(file_path).slides)
+    slides_list = []
+    for index in range(slide_start - 1, min(slide_end, len(slides))):
+        slide = slides[index]
+        shapes = []
+        for shape in slide.shapes:
+            if shape.has_text_frame:
+                shapes.append((shape.text or "").strip())
+            if shape.has_table:
+                shapes.append([[cell.text.strip() for cell in row.cells] for row in shape.table.rows])
+        notes_text = ""
+        if slide.has_notes_slide:
+            notes_frame = slide.notes_slide.notes_text_frame
+            if notes_frame:
+                notes_text = (notes_frame.text or "").strip()
+        _, slide_texts, slide_tables, _ = assemble_slide({"shapes": shapes, "notes": notes_text})
+        slides_list.append({
+            "slide_index": index + 1,
+            "texts": slide_texts,
+            "tables": slide_tables
+        })
+    return slides_list
+
+
+def timed(function, *args, **kwargs) -> tuple:
+    started = time.perf_counter()
+    value = function(*args, **kwargs)
+    return value, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--slides", type=int, default=600)
+    parser.add_argument("--media-bytes", type=int, default=200000)
+    parser.add_argument("--range", default="300,302")
+    args = parser.parse_args()
+
+    slide_start, slide_end = [int(value) for value in args.range.split(",")]
+    with tempfile.TemporaryDirectory() as work_dir:
+        file_path = make_pptx(
+            os.path.join(work_dir, "deck.pptx"), args.slides, media_bytes=args.media_bytes
+        )
+        results = {}
+        for label, start, end in (("range", slide_start, slide_end), ("all", 1, args.slides)):
+            baseline, baseline_seconds = timed(python_pptx_slides, file_path, start, end)
+            result, seconds = timed(
+                extract_pptx, file_path, slide_start=start, slide_end=end, output_mode="list", use_cache=False
+            )
+            results[label] = {
+                "slides": len(baseline),
+                "identical": result["slides"] == baseline,
+                "python_pptx_seconds": round(baseline_seconds, 3),
+                "slide_xml_seconds": round(seconds, 3),
+                "speedup": round(baseline_seconds / seconds, 1) if seconds else None
+            }
+        file_bytes = os.path.getsize(file_path)
+
+    print(json.dumps({
+        "slides": args.slides,
+        "file_bytes": file_bytes,
+        "results": results
+    }, ensure_ascii=False, indent=2))
+    if not all(result["identical"] for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+import argparse
+import importlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from synth import SCRIPTS, make_doc, make_docx, make_pdf, make_pptx, make_table_docx  # noqa: E402
+
+SEARCH_TERMS = {"latin": "magna aliqua", "cjk": "回滚演练"}
+SUITES = {
+    "quick": [
+        ("pdf", "pages", 50),
+        ("pdf", "pages", 200),
+        ("docx", "paragraphs", 500),
+        ("docx", "paragraphs", 3000),
+        ("docx", "table_cells", "1000x8"),
+        ("pptx", "slides", 50),
+        ("pptx", "slides", 200),
+        ("doc", "paragraphs", 3000)
+    ],
+    "full": [
+        ("pdf", "pages", 200),
+        ("pdf", "pages", 1000),
+        ("docx", "paragraphs", 3000),
+        ("docx", "paragraphs", 20000),
+        ("docx", "table_cells", "1000x8"),
+        ("docx", "table_cells", "10000x12"),
+        ("pptx", "slides", 200),
+        ("pptx", "slides", 1000),
+        ("doc", "paragraphs", 20000)
+    ]
+}
+MODES = {
+    "pdf": {
+        "full": ("extract_pdf", {"use_cache": False, "use_index": False}, True),
+        "stats": ("extract_pdf", {"include_content": False, "use_cache": False, "use_index": False}, True),
+        "range": ("extract_pdf", {"page_start": 21, "page_end": 30, "use_cache": False}, False),
+        "chunk": ("extract_pdf", {"max_tokens": 4000, "use_cache": False, "use_index": False}, False),
+        "boilerplate": ("extract_pdf", {"strip_boilerplate": True, "use_cache": False, "use_index": False}, True),
+        "search": ("search_pdf", {"max_hits": None, "use_cache": False, "use_index": False}, True),
+        "stream": ("stream_pdf", {"use_index": False}, True),
+        "cached": ("extract_pdf", {}, True)
+    },
+    "docx": {
+        "full": ("extract_docx", {"use_cache": False, "use_index": False}, True),
+        "list": ("extract_docx", {"output_mode": "list", "use_cache": False, "use_index": False}, True),
+        "range": ("extract_docx", {"paragraph_start": 201, "paragraph_end": 300, "use_cache": False}, False),
+        "table_window": (
+            "extract_docx",
+            {"table_start": 1, "table_end": 1, "table_row_start": 101, "table_row_end": 120, "use_cache": False},
+            False
+        ),
+        "chunk": ("extract_docx", {"max_tokens": 4000, "use_cache": False, "use_index": False}, False),
+        "search": ("search_docx", {"max_hits": None, "use_cache": False, "use_index": False}, True),
+        "stream": ("stream_docx", {}, True),
+        "cached": ("extract_docx", {}, True)
+    },
+    "pptx": {
+        "full": ("extract_pptx", {"use_cache": False, "use_index": False}, True),
+        "stats": ("extract_pptx", {"include_content": False, "use_cache": False, "use_index": False}, True),
+        "range": ("extract_pptx", {"slide_start": 21, "slide_end": 30, "use_cache": False}, False),
+        "chunk": ("extract_pptx", {"max_tokens": 4000, "use_cache": False, "use_index": False}, False),
+        "search": ("search_pptx", {"max_hits": None, "use_cache": False, "use_index": False}, True),
+        "stream": ("stream_pptx", {"use_index": False}, True),
+        "cached": ("extract_pptx", {}, True)
+    },
+    "doc": {
+        "full": ("extract_doc", {"use_cache": False}, True),
+        "chunk": ("extract_doc", {"max_tokens": 4000, "use_cache": False}, False),
+        "search": ("search_doc", {"max_hits": None, "use_cache": False}, True),
+        "stream": ("stream_doc", {}, True),
+        "cached": ("extract_doc", {}, True)
+    }
+}
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))]
+
+
+def unit_count(axis: str, size) -> int:
+    if axis == "table_cells":
+        rows, columns = (int(value) for value in str(size).split("x"))
+        return rows * columns
+    return int(size)
+
+
+def make_fixture(work_dir: str, reader: str, axis: str, size, script: str) -> str:
+    file_path = os.path.join(work_dir, "{0}_{1}_{2}_{3}.{0}".format(reader, axis, size, script))
+    if reader == "pdf":
+        return make_pdf(file_path, int(size), script=script)
+    if reader == "pptx":
+        return make_pptx(file_path, int(size), notes=True, script=script)
+    if reader == "doc":
+        return make_doc(file_path, int(size), table_count=max(1, int(size) // 500), script=script)
+    if axis == "table_cells":
+        rows, columns = (int(value) for value in str(size).split("x"))
+        return make_table_docx(file_path, [rows, rows // 10], columns=columns, script=script)
+    return make_docx(file_path, int(size), table_count=max(1, int(size) // 500), merged=False, script=script)
+
+
+def run_case(case: dict) -> dict:
+    scripts_dir = os.path.join(ROOT, case["reader"] + "-reader", "scripts")
+    sys.path.insert(0, scripts_dir)
+    os.environ["DOC_READER_CACHE_DIR"] = case["cache_dir"]
+    module = importlib.import_module("read_" + case["reader"])
+    from profiling import peak_rss_bytes
+
+    function_name, options, _ = MODES[case["reader"]][case["mode"]]
+    function = getattr(module, function_name)
+    options = dict(options)
+    if function_name.startswith("search"):
+        options["pattern"] = SEARCH_TERMS[case["script"]]
+
+    def call() -> None:
+        result = function(case["file_path"], **options)
+        if function_name.startswith("stream"):
+            result = list(result)[-1]
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+
+    import_rss = peak_rss_bytes()
+    for _ in range(case["warmup"]):
+        call()
+    samples = []
+    for _ in range(case["repeat"]):
+        started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - started)
+    return {
+        "samples": samples,
+        "import_rss_bytes": import_rss,
+        "peak_rss_bytes": peak_rss_bytes()
+    }
+
+
+def measure(case: dict) -> dict:
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--run-case", json.dumps(case)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.decode("utf-8", "replace"))
+    return json.loads(completed.stdout)
+
+
+def summarize(case: dict, measured: dict) -> dict:
+    samples = measured["samples"]
+    median = percentile(samples, 0.5)
+    whole_document = MODES[case["reader"]][case["mode"]][2]
+    peak = measured["peak_rss_bytes"]
+    return {
+        "id": case["id"],
+        "reader": case["reader"],
+        "script": case["script"],
+        "axis": case["axis"],
+        "size": case["size"],
+        "mode": case["mode"],
+        "file_bytes": case["file_bytes"],
+        "repeat": len(samples),
+        "p50_ms": round(median * 1000, 3),
+        "p90_ms": round(percentile(samples, 0.9) * 1000, 3),
+        "p99_ms": round(percentile(samples, 0.99) * 1000, 3),
+        "mean_ms": round(statistics.mean(samples) * 1000, 3),
+        "min_ms": round(min(samples) * 1000, 3),
+        "mb_per_s": round(case["file_bytes"] / median / 1e6, 3) if whole_document and median > 0 else None,
+        "units_per_s": round(case["units"] / median, 1) if whole_document and median > 0 else None,
+        "peak_rss_bytes": peak,
+        "rss_growth_bytes": peak - measured["import_rss_bytes"] if peak and measured["import_rss_bytes"] else None
+    }
+
+
+def environment() -> dict:
+    versions = {}
+    for name in ("PyPDF2", "docx", "pptx", "lxml"):
+        try:
+            versions[name] = getattr(importlib.import_module(name), "__version__", "unknown")
+        except ImportError:
+            versions[name] = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "packages": versions
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> dict:
+    previous_cases = {case["id"]: case for case in baseline["cases"]}
+    rows = []
+    for case in results["cases"]:
+        previous = previous_cases.get(case["id"])
+        if previous is None:
+            continue
+        time_ratio = case["p50_ms"] / previous["p50_ms"] if previous["p50_ms"] else None
+        memory_ratio = (
+            case["peak_rss_bytes"] / previous["peak_rss_bytes"]
+            if case["peak_rss_bytes"] and previous["peak_rss_bytes"] else None
+        )
+        significant = abs(case["p50_ms"] - previous["p50_ms"]) >= min_delta_ms
+        if (significant and (time_ratio or 0) > 1 + tolerance) or (memory_ratio or 0) > 1 + tolerance:
+            status = "regressed"
+        elif significant and time_ratio is not None and time_ratio < 1 - tolerance:
+            status = "improved"
+        else:
+            status = "unchanged"
+        rows.append({
+            "id": case["id"],
+            "status": status,
+            "baseline_p50_ms": previous["p50_ms"],
+            "p50_ms": case["p50_ms"],
+            "time_ratio": round(time_ratio, 3) if time_ratio is not None else None,
+            "memory_ratio": round(memory_ratio, 3) if memory_ratio is not None else None
+        })
+    return {
+        "tolerance": tolerance,
+        "min_delta_ms": min_delta_ms,
+        "environment_matches": baseline.get("environment") == results["environment"],
+        "compared": len(rows),
+        "missing": sorted(set(previous_cases) - {case["id"] for case in results["cases"]}),
+        "regressed": [row["id"] for row in rows if row["status"] == "regressed"],
+        "improved": [row["id"] for row in rows if row["status"] == "improved"],
+        "cases": rows
+    }
+
+
+def split_option(value: str) -> list:
+    return [item for item in value.split(",") if item]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--suite", choices=sorted(SUITES), default="quick")
+    parser.add_argument("--readers", default="pdf,docx,pptx,doc")
+    parser.add_argument("--scripts", default=",".join(SCRIPTS))
+    parser.add_argument("--modes", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--save", default=None)
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--min-delta-ms", type=float, default=5.0)
+    parser.add_argument("--run-case", default=None)
+    args = parser.parse_args()
+
+    if args.run_case:
+        print(json.dumps(run_case(json.loads(args.run_case))))
+        return
+
+    readers = split_option(args.readers)
+    scripts = split_option(args.scripts)
+    modes = split_option(args.modes) if args.modes else None
+    cases = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for reader, axis, size in SUITES[args.suite]:
+            if reader not in readers:
+                continue
+            for script in scripts:
+                file_path = make_fixture(work_dir, reader, axis, size, script)
+                for mode in MODES[reader]:
+                    if modes and mode not in modes:
+                        continue
+                    case = {
+                        "id": "{0}/{1}/{2}={3}/{4}".format(reader, script, axis, size, mode),
+                        "reader": reader,
+                        "script": script,
+                        "axis": axis,
+                        "size": size,
+                        "mode": mode,
+                        "file_path": file_path,
+                        "file_bytes": os.path.getsize(file_path),
+                        "units": unit_count(axis, size),
+                        "cache_dir": os.path.join(work_dir, "cache", str(len(cases))),
+                        "repeat": args.repeat,
+                        "warmup": args.warmup
+                    }
+                    summary = summarize(case, measure(case))
+                    sys.stderr.write("{0}: p50 {1} ms\n".format(summary["id"], summary["p50_ms"]))
+                    cases.append(summary)
+
+    results = {
+        "suite": args.suite,
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "environment": environment(),
+        "cases": cases
+    }
+    if args.save:
+        directory = os.path.dirname(os.path.abspath(args.save))
+        os.makedirs(directory, exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, ensure_ascii=False, indent=2)
+            handle.write("\n")
+
+    comparison = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as handle:
+            comparison = compare(results, json.load(handle), args.tolerance, args.min_delta_ms)
+        results["comparison"] = comparison
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+    if comparison and comparison["regressed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
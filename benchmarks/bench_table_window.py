@@ -0,0 +1,59 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+sys.path.insert(0, os.path.join(ROOT, "docx-reader", "scripts"))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--columns", type=int, default=6)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.environ["DOC_READER_CACHE_DIR"] = os.path.join(work_dir, "cache")
+        from read_docx import extract_docx
+        from synth import make_table_docx
+
+        file_path = make_table_docx(os.path.join(work_dir, "table.docx"), [20, args.rows, 20], args.columns)
+
+        def page(row_start: int) -> float:
+            started = time.perf_counter()
+            result = extract_docx(
+                file_path, table_start=2, table_end=2,
+                table_row_start=row_start, table_row_end=row_start + args.page_size - 1,
+                columns=[1, args.columns]
+            )
+            elapsed = time.perf_counter() - started
+            expected = "T2 R{0} C1".format(row_start)
+            if not result["success"] or not result["content"].startswith(expected):
+                raise RuntimeError("unexpected page content at row {0}".format(row_start))
+            return round(elapsed, 3)
+
+        first = page(1)
+        pages = {}
+        for row_start in (1, args.rows // 4, args.rows // 2, args.rows - args.page_size + 1):
+            pages[str(row_start)] = page(row_start)
+
+        started = time.perf_counter()
+        extract_docx(file_path, table_start=2, table_end=2, use_cache=False)
+        full_seconds = round(time.perf_counter() - started, 3)
+
+    print(json.dumps({
+        "rows": args.rows,
+        "page_size": args.page_size,
+        "full_table_seconds": full_seconds,
+        "first_page_with_index_build_seconds": first,
+        "page_seconds_by_row_start": pages
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
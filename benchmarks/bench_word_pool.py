@@ -0,0 +1,143 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "doc-reader", "scripts"))
+
+from read_doc import read_doc_units  # noqa: E402
+from word_pool import WordPool  # noqa: E402
+
+
+class FakeRange:
+    def __init__(self, text: str):
+        self.Text = text
+
+
+class FakeRow:
+    def __init__(self, cells: list):
+        self.Range = FakeRange("".join(cell + "\r\x07" for cell in cells) + "\r\x07")
+
+
+class FakeRows:
+    def __init__(self, rows: list):
+        self.rows = [FakeRow(cells) for cells in rows]
+        self.Count = len(rows)
+
+    def __call__(self, index: int) -> FakeRow:
+        return self.rows[index - 1]
+
+
+class FakeTable:
+    def __init__(self, rows: list):
+        self.Rows = FakeRows(rows)
+
+
+class FakeDocument:
+    def __init__(self, paragraphs: list, tables: list):
+        parts = [text + "\r" for text in paragraphs]
+        for rows in tables:
+            for cells in rows:
+                parts.extend(cell + "\r\x07" for cell in cells)
+                parts.append("\r\x07")
+        self.Content = FakeRange("".join(parts))
+        self.Tables = [FakeTable(rows) for rows in tables]
+
+    def Close(self, save_changes: bool) -> None:
+        pass
+
+
+class FakeDocuments:
+    def __init__(self, app: "FakeWordApp"):
+        self.app = app
+
+    def Open(self, file_path: str, ReadOnly: bool = True) -> FakeDocument:
+        if "hang" in os.path.basename(file_path):
+            self.app.hung.wait()
+        time.sleep(self.app.open_seconds)
+        name = os.path.basename(file_path)
+        return FakeDocument(
+            ["{0} paragraph {1}".format(name, index) for index in range(1, 6)],
+            [[["{0} r{1}c{2}".format(name, row, column) for column in range(1, 4)] for row in range(1, 3)]]
+        )
+
+
+class FakeWordApp:
+    started = 0
+    quit = 0
+
+    def __init__(self, startup_seconds: float, open_seconds: float, hung: threading.Event):
+        time.sleep(startup_seconds)
+        FakeWordApp.started += 1
+        self.open_seconds = open_seconds
+        self.hung = hung
+        self.Visible = True
+        self.Documents = FakeDocuments(self)
+
+    def Quit(self) -> None:
+        FakeWordApp.quit += 1
+
+
+def run(pool: WordPool, paths: list) -> dict:
+    FakeWordApp.started = 0
+    FakeWordApp.quit = 0
+    started = time.perf_counter()
+    failures = []
+    for path in paths:
+        try:
+            units = pool.run(path, read_doc_units)
+            assert units.paragraph(0) == "{0} paragraph 1".format(os.path.basename(path))
+            assert units.rows(0)[1][2] == "{0} r2c3".format(os.path.basename(path))
+        except TimeoutError as exc:
+            failures.append(str(exc))
+    elapsed = time.perf_counter() - started
+    pool.close()
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "documents_per_second": round(len(paths) / elapsed, 1),
+        "word_started": FakeWordApp.started,
+        "recycled": pool.recycled,
+        "killed": pool.killed,
+        "timeouts": len(failures)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=60)
+    parser.add_argument("--startup-ms", type=float, default=50)
+    parser.add_argument("--open-ms", type=float, default=2)
+    parser.add_argument("--max-documents", type=int, default=20)
+    args = parser.parse_args()
+
+    hung = threading.Event()
+
+    def dispatch():
+        return FakeWordApp(args.startup_ms / 1000, args.open_ms / 1000, hung)
+
+    paths = ["doc_{0}.doc".format(index) for index in range(args.documents)]
+    per_document = run(WordPool(size=1, max_documents=1, timeout=None, dispatch=dispatch), paths)
+    pooled = run(WordPool(size=1, max_documents=args.max_documents, timeout=None, dispatch=dispatch), paths)
+
+    hang_paths = list(paths)
+    hang_paths.insert(len(paths) // 2, "hang.doc")
+    with_hang = run(WordPool(size=1, max_documents=args.max_documents, timeout=0.5, dispatch=dispatch), hang_paths)
+    hung.set()
+
+    assert pooled["word_started"] == -(-args.documents // args.max_documents)
+    assert with_hang["killed"] == 1 and with_hang["timeouts"] == 1
+
+    print(json.dumps({
+        "documents": args.documents,
+        "startup_ms": args.startup_ms,
+        "per_document_dispatch": per_document,
+        "pooled": pooled,
+        "pooled_with_hang": with_hang
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
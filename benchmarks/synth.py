@@ -0,0 +1,495 @@
+import os
+from typing import List
+
+LOREM = (
+    "Lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua"
+)
+CJK_TEXT = "项目验收标准要求系统在高并发场景下保持稳定，数据迁移方案需经过完整的回滚演练并形成测试报告"
+SCRIPTS = ("latin", "cjk")
+CJK_LABELS = {"Page": "第{0}页", "line": "第{0}行", "Paragraph": "第{0}段", "Point": "要点{0}", "Slide": "幻灯片{0}"}
+
+
+def filler(script: str) -> str:
+    if script not in SCRIPTS:
+        raise ValueError("script must be one of " + ", ".join(SCRIPTS))
+    return CJK_TEXT if script == "cjk" else LOREM
+
+
+def cell_text(table_number: int, row: int, column: int, script: str = "latin") -> str:
+    if script == "cjk":
+        return "表{0}行{1}列{2}".format(table_number, row, column)
+    return "T{0} R{1} C{2}".format(table_number, row, column)
+
+
+def label(word: str, number: int, script: str) -> str:
+    if script == "cjk":
+        return CJK_LABELS[word].format(number)
+    return "{0} {1}".format(word, number)
+
+
+def page_lines(page_number: int, lines_per_page: int, script: str = "latin") -> List[str]:
+    return [
+        "{0} {1} {2}".format(label("Page", page_number, script), label("line", line, script), filler(script))
+        for line in range(1, lines_per_page + 1)
+    ]
+
+
+def column_lines(page_number: int, lines_per_page: int, script: str = "latin") -> List[str]:
+    width = 24 if script == "cjk" else 48
+    return [line[:width].rstrip() for line in page_lines(page_number, lines_per_page, script)]
+
+
+def escape_pdf_text(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def pdf_string(text: str, script: str) -> str:
+    if script == "cjk":
+        return "<" + text.encode("utf-16-be").hex().upper() + ">"
+    return "(" + escape_pdf_text(text) + ")"
+
+
+def to_unicode_cmap(characters: set) -> str:
+    codes = sorted("{0:04X}".format(ord(character)) for character in characters)
+    lines = [
+        "/CIDInit /ProcSet findresource begin", "12 dict begin", "begincmap",
+        "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def",
+        "/CMapName /Adobe-Identity-UCS def", "/CMapType 2 def",
+        "1 begincodespacerange", "<0000> <FFFF>", "endcodespacerange"
+    ]
+    for start in range(0, len(codes), 100):
+        block = codes[start:start + 100]
+        lines.append("{0} beginbfchar".format(len(block)))
+        lines.extend("<{0}> <{0}>".format(code) for code in block)
+        lines.append("endbfchar")
+    lines.extend(["endcmap", "CMapName currentdict /CMap defineresource pop", "end", "end"])
+    return "\n".join(lines)
+
+
+def make_pdf(
+    file_path: str,
+    page_count: int,
+    lines_per_page: int = 40,
+    updates: int = 0,
+    script: str = "latin",
+    columns: int = 1
+) -> str:
+    objects = []
+    objects.append("<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join("{0} 0 R".format(4 + i * 2) for i in range(page_count))
+    objects.append("<< /Type /Pages /Kids [{0}] /Count {1} >>".format(kids, page_count))
+    if script == "cjk":
+        objects.append(
+            "<< /Type /Font /Subtype /Type0 /BaseFont /STSong-Light /Encoding /Identity-H "
+            "/DescendantFonts [{0} 0 R] /ToUnicode {1} 0 R >>".format(4 + page_count * 2, 5 + page_count * 2)
+        )
+    else:
+        objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    characters = set()
+    for i in range(page_count):
+        content_number = 5 + i * 2
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            "/Resources << /Font << /F1 3 0 R >> >> /Contents {0} 0 R >>".format(content_number)
+        )
+        if columns > 1:
+            lines = column_lines(i + 1, lines_per_page, script)
+            per_column = -(-len(lines) // columns)
+            commands = ["BT", "/F1 9 Tf"]
+            for row in range(per_column):
+                for column in range(columns):
+                    index = column * per_column + row
+                    if index < len(lines):
+                        characters.update(lines[index])
+                        commands.append("1 0 0 1 {0} {1} Tm {2} Tj".format(
+                            36 + column * (540 // columns), 756 - 11 * row, pdf_string(lines[index], script)
+                        ))
+        else:
+            commands = ["BT", "/F1 9 Tf", "11 TL", "36 756 Td"]
+            for line in page_lines(i + 1, lines_per_page, script):
+                characters.update(line)
+                commands.append("{0} Tj T*".format(pdf_string(line, script)))
+        commands.append("ET")
+        stream = "\n".join(commands)
+        objects.append("<< /Length {0} >>\nstream\n{1}\nendstream".format(len(stream), stream))
+    if script == "cjk":
+        characters.update("revision of page object 0123456789")
+        objects.append(
+            "<< /Type /Font /Subtype /CIDFontType0 /BaseFont /STSong-Light "
+            "/CIDSystemInfo << /Registry (Adobe) /Ordering (GB1) /Supplement 2 >> /DW 1000 >>"
+        )
+        cmap = to_unicode_cmap(characters)
+        objects.append("<< /Length {0} >>\nstream\n{1}\nendstream".format(len(cmap), cmap))
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(file_path, "wb") as handle:
+        handle.write(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(handle.tell())
+            handle.write("{0} 0 obj\n{1}\nendobj\n".format(number, body).encode("latin-1"))
+        xref_offset = handle.tell()
+        handle.write("xref\n0 {0}\n".format(len(objects) + 1).encode("latin-1"))
+        handle.write(b"0000000000 65535 f \n")
+        for offset in offsets:
+            handle.write("{0:010d} 00000 n \n".format(offset).encode("latin-1"))
+        handle.write(
+            "trailer\n<< /Size {0} /Root 1 0 R >>\nstartxref\n{1}\n%%EOF\n".format(
+                len(objects) + 1, xref_offset
+            ).encode("latin-1")
+        )
+        for update in range(1, updates + 1):
+            page_number = 4 + ((update * 7) % page_count) * 2
+            stream = "BT /F1 9 Tf 36 756 Td {0} Tj ET".format(
+                pdf_string("revision {0} of page object {1}".format(update, page_number), script)
+            )
+            revised = [
+                (page_number, "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                              "/Resources << /Font << /F1 3 0 R >> >> /Contents {0} 0 R >>".format(page_number + 1)),
+                (page_number + 1, "<< /Length {0} >>\nstream\n{1}\nendstream".format(len(stream), stream))
+            ]
+            revised_offsets = []
+            for number, body in revised:
+                revised_offsets.append(handle.tell())
+                handle.write("{0} 0 obj\n{1}\nendobj\n".format(number, body).encode("latin-1"))
+            previous_offset = xref_offset
+            xref_offset = handle.tell()
+            handle.write("xref\n{0} 2\n".format(page_number).encode("latin-1"))
+            for offset in revised_offsets:
+                handle.write("{0:010d} 00000 n \n".format(offset).encode("latin-1"))
+            handle.write(
+                "trailer\n<< /Size {0} /Root 1 0 R /Prev {1} >>\nstartxref\n{2}\n%%EOF\n".format(
+                    len(objects) + 1, previous_offset, xref_offset
+                ).encode("latin-1")
+            )
+    return file_path
+
+
+def doc_body(paragraph_count: int, table_count: int, rows: int, columns: int, script: str = "latin") -> list:
+    body = []
+    tables_left = table_count
+    interval = max(1, paragraph_count // (table_count + 1)) if table_count else 0
+    for index in range(1, paragraph_count + 1):
+        body.append(("paragraph", "{0} {1}".format(label("Paragraph", index, script), filler(script))))
+        if tables_left and index % interval == 0:
+            table_number = table_count - tables_left + 1
+            body.append(("table", [
+                [cell_text(table_number, row, column, script) for column in range(1, columns + 1)]
+                for row in range(1, rows + 1)
+            ]))
+            tables_left -= 1
+    while tables_left:
+        table_number = table_count - tables_left + 1
+        body.append(("table", [
+            [cell_text(table_number, row, column, script) for column in range(1, columns + 1)]
+            for row in range(1, rows + 1)
+        ]))
+        tables_left -= 1
+    return body
+
+
+def build_cfb(streams: list) -> bytes:
+    import struct
+
+    sector_size = 512
+    free, end, fat_marker = 0xFFFFFFFF, 0xFFFFFFFE, 0xFFFFFFFD
+    payloads = []
+    for name, data in streams:
+        data = data + b"\0" * (max(4096, -(-len(data) // sector_size) * sector_size) - len(data))
+        payloads.append((name, data))
+
+    fat = []
+    starts = []
+    for _, data in payloads:
+        starts.append(len(fat))
+        count = len(data) // sector_size
+        fat.extend(range(len(fat) + 1, len(fat) + count))
+        fat.append(end)
+    directory_sector = len(fat)
+    fat.append(end)
+    fat_sector_count = 1
+    while len(fat) + fat_sector_count > fat_sector_count * (sector_size // 4):
+        fat_sector_count += 1
+    fat_sectors = list(range(len(fat), len(fat) + fat_sector_count))
+    fat.extend([fat_marker] * fat_sector_count)
+    fat.extend([free] * (fat_sector_count * (sector_size // 4) - len(fat)))
+
+    def entry(name: str, entry_type: int, left: int, right: int, child: int, start: int, size: int) -> bytes:
+        encoded = (name + "\0").encode("utf-16-le") if name else b""
+        return (
+            encoded.ljust(64, b"\0")
+            + struct.pack("<HBB", len(encoded), entry_type, 1)
+            + struct.pack("<III", left, right, child)
+            + b"\0" * 36
+            + struct.pack("<IQ", start, size)
+        )
+
+    entries = [entry("Root Entry", 5, free, free, 1, end, 0)]
+    for index, (name, data) in enumerate(payloads):
+        right = index + 2 if index + 1 < len(payloads) else free
+        entries.append(entry(name, 2, free, right, free, starts[index], len(data)))
+    while len(entries) % 4:
+        entries.append(entry("", 0, free, free, free, 0, 0))
+
+    difat = fat_sectors + [free] * (109 - len(fat_sectors))
+    header = (
+        b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\0" * 16
+        + struct.pack("<HHHHH", 0x3E, 3, 0xFFFE, 9, 6) + b"\0" * 6
+        + struct.pack("<IIIIIIIII", 0, fat_sector_count, directory_sector, 0, 4096, end, 0, end, 0)
+        + struct.pack("<109I", *difat)
+    )
+    return (
+        header
+        + b"".join(data for _, data in payloads)
+        + b"".join(entries)
+        + struct.pack("<{0}I".format(len(fat)), *fat)
+    )
+
+
+def make_doc(
+    file_path: str,
+    paragraph_count: int,
+    table_count: int = 0,
+    rows: int = 4,
+    columns: int = 3,
+    script: str = "latin"
+) -> str:
+    import struct
+
+    text_parts = []
+    kinds = []
+    for kind, value in doc_body(paragraph_count, table_count, rows, columns, script):
+        if kind == "paragraph":
+            text_parts.append(value + "\r")
+            kinds.append((len(value) + 1, 0))
+            continue
+        for row in value:
+            for cell in row:
+                text_parts.append(cell + "\x07")
+                kinds.append((len(cell) + 1, 1))
+            text_parts.append("\x07")
+            kinds.append((1, 2))
+    text = "".join(text_parts)
+
+    text_offset = 1024
+    fkp_offset = text_offset + -(-2 * len(text) // 512) * 512
+    runs = []
+    fc = text_offset
+    for length, kind in kinds:
+        runs.append((fc, fc + 2 * length, kind))
+        fc += 2 * length
+
+    pages = []
+    page_fcs = []
+    runs_per_page = 24
+    papx = {
+        1: (210, b"\x03\x00\x00\x16\x24\x01"),
+        2: (214, b"\x05\x00\x00\x16\x24\x01\x17\x24\x01\x00")
+    }
+    for page_start in range(0, len(runs), runs_per_page):
+        chunk = runs[page_start:page_start + runs_per_page]
+        page = bytearray(512)
+        struct.pack_into("<{0}I".format(len(chunk) + 1), page, 0, *([run[0] for run in chunk] + [chunk[-1][1]]))
+        bx_base = 4 * (len(chunk) + 1)
+        for index, run in enumerate(chunk):
+            if run[2]:
+                page[bx_base + 13 * index] = papx[run[2]][0]
+        for word_offset, data in papx.values():
+            page[word_offset * 2:word_offset * 2 + len(data)] = data
+        page[511] = len(chunk)
+        pages.append(bytes(page))
+        page_fcs.append(chunk[0][0])
+    page_fcs.append(runs[-1][1])
+
+    word = bytearray(fkp_offset)
+    struct.pack_into("<HH", word, 0, 0xA5EC, 0x00C1)
+    struct.pack_into("<H", word, 0x0A, 0x0200)
+    struct.pack_into("<H", word, 32, 14)
+    struct.pack_into("<H", word, 62, 22)
+    struct.pack_into("<i", word, 76, len(text))
+    struct.pack_into("<H", word, 152, 93)
+    word[text_offset:text_offset + 2 * len(text)] = text.encode("utf-16-le")
+    word += b"".join(pages)
+
+    clx = b"\x02" + struct.pack("<IIIHIH", 16, 0, len(text), 0, text_offset, 0)
+    first_page = fkp_offset // 512
+    bte = struct.pack(
+        "<{0}I".format(2 * len(pages) + 1),
+        *(page_fcs + list(range(first_page, first_page + len(pages))))
+    )
+    table = clx + bte
+    struct.pack_into("<II", word, 154 + 4 * 26, len(clx), len(bte))
+    struct.pack_into("<II", word, 154 + 4 * 66, 0, len(clx))
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(file_path, "wb") as handle:
+        handle.write(build_cfb([("WordDocument", bytes(word)), ("1Table", table)]))
+    return file_path
+
+
+def make_png(size_bytes: int) -> bytes:
+    import struct
+    import zlib
+
+    width = max(1, int((size_bytes / 3) ** 0.5))
+    raw = b"".join(b"\0" + os.urandom(width * 3) for _ in range(width))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, width, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw, 0))
+        + chunk(b"IEND", b"")
+    )
+
+
+def make_docx(
+    file_path: str,
+    paragraph_count: int,
+    table_count: int = 0,
+    rows: int = 6,
+    columns: int = 4,
+    merged: bool = True,
+    media_bytes: int = 0,
+    script: str = "latin"
+) -> str:
+    import io
+    from docx import Document
+
+    document = Document()
+    for kind, value in doc_body(paragraph_count, table_count, rows, columns, script):
+        if kind == "paragraph":
+            paragraph = document.add_paragraph(value[:40])
+            paragraph.add_run(value[40:]).add_break()
+            paragraph.add_run("\t")
+            continue
+        table = document.add_table(rows=len(value), cols=len(value[0]))
+        for row_index, cells in enumerate(value):
+            for column_index, text in enumerate(cells):
+                table.cell(row_index, column_index).text = text
+        if merged and len(value) >= 3 and len(value[0]) >= 3:
+            table.cell(0, 0).merge(table.cell(0, 1))
+            table.cell(1, 2).merge(table.cell(len(value) - 1, 2))
+            table.cell(1, 0).add_table(rows=1, cols=2).cell(0, 0).text = "nested"
+        if media_bytes:
+            document.add_picture(io.BytesIO(make_png(media_bytes)))
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    document.save(file_path)
+    return file_path
+
+
+def make_pptx(
+    file_path: str,
+    slide_count: int,
+    table_every: int = 5,
+    notes: bool = True,
+    media_bytes: int = 0,
+    script: str = "latin"
+) -> str:
+    import io
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    presentation = Presentation()
+    layout = presentation.slide_layouts[1]
+    for index in range(1, slide_count + 1):
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = label("Slide", index, script)
+        body = slide.placeholders[1].text_frame
+        body.text = "{0} {1}".format(label("Point", index, script), filler(script))
+        body.add_paragraph().text = "第二要点{0}".format(index) if script == "cjk" else "Second point {0}".format(index)
+        if table_every and index % table_every == 0:
+            table = slide.shapes.add_table(4, 3, Inches(1), Inches(4), Inches(6), Inches(2)).table
+            for row in range(4):
+                for column in range(3):
+                    table.cell(row, column).text = cell_text(index, row + 1, column + 1, script)
+        if notes:
+            slide.notes_slide.notes_text_frame.text = (
+                "幻灯片{0}备注 {1}".format(index, CJK_TEXT) if script == "cjk" else "Notes for slide {0}".format(index)
+            )
+        if media_bytes:
+            slide.shapes.add_picture(io.BytesIO(make_png(media_bytes)), Inches(7), Inches(5), Inches(1), Inches(1))
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    presentation.save(file_path)
+    return file_path
+
+
+def make_table_docx(
+    file_path: str,
+    table_rows: List[int],
+    columns: int = 6,
+    paragraphs_between: int = 3,
+    script: str = "latin",
+    merged: bool = False
+) -> str:
+    import zipfile
+    from xml.sax.saxutils import escape
+
+    w_ns = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    body = []
+    for table_number, row_count in enumerate(table_rows, start=1):
+        for index in range(paragraphs_between):
+            text = "表{0}前第{1}段 {2}".format(table_number, index + 1, CJK_TEXT) if script == "cjk" else (
+                "Before table {0} paragraph {1}".format(table_number, index + 1)
+            )
+            body.append("<w:p><w:r><w:t>{0}</w:t></w:r></w:p>".format(escape(text)))
+        body.append("<w:tbl><w:tblGrid>{0}</w:tblGrid>".format("<w:gridCol/>" * columns))
+        for row in range(1, row_count + 1):
+            cells = []
+            for column in range(1, columns + 1):
+                properties = ""
+                text = escape(cell_text(table_number, row, column, script))
+                if merged and columns >= 3:
+                    if column == 1:
+                        properties = '<w:tcPr><w:gridSpan w:val="2"/></w:tcPr>'
+                    elif column == 2:
+                        continue
+                    elif column == columns and (row - 1) % 4:
+                        properties, text = "<w:tcPr><w:vMerge/></w:tcPr>", ""
+                    elif column == columns:
+                        properties = '<w:tcPr><w:vMerge w:val="restart"/></w:tcPr>'
+                cells.append("<w:tc>{0}<w:p><w:r><w:t>{1}</w:t></w:r></w:p></w:tc>".format(properties, text))
+            body.append("<w:tr>{0}</w:tr>".format("".join(cells)))
+        body.append("</w:tbl>")
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="{0}"><w:body>{1}<w:sectPr/></w:body></w:document>'
+    ).format(w_ns, "".join(body))
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with zipfile.ZipFile(file_path, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr(
+            "[Content_Types].xml",
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            '</Types>'
+        )
+        package.writestr(
+            "_rels/.rels",
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+            'Target="word/document.xml"/></Relationships>'
+        )
+        package.writestr("word/document.xml", document)
+    return file_path
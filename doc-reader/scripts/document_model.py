@@ -0,0 +1,226 @@
+import base64
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple
+from extract_cache import load_units, store_units
+
+OFFSET_TYPE = "I"
+FLUSH_PARTS = 4096
+MODEL_ARRAYS = ["paragraph_spans", "table_spans", "table_rows", "row_cells", "cell_spans"]
+
+
+class TextBuffer:
+    def __init__(self):
+        self.chunks = []
+        self.parts = []
+        self.length = 0
+
+    def write(self, text: str) -> None:
+        self.parts.append(text)
+        self.length += len(text)
+        if len(self.parts) >= FLUSH_PARTS:
+            self.chunks.append("".join(self.parts))
+            self.parts = []
+
+    def getvalue(self) -> str:
+        if self.parts:
+            self.chunks.append("".join(self.parts))
+            self.parts = []
+        return "".join(self.chunks)
+
+
+class DocumentModel:
+    def __init__(self, text: str, table_base: int, arrays: dict):
+        self.text = text
+        self.table_base = table_base
+        self.paragraph_spans = arrays["paragraph_spans"]
+        self.table_spans = arrays["table_spans"]
+        self.table_rows = arrays["table_rows"]
+        self.row_cells = arrays["row_cells"]
+        self.cell_spans = arrays["cell_spans"]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DocumentModel):
+            return NotImplemented
+        return self.to_units() == other.to_units()
+
+    @property
+    def paragraph_count(self) -> int:
+        return len(self.paragraph_spans) // 2
+
+    @property
+    def table_count(self) -> int:
+        return len(self.table_rows) - 1
+
+    def paragraph(self, index: int) -> str:
+        return self.text[self.paragraph_spans[2 * index]:self.paragraph_spans[2 * index + 1]]
+
+    def paragraphs(self, start: int = 0, end: Optional[int] = None) -> List[str]:
+        return [text for _, text in self.iter_paragraphs(start, end)]
+
+    def iter_paragraphs(self, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        for index in range(*slice(start, end).indices(self.paragraph_count)):
+            yield index, self.paragraph(index)
+
+    def table_row_counts(self, start: int = 0, end: Optional[int] = None) -> List[int]:
+        return [
+            self.table_rows[index + 1] - self.table_rows[index]
+            for index in range(*slice(start, end).indices(self.table_count))
+        ]
+
+    def table_text(self, index: int) -> str:
+        base = self.table_base
+        return self.text[base + self.table_spans[2 * index]:base + self.table_spans[2 * index + 1]]
+
+    def table_texts(self, start: int = 0, end: Optional[int] = None) -> List[str]:
+        return [self.table_text(index) for index in range(*slice(start, end).indices(self.table_count))]
+
+    def row(self, index: int) -> List[str]:
+        base = self.table_base
+        spans = self.cell_spans
+        return [
+            self.text[base + spans[2 * cell]:base + spans[2 * cell + 1]]
+            for cell in range(self.row_cells[index], self.row_cells[index + 1])
+        ]
+
+    def iter_rows(self, table_index: int, row_start: int = 0, row_end: Optional[int] = None) -> Iterator[List[str]]:
+        first = self.table_rows[table_index]
+        row_range = slice(row_start, row_end).indices(self.table_rows[table_index + 1] - first)
+        for index in range(first + row_range[0], first + row_range[1]):
+            yield self.row(index)
+
+    def rows(self, table_index: int, row_start: int = 0, row_end: Optional[int] = None) -> List[List[str]]:
+        return list(self.iter_rows(table_index, row_start, row_end))
+
+    def iter_tables(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        row_start: int = 0
+    ) -> Iterator[Tuple[int, Iterator[List[str]]]]:
+        for index in range(*slice(start, end).indices(self.table_count)):
+            yield index, self.iter_rows(index, row_start if index == start else 0)
+
+    def content(self, paragraph_range: Tuple[int, int], table_range: Tuple[int, int]) -> str:
+        spans = []
+        if paragraph_range[0] < paragraph_range[1]:
+            spans.append([
+                self.paragraph_spans[2 * paragraph_range[0]],
+                self.paragraph_spans[2 * paragraph_range[1] - 1]
+            ])
+        if table_range[0] < table_range[1]:
+            spans.append([
+                self.table_base + self.table_spans[2 * table_range[0]],
+                self.table_base + self.table_spans[2 * table_range[1] - 1]
+            ])
+        if len(spans) == 2 and spans[0][1] + 2 == spans[1][0]:
+            spans = [[spans[0][0], spans[1][1]]]
+        return "\n\n".join([self.text[start:end] for start, end in spans]).strip()
+
+    def to_units(self) -> dict:
+        return {
+            "paragraphs": self.paragraphs(),
+            "tables": [self.rows(index) for index in range(self.table_count)]
+        }
+
+    def to_cache(self) -> dict:
+        entry = {"text": self.text, "table_base": self.table_base}
+        for name in MODEL_ARRAYS:
+            entry[name] = base64.b64encode(getattr(self, name).tobytes()).decode("ascii")
+        return entry
+
+    @classmethod
+    def from_cache(cls, entry: dict) -> Optional["DocumentModel"]:
+        try:
+            arrays = {}
+            for name in MODEL_ARRAYS:
+                values = array(OFFSET_TYPE)
+                values.frombytes(base64.b64decode(entry[name]))
+                arrays[name] = values
+            return cls(entry["text"], int(entry["table_base"]), arrays)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+class DocumentBuilder:
+    def __init__(self):
+        self.paragraph_text = TextBuffer()
+        self.table_text = TextBuffer()
+        self.arrays = {name: array(OFFSET_TYPE) for name in MODEL_ARRAYS}
+        self.arrays["table_rows"].append(0)
+        self.arrays["row_cells"].append(0)
+        self.table_start = None
+
+    def add_paragraph(self, text: str) -> None:
+        buffer = self.paragraph_text
+        spans = self.arrays["paragraph_spans"]
+        if spans:
+            buffer.write("\n")
+        spans.append(buffer.length)
+        buffer.write(text)
+        spans.append(buffer.length)
+
+    def begin_table(self) -> None:
+        if len(self.arrays["table_rows"]) > 1:
+            self.table_text.write("\n\n")
+        self.table_start = self.table_text.length
+
+    def add_row(self, cells: Iterable[str]) -> None:
+        buffer = self.table_text
+        row_cells = self.arrays["row_cells"]
+        cell_spans = self.arrays["cell_spans"]
+        if len(row_cells) - 1 > self.arrays["table_rows"][-1]:
+            buffer.write("\n")
+        for index, cell in enumerate(cells):
+            if index:
+                buffer.write("\t")
+            cell_spans.append(buffer.length)
+            buffer.write(cell)
+            cell_spans.append(buffer.length)
+        row_cells.append(len(cell_spans) // 2)
+
+    def end_table(self) -> None:
+        self.arrays["table_spans"].extend([self.table_start, self.table_text.length])
+        self.arrays["table_rows"].append(len(self.arrays["row_cells"]) - 1)
+        self.table_start = None
+
+    def add_table(self, rows: Iterable[Iterable[str]]) -> None:
+        self.begin_table()
+        for cells in rows:
+            self.add_row(cells)
+        self.end_table()
+
+    def build(self) -> DocumentModel:
+        paragraph_text = self.paragraph_text.getvalue()
+        table_text = self.table_text.getvalue()
+        self.paragraph_text = TextBuffer()
+        self.table_text = TextBuffer()
+        separator = "\n\n" if self.arrays["paragraph_spans"] and len(self.arrays["table_rows"]) > 1 else ""
+        text = "".join([paragraph_text, separator, table_text])
+        return DocumentModel(text, len(paragraph_text) + len(separator), self.arrays)
+
+
+class TableSink:
+    def __init__(self, builder: DocumentBuilder, strip: bool = False):
+        self.builder = builder
+        self.strip = strip
+        self.count = 0
+        builder.begin_table()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, cells: List[str]) -> None:
+        self.builder.add_row([cell.strip() for cell in cells] if self.strip else cells)
+        self.count += 1
+
+    def close(self) -> None:
+        self.builder.end_table()
+
+
+def load_model(reader: str, file_path: str) -> Optional[DocumentModel]:
+    entry = load_units(reader, file_path)
+    return None if entry is None else DocumentModel.from_cache(entry)
+
+
+def store_model(reader: str, file_path: str, model: DocumentModel) -> None:
+    store_units(reader, file_path, model.to_cache())
@@ -1,9 +1,17 @@
 import argparse
-import json
 import os
 import sys
-from typing import Optional, Tuple
-import win32com.client
+from typing import Callable, Iterator, Optional, Tuple
+from chunking import ChunkBudget, check_budget, collect_document_chunk, estimate_tokens, format_cursor, parse_cursor
+from daemon_client import run_via_daemon
+from document_model import DocumentBuilder, DocumentModel, load_model, store_model
+from json_output import OUTPUT_FORMATS, write_records, write_result
+from profiling import add_bytes_read, finish_profile, profile_phase, profile_session, profile_stream
+from text_search import SearchCollector, check_max_hits, compile_search, search_document
+from word_binary import read_word_binary
+from word_pool import get_word_pool
+
+ENGINES = ["native", "com"]
 
 
 def parse_bool(value: str) -> bool:
@@ -29,6 +37,143 @@ def normalize_range(total: int, start: Optional[int], end: Optional[int]) -> Tup
     return start - 1, end
 
 
+def read_doc_units(doc) -> DocumentModel:
+    builder = DocumentBuilder()
+    for text in doc.Content.Text.split("\r"):
+        text = text.replace("\x07", "").strip()
+        if text:
+            builder.add_paragraph(text)
+
+    for table in doc.Tables:
+        builder.begin_table()
+        for r in range(1, table.Rows.Count + 1):
+            cells = table.Rows(r).Range.Text.split("\r\x07")[:-2]
+            builder.add_row([cell.replace("\r", "").strip() for cell in cells])
+        builder.end_table()
+    return builder.build()
+
+
+def read_doc_statistics(doc) -> Tuple[list, list, list]:
+    paragraph_lengths = []
+    for text in doc.Content.Text.split("\r"):
+        text = text.replace("\x07", "").strip()
+        if text:
+            paragraph_lengths.append(len(text))
+    table_row_counts = []
+    table_lengths = []
+    for table in doc.Tables:
+        row_count = table.Rows.Count
+        cells = table.Range.Text.split("\r\x07")[:-1]
+        cell_count = len(cells) - row_count
+        text_length = sum(len(cell.replace("\r", "").strip()) for cell in cells)
+        table_row_counts.append(row_count)
+        table_lengths.append(text_length + max(cell_count - row_count, 0) + max(row_count - 1, 0))
+    return paragraph_lengths, table_row_counts, table_lengths
+
+
+def read_doc_file(file_path: str, engine: str = "native") -> DocumentModel:
+    if engine == "native":
+        with profile_phase("parse_binary"):
+            model = read_word_binary(file_path)
+        add_bytes_read("source", os.path.getsize(file_path))
+        return model
+    with profile_phase("word_com"):
+        return get_word_pool().run(file_path, read_doc_units)
+
+
+def extract_doc_chunk(
+    file_path: str,
+    paragraph_start: Optional[int],
+    paragraph_end: Optional[int],
+    table_start: Optional[int],
+    table_end: Optional[int],
+    include_content: bool,
+    output_mode: str,
+    use_cache: bool,
+    engine: str,
+    max_chars: Optional[int],
+    max_tokens: Optional[int],
+    cursor: Optional[str]
+) -> dict:
+    positions = {"paragraph": 0, "table": 0, "row": 0}
+    resumed = None
+    error = check_budget(max_chars, max_tokens)
+    if error is None and cursor:
+        try:
+            resumed = parse_cursor(cursor, file_path, ["paragraph", "table", "row"])
+        except ValueError as exc:
+            error = str(exc)
+
+    cache_reader = "doc" if engine == "native" else "doc-com"
+    model = None
+    if error is None:
+        model = load_model(cache_reader, file_path) if use_cache else None
+        if model is None:
+            try:
+                model = read_doc_file(file_path, engine)
+            except Exception as exc:
+                error = str(exc)
+            else:
+                if use_cache:
+                    store_model(cache_reader, file_path, model)
+    if error:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "content": "",
+            "paragraphs": [],
+            "tables": [],
+            "statistics": {
+                "paragraph_count": 0,
+                "table_count": 0,
+                "table_row_counts": [],
+                "char_count": 0
+            },
+            "next_cursor": None,
+            "error": error
+        }
+
+    paragraph_start_index, paragraph_end_index = normalize_range(model.paragraph_count, paragraph_start, paragraph_end)
+    table_start_index, table_end_index = normalize_range(model.table_count, table_start, table_end)
+    positions = {"paragraph": paragraph_start_index, "table": table_start_index, "row": 0}
+    if resumed is not None:
+        if "paragraph" in resumed:
+            positions["paragraph"] = max(paragraph_start_index, resumed["paragraph"])
+        else:
+            positions = {"table": max(table_start_index, resumed.get("table", 0)), "row": resumed.get("row", 0)}
+    chunk = collect_document_chunk(
+        model.iter_paragraphs(positions.get("paragraph", 0), paragraph_end_index),
+        lambda start, row_start: model.iter_tables(start, table_end_index, row_start),
+        positions,
+        ChunkBudget(max_chars, max_tokens)
+    )
+
+    content_parts = []
+    if chunk["paragraphs"]:
+        content_parts.append("\n".join(chunk["paragraphs"]))
+    if chunk["tables"]:
+        content_parts.append("\n\n".join(chunk["tables"]))
+    content = "\n\n".join(content_parts).strip()
+    return {
+        "success": True,
+        "file_path": file_path,
+        "content": content if output_mode == "full" and include_content else "",
+        "paragraphs": chunk["paragraphs"] if output_mode == "list" else [],
+        "tables": chunk["tables"] if output_mode == "list" else [],
+        "statistics": {
+            "paragraph_count": len(chunk["paragraphs"]),
+            "table_count": len(chunk["tables"]),
+            "paragraph_range": chunk["paragraph_range"],
+            "table_range": chunk["table_range"],
+            "table_row_ranges": chunk["table_row_ranges"],
+            "char_count": len(content),
+            "token_count": estimate_tokens(content)
+        },
+        "next_cursor": format_cursor(file_path, chunk["next"]) if chunk["next"] else None,
+        "error": None
+    }
+
+
 def extract_doc(
     file_path: str,
     paragraph_start: Optional[int] = None,
@@ -36,7 +181,12 @@ def extract_doc(
     table_start: Optional[int] = None,
     table_end: Optional[int] = None,
     include_content: bool = True,
-    output_mode: str = "full"
+    output_mode: str = "full",
+    use_cache: bool = True,
+    engine: str = "native",
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[str] = None
 ) -> dict:
     if not os.path.isfile(file_path):
         return {
@@ -86,11 +236,7 @@ def extract_doc(
             "error": 'output_mode 仅限 ["full", "list"]'
         }
 
-    try:
-        word_app = win32com.client.Dispatch("Word.Application")
-        word_app.Visible = False
-        doc = word_app.Documents.Open(os.path.abspath(file_path), ReadOnly=True)
-    except Exception as exc:
+    if engine not in ENGINES:
         return {
             "success": False,
             "file_path": file_path,
@@ -103,56 +249,91 @@ def extract_doc(
                 "table_row_counts": [],
                 "char_count": 0
             },
-            "error": str(exc)
+            "error": 'engine 仅限 ["native", "com"]'
         }
 
-    paragraphs = []
-    tables = []
-    table_row_counts = []
+    if max_chars is not None or max_tokens is not None or cursor is not None:
+        return extract_doc_chunk(
+            file_path, paragraph_start, paragraph_end, table_start, table_end, include_content, output_mode,
+            use_cache, engine, max_chars, max_tokens, cursor
+        )
 
-    try:
-        for para in doc.Paragraphs:
-            text = para.Range.Text.strip()
-            if text:
-                paragraphs.append(text)
-
-        for table in doc.Tables:
-            table_rows = []
-            for r in range(1, table.Rows.Count + 1):
-                row_obj = table.Rows(r)
-                row_cells = []
-                for cell in row_obj.Cells:
-                    cell_text = cell.Range.Text
-                    cell_text = cell_text.replace("\r", "").replace("\x07", "").strip()
-                    row_cells.append(cell_text)
-                table_rows.append(row_cells)
-            tables.append(table_rows)
-            table_row_counts.append(len(table_rows))
-    finally:
-        doc.Close(False)
-        word_app.Quit()
-
-    paragraph_start_index, paragraph_end_index = normalize_range(
-        len(paragraphs), paragraph_start, paragraph_end
-    )
-    table_start_index, table_end_index = normalize_range(len(tables), table_start, table_end)
+    cache_reader = "doc" if engine == "native" else "doc-com"
+    model = load_model(cache_reader, file_path) if use_cache else None
+    if model is None and engine == "com" and not include_content and output_mode == "full":
+        try:
+            with profile_phase("word_com"):
+                paragraph_lengths, table_row_counts, table_lengths = get_word_pool().run(file_path, read_doc_statistics)
+        except Exception as exc:
+            return {
+                "success": False,
+                "file_path": file_path,
+                "content": "",
+                "paragraphs": [],
+                "tables": [],
+                "statistics": {
+                    "paragraph_count": 0,
+                    "table_count": 0,
+                    "table_row_counts": [],
+                    "char_count": 0
+                },
+                "error": str(exc)
+            }
 
-    selected_paragraphs = paragraphs[paragraph_start_index:paragraph_end_index]
-    selected_tables = tables[table_start_index:table_end_index]
-    selected_table_row_counts = table_row_counts[table_start_index:table_end_index]
+        paragraph_start_index, paragraph_end_index = normalize_range(
+            len(paragraph_lengths), paragraph_start, paragraph_end
+        )
+        table_start_index, table_end_index = normalize_range(
+            len(table_row_counts), table_start, table_end
+        )
+        selected_paragraph_lengths = paragraph_lengths[paragraph_start_index:paragraph_end_index]
+        selected_table_lengths = table_lengths[table_start_index:table_end_index]
+        char_count = sum(selected_paragraph_lengths) + max(len(selected_paragraph_lengths) - 1, 0)
+        if selected_table_lengths:
+            table_char_count = sum(selected_table_lengths) + 2 * (len(selected_table_lengths) - 1)
+            char_count += table_char_count + (2 if char_count else 0)
 
-    table_text_blocks = []
-    for table in selected_tables:
-        rows = ["\t".join(cells) for cells in table]
-        table_text_blocks.append("\n".join(rows))
+        return {
+            "success": True,
+            "file_path": file_path,
+            "content": "",
+            "paragraphs": [],
+            "tables": [],
+            "statistics": {
+                "paragraph_count": len(selected_paragraph_lengths),
+                "table_count": table_end_index - table_start_index,
+                "table_row_counts": table_row_counts[table_start_index:table_end_index],
+                "char_count": char_count,
+                "char_count_estimated": True
+            },
+            "error": None
+        }
 
-    content_parts = []
-    if selected_paragraphs:
-        content_parts.append("\n".join(selected_paragraphs))
-    if table_text_blocks:
-        content_parts.append("\n\n".join(table_text_blocks))
+    if model is None:
+        try:
+            model = read_doc_file(file_path, engine)
+        except Exception as exc:
+            return {
+                "success": False,
+                "file_path": file_path,
+                "content": "",
+                "paragraphs": [],
+                "tables": [],
+                "statistics": {
+                    "paragraph_count": 0,
+                    "table_count": 0,
+                    "table_row_counts": [],
+                    "char_count": 0
+                },
+                "error": str(exc)
+            }
+        if use_cache:
+            store_model(cache_reader, file_path, model)
 
-    content = "\n\n".join(content_parts).strip()
+    paragraph_range = normalize_range(model.paragraph_count, paragraph_start, paragraph_end)
+    table_range = normalize_range(model.table_count, table_start, table_end)
+
+    content = model.content(paragraph_range, table_range)
     char_count = len(content)
     if output_mode != "full" or not include_content:
         content = ""
@@ -161,19 +342,196 @@ def extract_doc(
         "success": True,
         "file_path": file_path,
         "content": content if output_mode == "full" else "",
-        "paragraphs": selected_paragraphs if output_mode == "list" else [],
-        "tables": selected_tables if output_mode == "list" else [],
+        "paragraphs": model.paragraphs(*paragraph_range) if output_mode == "list" else [],
+        "tables": [model.rows(index) for index in range(*table_range)] if output_mode == "list" else [],
         "statistics": {
-            "paragraph_count": len(selected_paragraphs),
-            "table_count": len(selected_tables),
-            "table_row_counts": selected_table_row_counts,
+            "paragraph_count": paragraph_range[1] - paragraph_range[0],
+            "table_count": table_range[1] - table_range[0],
+            "table_row_counts": model.table_row_counts(*table_range),
             "char_count": char_count
         },
         "error": None
     }
 
 
-def main():
+def search_doc(
+    file_path: str,
+    pattern: str,
+    use_regex: bool = False,
+    ignore_case: bool = False,
+    max_hits: Optional[int] = 100,
+    paragraph_start: Optional[int] = None,
+    paragraph_end: Optional[int] = None,
+    table_start: Optional[int] = None,
+    table_end: Optional[int] = None,
+    use_cache: bool = True,
+    engine: str = "native",
+    cursor: Optional[str] = None
+) -> dict:
+    error = None
+    regex = None
+    resumed = None
+    if not os.path.isfile(file_path):
+        error = "文件不存在"
+    elif not file_path.lower().endswith(".doc"):
+        error = "仅支持.doc格式"
+    elif engine not in ENGINES:
+        error = 'engine 仅限 ["native", "com"]'
+    else:
+        error = check_max_hits(max_hits)
+    if error is None:
+        try:
+            regex = compile_search(pattern, use_regex, ignore_case)
+            if cursor:
+                resumed = parse_cursor(cursor, file_path, ["paragraph", "table", "row", "offset"])
+        except ValueError as exc:
+            error = str(exc)
+
+    cache_reader = "doc" if engine == "native" else "doc-com"
+    model = None
+    if error is None:
+        model = load_model(cache_reader, file_path) if use_cache else None
+        if model is None:
+            try:
+                model = read_doc_file(file_path, engine)
+            except Exception as exc:
+                error = str(exc)
+            else:
+                if use_cache:
+                    store_model(cache_reader, file_path, model)
+    if error:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "hits": [],
+            "statistics": {
+                "unit_count": 0,
+                "hit_count": 0
+            },
+            "next_cursor": None,
+            "error": error
+        }
+
+    paragraph_start_index, paragraph_end_index = normalize_range(model.paragraph_count, paragraph_start, paragraph_end)
+    table_start_index, table_end_index = normalize_range(model.table_count, table_start, table_end)
+    positions = {"paragraph": paragraph_start_index, "table": table_start_index, "row": 0}
+    if resumed is not None:
+        if "paragraph" in resumed:
+            positions["paragraph"] = max(paragraph_start_index, resumed["paragraph"])
+            positions["offset"] = resumed.get("offset", 0) if positions["paragraph"] == resumed["paragraph"] else 0
+        else:
+            positions = {"table": max(table_start_index, resumed.get("table", 0))}
+            positions["row"] = resumed.get("row", 0) if positions["table"] == resumed.get("table", 0) else 0
+            positions["offset"] = resumed.get("offset", 0) if positions["row"] == resumed.get("row", 0) else 0
+    collector = SearchCollector(regex, max_hits)
+    next_position = search_document(
+        collector,
+        model.iter_paragraphs(positions.get("paragraph", 0), paragraph_end_index),
+        lambda start, row_start: model.iter_tables(start, table_end_index, row_start),
+        positions
+    )
+    return {
+        "success": True,
+        "file_path": file_path,
+        "hits": collector.hits,
+        "statistics": {
+            "unit_count": collector.unit_count,
+            "hit_count": len(collector.hits)
+        },
+        "next_cursor": format_cursor(file_path, next_position) if next_position is not None else None,
+        "error": None
+    }
+
+
+def stream_doc(
+    file_path: str,
+    paragraph_start: Optional[int] = None,
+    paragraph_end: Optional[int] = None,
+    table_start: Optional[int] = None,
+    table_end: Optional[int] = None,
+    include_content: bool = True,
+    engine: str = "native"
+) -> Iterator[dict]:
+    model = None
+    error = None
+    if not os.path.isfile(file_path):
+        error = "文件不存在"
+    elif not file_path.lower().endswith(".doc"):
+        error = "仅支持.doc格式"
+    elif engine not in ENGINES:
+        error = 'engine 仅限 ["native", "com"]'
+    else:
+        try:
+            model = read_doc_file(file_path, engine)
+        except Exception as exc:
+            error = str(exc)
+    if error:
+        yield {
+            "type": "statistics",
+            "success": False,
+            "file_path": file_path,
+            "statistics": {
+                "paragraph_count": 0,
+                "table_count": 0,
+                "table_row_counts": [],
+                "char_count": 0
+            },
+            "error": error
+        }
+        return
+
+    paragraph_start_index, paragraph_end_index = normalize_range(model.paragraph_count, paragraph_start, paragraph_end)
+    table_start_index, table_end_index = normalize_range(model.table_count, table_start, table_end)
+
+    paragraph_chars = 0
+    for index, text in model.iter_paragraphs(paragraph_start_index, paragraph_end_index):
+        paragraph_chars += len(text) + (1 if index > paragraph_start_index else 0)
+        record = {
+            "type": "paragraph",
+            "paragraph_index": index + 1,
+            "char_count": len(text)
+        }
+        if include_content:
+            record["text"] = text
+        yield record
+
+    table_row_counts = []
+    table_chars = 0
+    for index in range(table_start_index, table_end_index):
+        table_text = model.table_text(index)
+        row_count = model.table_row_counts(index, index + 1)[0]
+        table_chars += len(table_text) + (2 if table_row_counts else 0)
+        table_row_counts.append(row_count)
+        record = {
+            "type": "table",
+            "table_index": index + 1,
+            "row_count": row_count,
+            "char_count": len(table_text)
+        }
+        if include_content:
+            record["text"] = table_text
+            record["rows"] = model.rows(index)
+        yield record
+
+    char_count = paragraph_chars + table_chars
+    if paragraph_end_index > paragraph_start_index and table_row_counts:
+        char_count += 2
+
+    yield {
+        "type": "statistics",
+        "success": True,
+        "file_path": file_path,
+        "statistics": {
+            "paragraph_count": paragraph_end_index - paragraph_start_index,
+            "table_count": len(table_row_counts),
+            "table_row_counts": table_row_counts,
+            "char_count": char_count
+        },
+        "error": None
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("file_path")
     parser.add_argument("--paragraph-start", type=int, default=None)
@@ -182,18 +540,81 @@ def main():
     parser.add_argument("--table-end", type=int, default=None)
     parser.add_argument("--include-content", type=parse_bool, default=True)
     parser.add_argument("--output-mode", choices=["full", "list"], default="full")
+    parser.add_argument("--cache", type=parse_bool, default=True)
+    parser.add_argument("--stream", type=parse_bool, default=False)
+    parser.add_argument("--engine", choices=ENGINES, default="native")
+    parser.add_argument("--max-chars", type=int, default=None)
+    parser.add_argument("--max-tokens", type=int, default=None)
+    parser.add_argument("--cursor", default=None)
+    parser.add_argument("--search", default=None)
+    parser.add_argument("--regex", type=parse_bool, default=False)
+    parser.add_argument("--ignore-case", type=parse_bool, default=False)
+    parser.add_argument("--max-hits", type=int, default=100)
+    parser.add_argument("--profile", type=parse_bool, default=False)
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="pretty")
+    return parser
 
-    args = parser.parse_args()
-    result = extract_doc(
+
+def run_cli(args: argparse.Namespace, write: Optional[Callable[[dict], None]] = None) -> dict:
+    with profile_session("doc", args.file_path, args.profile) as profiler:
+        result = run_reader(args)
+    return finish_profile(profiler, result, args.profile, write)
+
+
+def run_reader(args: argparse.Namespace) -> dict:
+    if args.search is not None:
+        return search_doc(
+            args.file_path,
+            args.search,
+            use_regex=args.regex,
+            ignore_case=args.ignore_case,
+            max_hits=args.max_hits,
+            paragraph_start=args.paragraph_start,
+            paragraph_end=args.paragraph_end,
+            table_start=args.table_start,
+            table_end=args.table_end,
+            use_cache=args.cache,
+            engine=args.engine,
+            cursor=args.cursor
+        )
+    return extract_doc(
         args.file_path,
         paragraph_start=args.paragraph_start,
         paragraph_end=args.paragraph_end,
         table_start=args.table_start,
         table_end=args.table_end,
         include_content=args.include_content,
-        output_mode=args.output_mode
+        output_mode=args.output_mode,
+        use_cache=args.cache,
+        engine=args.engine,
+        max_chars=args.max_chars,
+        max_tokens=args.max_tokens,
+        cursor=args.cursor
     )
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+def stream_cli(args: argparse.Namespace) -> Iterator[dict]:
+    return profile_stream("doc", args.file_path, args.profile, stream_doc(
+        args.file_path,
+        paragraph_start=args.paragraph_start,
+        paragraph_end=args.paragraph_end,
+        table_start=args.table_start,
+        table_end=args.table_end,
+        include_content=args.include_content,
+        engine=args.engine
+    ))
+
+
+def main():
+    run_via_daemon("doc")
+    args = build_parser().parse_args()
+    if args.stream:
+        record = write_records(stream_cli(args), args.output_format, sys.stdout, sys.stderr)
+        if not record.get("success", True):
+            sys.exit(1)
+        return
+
+    result = run_cli(args, lambda result: write_result(result, args.output_format, sys.stdout, sys.stderr))
 
     if not result["success"]:
         sys.exit(1)
@@ -0,0 +1,355 @@
+import re
+import struct
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+from document_model import DocumentBuilder, DocumentModel
+
+CFB_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+FREESECT = 0xFFFFFFFF
+ENDOFCHAIN = 0xFFFFFFFE
+NOSTREAM = 0xFFFFFFFF
+
+STGTY_STREAM = 2
+STGTY_ROOT = 5
+
+WORD_IDENT = 0xA5EC
+NFIB_WORD97 = 0x00C1
+FIB_ENCRYPTED = 0x0100
+FIB_WHICH_TABLE = 0x0200
+
+SPRM_P_IN_TABLE = 0x2416
+SPRM_P_TTP = 0x2417
+SPRM_P_ITAP = 0x6649
+SPRM_T_DEF_TABLE = 0xD608
+SPRM_P_CHG_TABS = 0xC615
+SPRM_OPERAND_SIZES = {0: 1, 1: 1, 2: 2, 3: 4, 4: 2, 5: 2, 7: 3}
+
+PARAGRAPH_MARKS = re.compile("[\r\x07]")
+FIELD_CHARS = re.compile("[\x13\x14\x15]")
+TEXT_TRANSLATION = {
+    0x01: None, 0x02: None, 0x03: None, 0x04: None, 0x05: None, 0x06: None,
+    0x08: None, 0x0B: "\n", 0x0C: "\n", 0x0E: "\n", 0x1E: "-", 0x1F: None
+}
+
+
+class WordBinaryError(Exception):
+    pass
+
+
+class CompoundFile:
+    def __init__(self, data: bytes):
+        if len(data) < 512 or data[:8] != CFB_SIGNATURE:
+            raise WordBinaryError("不是有效的OLE2复合文档")
+        self.data = data
+        self.sector_size = 1 << struct.unpack_from("<H", data, 0x1E)[0]
+        self.mini_sector_size = 1 << struct.unpack_from("<H", data, 0x20)[0]
+        (
+            fat_sector_count,
+            first_directory_sector,
+            _,
+            self.mini_stream_cutoff,
+            first_mini_fat_sector,
+            _,
+            first_difat_sector,
+            difat_sector_count
+        ) = struct.unpack_from("<IIIIIIII", data, 0x2C)
+
+        fat_sectors = [s for s in struct.unpack_from("<109I", data, 0x4C) if s != FREESECT]
+        entries_per_sector = self.sector_size // 4
+        sector = first_difat_sector
+        for _ in range(difat_sector_count):
+            if sector in (FREESECT, ENDOFCHAIN):
+                break
+            values = struct.unpack_from("<{0}I".format(entries_per_sector), self.sector(sector))
+            fat_sectors.extend(v for v in values[:-1] if v != FREESECT)
+            sector = values[-1]
+        fat_sectors = fat_sectors[:fat_sector_count]
+
+        fat = []
+        for sector in fat_sectors:
+            fat.extend(struct.unpack_from("<{0}I".format(entries_per_sector), self.sector(sector)))
+        self.fat = fat
+
+        directory = self.read_chain(first_directory_sector, self.fat, self.sector_size, self.sector)
+        self.entries = []
+        for offset in range(0, len(directory) - 127, 128):
+            name_length = struct.unpack_from("<H", directory, offset + 64)[0]
+            name = directory[offset:offset + max(0, name_length - 2)].decode("utf-16-le", "replace")
+            entry_type = directory[offset + 66]
+            left, right, child = struct.unpack_from("<III", directory, offset + 68)
+            start, size = struct.unpack_from("<II", directory, offset + 116)
+            self.entries.append((name, entry_type, left, right, child, start, size))
+        if not self.entries or self.entries[0][1] != STGTY_ROOT:
+            raise WordBinaryError("OLE2目录损坏")
+
+        root = self.entries[0]
+        self.mini_fat = []
+        if first_mini_fat_sector not in (FREESECT, ENDOFCHAIN):
+            mini_fat = self.read_chain(first_mini_fat_sector, self.fat, self.sector_size, self.sector)
+            self.mini_fat = list(struct.unpack_from("<{0}I".format(len(mini_fat) // 4), mini_fat))
+        self.mini_stream = b""
+        if root[5] not in (FREESECT, ENDOFCHAIN):
+            self.mini_stream = self.read_chain(root[5], self.fat, self.sector_size, self.sector)
+
+    def sector(self, index: int) -> bytes:
+        offset = (index + 1) * self.sector_size
+        return self.data[offset:offset + self.sector_size]
+
+    def mini_sector(self, index: int) -> bytes:
+        offset = index * self.mini_sector_size
+        return self.mini_stream[offset:offset + self.mini_sector_size]
+
+    @staticmethod
+    def read_chain(start: int, table: List[int], sector_size: int, read_sector, size: Optional[int] = None) -> bytes:
+        parts = []
+        sector = start
+        limit = len(table) + 1
+        while sector not in (ENDOFCHAIN, FREESECT) and limit > 0:
+            if sector >= len(table):
+                raise WordBinaryError("OLE2扇区链损坏")
+            parts.append(read_sector(sector))
+            sector = table[sector]
+            limit -= 1
+        data = b"".join(parts)
+        return data if size is None else data[:size]
+
+    def root_streams(self) -> Dict[str, int]:
+        streams = {}
+        pending = [self.entries[0][4]]
+        visited = set()
+        while pending:
+            index = pending.pop()
+            if index == NOSTREAM or index >= len(self.entries) or index in visited:
+                continue
+            visited.add(index)
+            name, entry_type, left, right, _, _, _ = self.entries[index]
+            if entry_type == STGTY_STREAM:
+                streams[name] = index
+            pending.append(left)
+            pending.append(right)
+        return streams
+
+    def open_stream(self, name: str) -> bytes:
+        index = self.root_streams().get(name)
+        if index is None:
+            raise KeyError(name)
+        _, _, _, _, _, start, size = self.entries[index]
+        if size < self.mini_stream_cutoff:
+            return self.read_chain(start, self.mini_fat, self.mini_sector_size, self.mini_sector, size)
+        return self.read_chain(start, self.fat, self.sector_size, self.sector, size)
+
+
+def parse_sprms(grpprl: bytes) -> Dict[int, int]:
+    properties = {}
+    offset = 0
+    while offset + 2 <= len(grpprl):
+        sprm = struct.unpack_from("<H", grpprl, offset)[0]
+        offset += 2
+        spra = sprm >> 13
+        if spra == 6:
+            if sprm == SPRM_T_DEF_TABLE and offset + 2 <= len(grpprl):
+                size = struct.unpack_from("<H", grpprl, offset)[0] + 1
+            elif offset < len(grpprl):
+                size = grpprl[offset] + 1
+                if sprm == SPRM_P_CHG_TABS and grpprl[offset] == 255:
+                    break
+            else:
+                break
+            offset += size
+            continue
+        size = SPRM_OPERAND_SIZES[spra]
+        if offset + size > len(grpprl):
+            break
+        if sprm in (SPRM_P_IN_TABLE, SPRM_P_TTP):
+            properties[sprm] = grpprl[offset]
+        elif sprm == SPRM_P_ITAP:
+            properties[sprm] = struct.unpack_from("<i", grpprl, offset)[0]
+        offset += size
+    return properties
+
+
+def read_paragraph_runs(word_stream: bytes, table_stream: bytes, fc: int, lcb: int) -> Tuple[List[int], List[Tuple[int, bool, bool]]]:
+    starts = []
+    runs = []
+    if lcb < 8 or fc + lcb > len(table_stream):
+        return starts, runs
+    count = (lcb - 4) // 8
+    page_numbers = struct.unpack_from("<{0}I".format(count), table_stream, fc + 4 * (count + 1))
+    for page_number in page_numbers:
+        offset = (page_number & 0x3FFFFF) * 512
+        page = word_stream[offset:offset + 512]
+        if len(page) < 512:
+            continue
+        crun = page[511]
+        fcs = struct.unpack_from("<{0}I".format(crun + 1), page, 0)
+        bx_base = 4 * (crun + 1)
+        for index in range(crun):
+            papx_offset = page[bx_base + 13 * index] * 2
+            in_table = False
+            ttp = False
+            if papx_offset:
+                cb = page[papx_offset]
+                if cb == 0:
+                    grpprl_start = papx_offset + 2
+                    grpprl_size = 2 * page[papx_offset + 1]
+                else:
+                    grpprl_start = papx_offset + 1
+                    grpprl_size = 2 * cb - 1
+                properties = parse_sprms(page[grpprl_start + 2:grpprl_start + grpprl_size])
+                in_table = bool(properties.get(SPRM_P_IN_TABLE)) or properties.get(SPRM_P_ITAP, 0) > 0
+                ttp = bool(properties.get(SPRM_P_TTP))
+            starts.append(fcs[index])
+            runs.append((fcs[index + 1], in_table, ttp))
+    order = sorted(range(len(starts)), key=starts.__getitem__)
+    return [starts[i] for i in order], [runs[i] for i in order]
+
+
+def read_pieces(word_stream: bytes, table_stream: bytes, fc_clx: int, lcb_clx: int, ccp_text: int):
+    clx = table_stream[fc_clx:fc_clx + lcb_clx]
+    offset = 0
+    while offset < len(clx) and clx[offset] == 0x01:
+        offset += 3 + struct.unpack_from("<H", clx, offset + 1)[0]
+    if offset >= len(clx) or clx[offset] != 0x02:
+        raise WordBinaryError("文档片段表损坏")
+    lcb = struct.unpack_from("<I", clx, offset + 1)[0]
+    plc = clx[offset + 5:offset + 5 + lcb]
+    count = (lcb - 4) // 12
+    cps = struct.unpack_from("<{0}I".format(count + 1), plc, 0)
+    pieces = []
+    for index in range(count):
+        cp_start = cps[index]
+        cp_end = min(cps[index + 1], ccp_text)
+        if cp_start >= cp_end:
+            continue
+        raw_fc = struct.unpack_from("<I", plc, 4 * (count + 1) + 8 * index + 2)[0]
+        compressed = bool(raw_fc & 0x40000000)
+        fc = raw_fc & 0x3FFFFFFF
+        length = cp_end - cp_start
+        if compressed:
+            fc //= 2
+            text = word_stream[fc:fc + length].decode("cp1252", "replace")
+        else:
+            text = word_stream[fc:fc + 2 * length].decode("utf-16-le", "replace")
+        pieces.append((text, fc, 1 if compressed else 2))
+    return pieces
+
+
+def strip_fields(text: str, fields: List[bool]) -> str:
+    if not fields and not FIELD_CHARS.search(text):
+        return text
+    parts = []
+    for char in text:
+        if char == "\x13":
+            fields.append(True)
+        elif char == "\x14":
+            if fields:
+                fields[-1] = False
+        elif char == "\x15":
+            if fields:
+                fields.pop()
+        elif not fields or not fields[-1]:
+            parts.append(char)
+    return "".join(parts)
+
+
+def read_word_binary(file_path: str) -> DocumentModel:
+    with open(file_path, "rb") as handle:
+        data = handle.read()
+    compound = CompoundFile(data)
+    try:
+        word_stream = compound.open_stream("WordDocument")
+    except KeyError:
+        raise WordBinaryError("缺少WordDocument流，不是Word文档")
+    if len(word_stream) < 0x1AA:
+        raise WordBinaryError("Word文档头损坏")
+    ident, nfib = struct.unpack_from("<HH", word_stream, 0)
+    flags = struct.unpack_from("<H", word_stream, 0x0A)[0]
+    if ident != WORD_IDENT:
+        raise WordBinaryError("Word文档头损坏")
+    if nfib < NFIB_WORD97:
+        raise WordBinaryError("不支持Word 95及更早版本的.doc文件")
+    if flags & FIB_ENCRYPTED:
+        raise WordBinaryError("文档已加密，无法读取")
+
+    offset = 32
+    csw = struct.unpack_from("<H", word_stream, offset)[0]
+    offset += 2 + 2 * csw
+    cslw = struct.unpack_from("<H", word_stream, offset)[0]
+    ccp_text = struct.unpack_from("<i", word_stream, offset + 2 + 12)[0]
+    offset += 2 + 4 * cslw
+    fc_lcb_base = offset + 2
+    fc_papx, lcb_papx = struct.unpack_from("<II", word_stream, fc_lcb_base + 4 * 26)
+    fc_clx, lcb_clx = struct.unpack_from("<II", word_stream, fc_lcb_base + 4 * 66)
+
+    table_name = "1Table" if flags & FIB_WHICH_TABLE else "0Table"
+    try:
+        table_stream = compound.open_stream(table_name)
+    except KeyError:
+        raise WordBinaryError("缺少{0}流".format(table_name))
+
+    pieces = read_pieces(word_stream, table_stream, fc_clx, lcb_clx, max(ccp_text, 0))
+    run_starts, runs = read_paragraph_runs(word_stream, table_stream, fc_papx, lcb_papx)
+
+    builder = DocumentBuilder()
+    in_table_rows = False
+    row_cells = []
+    cell_parts = []
+    pending = []
+    fields = []
+
+    for text, fc, char_size in pieces:
+        last = 0
+        for match in PARAGRAPH_MARKS.finditer(text):
+            pending.append(text[last:match.start()])
+            last = match.end()
+            paragraph_text = strip_fields("".join(pending), fields).translate(TEXT_TRANSLATION)
+            pending = []
+
+            in_table = False
+            ttp = False
+            mark_fc = fc + match.start() * char_size
+            run_index = bisect_right(run_starts, mark_fc) - 1
+            if run_index >= 0 and mark_fc < runs[run_index][0]:
+                _, in_table, ttp = runs[run_index]
+
+            if match.group() == "\x07":
+                if ttp:
+                    if cell_parts:
+                        row_cells.append("".join(cell_parts).strip())
+                        cell_parts = []
+                    if not in_table_rows:
+                        builder.begin_table()
+                        in_table_rows = True
+                    builder.add_row(row_cells)
+                    row_cells = []
+                    continue
+                cell_parts.append(paragraph_text)
+                row_cells.append("".join(cell_parts).strip())
+                cell_parts = []
+            elif in_table:
+                cell_parts.append(paragraph_text)
+            elif in_table_rows or row_cells:
+                if not in_table_rows:
+                    builder.begin_table()
+                if row_cells:
+                    builder.add_row(row_cells)
+                    row_cells = []
+                builder.end_table()
+                in_table_rows = False
+
+            paragraph_text = paragraph_text.strip()
+            if paragraph_text:
+                builder.add_paragraph(paragraph_text)
+        pending.append(text[last:])
+
+    paragraph_text = strip_fields("".join(pending), fields).translate(TEXT_TRANSLATION).strip()
+    if paragraph_text:
+        builder.add_paragraph(paragraph_text)
+    if row_cells:
+        if not in_table_rows:
+            builder.begin_table()
+            in_table_rows = True
+        builder.add_row(row_cells)
+    if in_table_rows:
+        builder.end_table()
+    return builder.build()
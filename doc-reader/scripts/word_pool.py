@@ -0,0 +1,173 @@
+import atexit
+import os
+import queue
+import signal
+import threading
+from typing import Callable, Optional
+
+
+def default_dispatch():
+    import win32com.client
+
+    return win32com.client.Dispatch("Word.Application")
+
+
+def word_process_id(word_app) -> Optional[int]:
+    try:
+        import win32process
+
+        return win32process.GetWindowThreadProcessId(word_app.Hwnd)[1]
+    except Exception:
+        return None
+
+
+class WordInstance:
+    def __init__(self, dispatch: Callable):
+        self.dispatch = dispatch
+        self.requests = queue.Queue()
+        self.documents = 0
+        self.process_id = None
+        self.thread = threading.Thread(target=self.loop, daemon=True)
+        self.thread.start()
+
+    def loop(self) -> None:
+        try:
+            import pythoncom
+            pythoncom.CoInitialize()
+        except ImportError:
+            pythoncom = None
+        word_app = None
+        try:
+            while True:
+                item = self.requests.get()
+                if item is None:
+                    break
+                file_path, reader, replies = item
+                try:
+                    if word_app is None:
+                        word_app = self.dispatch()
+                        word_app.Visible = False
+                        self.process_id = word_process_id(word_app)
+                    doc = word_app.Documents.Open(os.path.abspath(file_path), ReadOnly=True)
+                    try:
+                        replies.put((True, reader(doc)))
+                    finally:
+                        doc.Close(False)
+                except Exception as exc:
+                    replies.put((False, exc))
+        finally:
+            if word_app is not None:
+                try:
+                    word_app.Quit()
+                except Exception:
+                    pass
+            if pythoncom is not None:
+                pythoncom.CoUninitialize()
+
+    def submit(self, file_path: str, reader: Callable) -> queue.Queue:
+        replies = queue.Queue()
+        self.documents += 1
+        self.requests.put((file_path, reader, replies))
+        return replies
+
+    def stop(self) -> None:
+        self.requests.put(None)
+
+    def kill(self) -> None:
+        if self.process_id:
+            try:
+                os.kill(self.process_id, signal.SIGTERM)
+            except OSError:
+                pass
+
+
+class WordPool:
+    def __init__(
+        self,
+        size: int = 1,
+        max_documents: int = 200,
+        timeout: Optional[float] = 120.0,
+        dispatch: Callable = default_dispatch
+    ):
+        self.size = max(1, size)
+        self.max_documents = max(1, max_documents)
+        self.timeout = timeout
+        self.dispatch = dispatch
+        self.idle = queue.LifoQueue()
+        self.lock = threading.Lock()
+        self.created = 0
+        self.recycled = 0
+        self.killed = 0
+        self.closed = False
+
+    def acquire(self) -> WordInstance:
+        with self.lock:
+            if self.idle.empty() and self.created < self.size:
+                self.created += 1
+                return WordInstance(self.dispatch)
+        return self.idle.get()
+
+    def release(self, instance: Optional[WordInstance]) -> None:
+        with self.lock:
+            if instance is None:
+                self.created -= 1
+                return
+            if self.closed or instance.documents >= self.max_documents:
+                instance.stop()
+                self.created -= 1
+                if not self.closed:
+                    self.recycled += 1
+                return
+        self.idle.put(instance)
+
+    def run(self, file_path: str, reader: Callable):
+        instance = self.acquire()
+        replies = instance.submit(file_path, reader)
+        try:
+            ok, value = replies.get(timeout=self.timeout)
+        except queue.Empty:
+            instance.kill()
+            instance.stop()
+            self.killed += 1
+            self.release(None)
+            raise TimeoutError("Word读取超时（{0}秒）".format(self.timeout))
+        self.release(instance)
+        if not ok:
+            raise value
+        return value
+
+    def close(self) -> None:
+        with self.lock:
+            self.closed = True
+        while True:
+            try:
+                instance = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            instance.stop()
+            instance.thread.join(timeout=30)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def get_word_pool() -> WordPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            timeout = env_number("DOC_READER_WORD_TIMEOUT", 120.0)
+            _pool = WordPool(
+                size=int(env_number("DOC_READER_WORD_POOL_SIZE", 1)),
+                max_documents=int(env_number("DOC_READER_WORD_MAX_DOCUMENTS", 200)),
+                timeout=timeout if timeout > 0 else None
+            )
+            atexit.register(_pool.close)
+        return _pool
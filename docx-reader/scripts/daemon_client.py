@@ -0,0 +1,86 @@
+import json
+import os
+import sys
+from typing import Callable, Dict, List, Optional
+
+FORWARDED_ENV_PREFIX = "DOC_READER_"
+FORWARDED_ENV = ["XDG_CACHE_HOME"]
+
+
+def daemon_info_path() -> str:
+    path = os.environ.get("DOC_READER_DAEMON_FILE")
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "my-agent-skills", "reader-daemon.json")
+
+
+def forwarded_environment() -> Dict[str, str]:
+    return {
+        name: value for name, value in os.environ.items()
+        if name.startswith(FORWARDED_ENV_PREFIX) or name in FORWARDED_ENV
+    }
+
+
+def request_daemon(
+    reader: str, argv: List[str], on_output: Optional[Callable[[dict], None]] = None
+) -> Optional[dict]:
+    if os.environ.get("DOC_READER_DAEMON", "").lower() in ("0", "false", "no", "n"):
+        return None
+    try:
+        with open(daemon_info_path(), "r", encoding="utf-8") as handle:
+            info = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    try:
+        from multiprocessing.connection import Client
+        connection = Client(
+            info["address"],
+            family=info["family"],
+            authkey=bytes.fromhex(info["authkey"])
+        )
+    except Exception:
+        return None
+    try:
+        connection.send({
+            "reader": reader,
+            "argv": list(argv),
+            "cwd": os.getcwd(),
+            "env": forwarded_environment()
+        })
+        while True:
+            response = connection.recv()
+            if "exit_code" in response:
+                return response
+            if on_output is not None:
+                on_output(response)
+    except Exception:
+        return None
+    finally:
+        connection.close()
+
+
+def write_response(response: dict) -> None:
+    if response.get("stderr"):
+        sys.stderr.write(response["stderr"])
+        sys.stderr.flush()
+    if response.get("stdout"):
+        sys.stdout.write(response["stdout"])
+        sys.stdout.flush()
+
+
+def run_via_daemon(reader: str) -> None:
+    written = []
+
+    def write_partial(response: dict) -> None:
+        written.append(True)
+        write_response(response)
+
+    response = request_daemon(reader, sys.argv[1:], write_partial)
+    if response is None:
+        if written:
+            sys.stderr.write("读取服务连接中断\n")
+            sys.exit(1)
+        return
+    write_response(response)
+    sys.exit(response.get("exit_code", 0))
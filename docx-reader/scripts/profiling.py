@@ -0,0 +1,268 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+LATENCY_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+_active: List["Profiler"] = []
+
+
+def trace_path() -> Optional[str]:
+    return os.environ.get("DOC_READER_TRACE") or None
+
+
+def windows_peak_rss() -> Optional[int]:
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t)
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        get_current_process = ctypes.windll.kernel32.GetCurrentProcess
+        get_current_process.restype = wintypes.HANDLE
+        get_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+        get_memory_info.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+        if not get_memory_info(get_current_process(), ctypes.byref(counters), counters.cb):
+            return None
+        return int(counters.PeakWorkingSetSize)
+    except (ImportError, AttributeError, OSError):
+        return None
+
+
+def proc_peak_rss() -> Optional[int]:
+    try:
+        with open("/proc/self/status", "rb") as handle:
+            for line in handle:
+                if line.startswith(b"VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    peak = proc_peak_rss()
+    if peak is not None:
+        return peak
+    try:
+        import resource
+    except ImportError:
+        return windows_peak_rss()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))]
+
+
+def summarize_latency(samples: List[float]) -> dict:
+    ordered = sorted(samples)
+    counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    bucket = 0
+    for value in ordered:
+        while bucket < len(LATENCY_BUCKETS_MS) and value > LATENCY_BUCKETS_MS[bucket]:
+            bucket += 1
+        counts[bucket] += 1
+    return {
+        "count": len(ordered),
+        "total_ms": round(sum(ordered), 3),
+        "min_ms": round(ordered[0], 3),
+        "max_ms": round(ordered[-1], 3),
+        "p50_ms": round(percentile(ordered, 0.5), 3),
+        "p90_ms": round(percentile(ordered, 0.9), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+        "histogram": {
+            "le_ms": LATENCY_BUCKETS_MS + [None],
+            "counts": counts
+        }
+    }
+
+
+class Profiler:
+    def __init__(self, reader: str, file_path: str):
+        self.reader = reader
+        self.file_path = file_path
+        self.phases: Dict[str, List[float]] = {}
+        self.units: Dict[str, List[float]] = {}
+        self.bytes_read: Dict[str, int] = {}
+        self.started_wall = time.perf_counter()
+        self.started_cpu = time.process_time()
+
+    def add_phase(self, name: str, wall: float, cpu: float) -> None:
+        totals = self.phases.setdefault(name, [0.0, 0.0, 0])
+        totals[0] += wall
+        totals[1] += cpu
+        totals[2] += 1
+
+    def report(self) -> dict:
+        return {
+            "wall_ms": round((time.perf_counter() - self.started_wall) * 1000, 3),
+            "cpu_ms": round((time.process_time() - self.started_cpu) * 1000, 3),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "phases": {
+                name: {
+                    "wall_ms": round(wall * 1000, 3),
+                    "cpu_ms": round(cpu * 1000, 3),
+                    "count": count
+                }
+                for name, (wall, cpu, count) in self.phases.items()
+            },
+            "units": {kind: summarize_latency(samples) for kind, samples in self.units.items()},
+            "bytes_read": dict(self.bytes_read)
+        }
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[None]:
+    if not _active:
+        yield
+        return
+    profiler = _active[-1]
+    started_wall = time.perf_counter()
+    started_cpu = time.process_time()
+    try:
+        yield
+    finally:
+        profiler.add_phase(name, time.perf_counter() - started_wall, time.process_time() - started_cpu)
+
+
+@contextmanager
+def profile_unit(kind: str) -> Iterator[None]:
+    if not _active:
+        yield
+        return
+    profiler = _active[-1]
+    started_wall = time.perf_counter()
+    started_cpu = time.process_time()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - started_wall
+        profiler.add_phase("extract_" + kind, wall, time.process_time() - started_cpu)
+        profiler.units.setdefault(kind, []).append(wall * 1000)
+
+
+def timed_iter(profiler: "Profiler", name: str, iterator: Iterator) -> Iterator:
+    wall = 0.0
+    cpu = 0.0
+    try:
+        while True:
+            started_wall = time.perf_counter()
+            started_cpu = time.process_time()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                wall += time.perf_counter() - started_wall
+                cpu += time.process_time() - started_cpu
+            yield item
+    finally:
+        profiler.add_phase(name, wall, cpu)
+
+
+def profile_iter(name: str, iterable: Iterable) -> Iterator:
+    if not _active:
+        return iter(iterable)
+    return timed_iter(_active[-1], name, iter(iterable))
+
+
+def add_bytes_read(source: str, count: int) -> None:
+    if _active:
+        bytes_read = _active[-1].bytes_read
+        bytes_read[source] = bytes_read.get(source, 0) + count
+
+
+@contextmanager
+def profile_session(reader: str, file_path: str, enabled: bool) -> Iterator[Optional[Profiler]]:
+    if not enabled and trace_path() is None:
+        yield None
+        return
+    profiler = Profiler(reader, file_path)
+    _active.append(profiler)
+    try:
+        yield profiler
+    finally:
+        _active.remove(profiler)
+
+
+def write_trace(profiler: Profiler, result: dict, timings: dict) -> None:
+    path = trace_path()
+    if path is None:
+        return
+    record = {
+        "timestamp": round(time.time(), 3),
+        "pid": os.getpid(),
+        "reader": profiler.reader,
+        "file_path": profiler.file_path,
+        "success": result.get("success"),
+        "error": result.get("error"),
+        "timings": timings
+    }
+    try:
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError:
+        return
+
+
+def finish_profile(
+    profiler: Optional[Profiler],
+    result: dict,
+    include: bool,
+    write: Optional[Callable[[dict], None]] = None
+) -> dict:
+    if profiler is None:
+        if write is not None:
+            write(result)
+        return result
+    timings = profiler.report()
+    if include:
+        result["timings"] = timings
+    if write is not None:
+        started_wall = time.perf_counter()
+        started_cpu = time.process_time()
+        write(result)
+        profiler.add_phase("serialize", time.perf_counter() - started_wall, time.process_time() - started_cpu)
+        timings = profiler.report()
+    write_trace(profiler, result, timings)
+    return result
+
+
+def profile_stream(reader: str, file_path: str, enabled: bool, records: Iterator[dict]) -> Iterator[dict]:
+    with profile_session(reader, file_path, enabled) as profiler:
+        if profiler is None:
+            yield from records
+            return
+        final = None
+        try:
+            for record in records:
+                if record.get("type") == "statistics":
+                    final = record
+                    if enabled:
+                        record["timings"] = profiler.report()
+                started_wall = time.perf_counter()
+                started_cpu = time.process_time()
+                yield record
+                profiler.add_phase("serialize", time.perf_counter() - started_wall, time.process_time() - started_cpu)
+        finally:
+            if final is not None:
+                write_trace(profiler, final, profiler.report())
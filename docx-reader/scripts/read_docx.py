@@ -1,10 +1,55 @@
 import argparse
-import json
 import os
+import re
 import sys
-from typing import Optional, Tuple
-from docx import Document
-from docx.opc.exceptions import PackageNotFoundError
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+from xml.etree.ElementTree import XMLPullParser, iterparse
+from chunking import ChunkBudget, check_budget, collect_document_chunk, estimate_tokens, format_cursor, parse_cursor
+from daemon_client import run_via_daemon
+from document_model import DocumentBuilder, DocumentModel, TableSink, load_model, store_model
+from extract_cache import load_units, store_units
+from ooxml_package import OoxmlPackage, open_package
+from json_output import OUTPUT_FORMATS, write_records, write_result
+from profiling import finish_profile, profile_iter, profile_phase, profile_session, profile_stream
+from text_search import SearchCollector, check_max_hits, compile_search, search_document
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY = W_NS + "body"
+W_P = W_NS + "p"
+W_R = W_NS + "r"
+W_HYPERLINK = W_NS + "hyperlink"
+W_T = W_NS + "t"
+W_TAB = W_NS + "tab"
+W_PTAB = W_NS + "ptab"
+W_BR = W_NS + "br"
+W_CR = W_NS + "cr"
+W_NO_BREAK_HYPHEN = W_NS + "noBreakHyphen"
+W_TBL = W_NS + "tbl"
+W_TR = W_NS + "tr"
+W_TR_PR = W_NS + "trPr"
+W_GRID_BEFORE = W_NS + "gridBefore"
+W_TC = W_NS + "tc"
+W_TC_PR = W_NS + "tcPr"
+W_GRID_SPAN = W_NS + "gridSpan"
+W_V_MERGE = W_NS + "vMerge"
+W_VAL = W_NS + "val"
+W_TYPE = W_NS + "type"
+RUN_CONTENT_TAGS = {W_T, W_TAB, W_PTAB, W_BR, W_CR, W_NO_BREAK_HYPHEN}
+OFFICE_DOCUMENT_REL = "/officeDocument"
+INDEX_BLOCK_STRIDE = 64
+INDEX_ROW_STRIDE = 256
+SCAN_CHUNK_SIZE = 1024 * 1024
+MERGED_LEFT = "←"
+MERGED_UP = "↑"
+MARKER_TEXT = re.compile(r"\s*(\\*[{0}{1}])\s*".format(MERGED_LEFT, MERGED_UP))
+PARALLEL_TABLE_ROWS = 4096
+ROWS_PER_TASK = 2048
+
+_worker_document = None
 
 
 def parse_bool(value: str) -> bool:
@@ -30,16 +75,829 @@ def normalize_range(total: int, start: Optional[int], end: Optional[int]) -> Tup
     return start - 1, end
 
 
-def extract_docx(
+def find_main_document(package: OoxmlPackage) -> str:
+    try:
+        root = ElementTree.fromstring(package.read("_rels/.rels"))
+    except KeyError:
+        return "word/document.xml"
+    for rel in root:
+        if rel.get("Type", "").endswith(OFFICE_DOCUMENT_REL) and rel.get("TargetMode") != "External":
+            return rel.get("Target", "word/document.xml").lstrip("/")
+    return "word/document.xml"
+
+
+def run_content_text(elem) -> str:
+    tag = elem.tag
+    if tag == W_T:
+        return elem.text or ""
+    if tag in (W_TAB, W_PTAB):
+        return "\t"
+    if tag == W_BR:
+        return "\n" if elem.get(W_TYPE, "textWrapping") == "textWrapping" else ""
+    if tag == W_CR:
+        return "\n"
+    return "-"
+
+
+def escape_cell_text(text: str) -> str:
+    match = MARKER_TEXT.fullmatch(text)
+    return "\\" + match.group(1) if match else text
+
+
+def walk_docx_body(
+    events: Iterable[Tuple[str, object]],
+    row_window: Optional[Tuple[int, Optional[int]]] = None,
+    stop_after_table: Optional[int] = None,
+    row_checkpoints: Optional[Dict[int, dict]] = None,
+    tables_before: int = 0,
+    row_seed: Optional[Tuple[int, set]] = None,
+    new_rows: Callable[[], list] = list
+) -> Iterator[Tuple[str, object]]:
+    row_start_index, row_end_index = row_window if row_window else (0, None)
+    tags = []
+    paragraph_parts = []
+    tables = []
+    table_ordinal = tables_before
+    body = None
+    for event, elem in events:
+        tag = elem.tag
+        if event == "start":
+            tags.append(tag)
+            if tag == W_P:
+                paragraph_parts.append([])
+            elif tag == W_TBL:
+                ordinal = None
+                if len(tags) >= 2 and tags[-2] == W_BODY:
+                    table_ordinal += 1
+                    ordinal = table_ordinal
+                rows, previous = (new_rows() if ordinal is not None else []), set()
+                if ordinal == tables_before + 1 and row_seed is not None:
+                    rows, previous = [None] * row_seed[0], row_seed[1]
+                tables.append({
+                    "element": elem,
+                    "ordinal": ordinal,
+                    "rows": rows,
+                    "previous": previous,
+                    "row": None,
+                    "cell": None
+                })
+            elif tag == W_TR and tables:
+                tables[-1]["row"] = {"grid_before": 0, "offset": 0, "cells": [], "tcs": set()}
+            elif tag == W_TC and tables:
+                tables[-1]["cell"] = {"parts": [], "span": 1, "v_merge": None}
+            elif tag == W_BODY:
+                body = elem
+            continue
+
+        tags.pop()
+        parent = tags[-1] if tags else None
+        if tag in RUN_CONTENT_TAGS:
+            if parent == W_R and len(tags) >= 3 and paragraph_parts and (
+                tags[-2] == W_P or (tags[-2] == W_HYPERLINK and tags[-3] == W_P)
+            ):
+                paragraph_parts[-1].append(run_content_text(elem))
+        elif tag == W_P:
+            text = "".join(paragraph_parts.pop())
+            if parent == W_BODY:
+                yield "paragraph", text
+                body.clear()
+            elif parent == W_TC and tables and tables[-1]["cell"] is not None:
+                tables[-1]["cell"]["parts"].append(text)
+            elem.clear()
+        elif tag == W_GRID_SPAN:
+            if parent == W_TC_PR and tags[-2] == W_TC and tables and tables[-1]["cell"] is not None:
+                tables[-1]["cell"]["span"] = int(elem.get(W_VAL, "1"))
+        elif tag == W_V_MERGE:
+            if parent == W_TC_PR and tags[-2] == W_TC and tables and tables[-1]["cell"] is not None:
+                tables[-1]["cell"]["v_merge"] = elem.get(W_VAL, "continue")
+        elif tag == W_GRID_BEFORE:
+            if parent == W_TR_PR and tags[-2] == W_TR and tables and tables[-1]["row"] is not None:
+                tables[-1]["row"]["grid_before"] = int(elem.get(W_VAL, "0"))
+        elif tag == W_TC:
+            state = tables[-1] if tables else None
+            if state is None or state["cell"] is None:
+                continue
+            cell = state["cell"]
+            row = state["row"]
+            state["cell"] = None
+            if parent != W_TR or row is None:
+                continue
+            offset = row["grid_before"] + row["offset"]
+            row["offset"] += cell["span"]
+            row["tcs"].add(offset)
+            if cell["v_merge"] == "continue" and offset in state["previous"]:
+                row["cells"].append(MERGED_UP)
+            else:
+                row["cells"].append(escape_cell_text("\n".join(cell["parts"])))
+            row["cells"].extend([MERGED_LEFT] * (cell["span"] - 1))
+        elif tag == W_TR:
+            state = tables[-1] if tables else None
+            if state is None or state["row"] is None:
+                continue
+            row = state["row"]
+            state["row"] = None
+            if parent == W_TBL:
+                row_index = len(state["rows"])
+                if row_checkpoints is not None and state["ordinal"] is not None and row_index and (
+                    row_index % INDEX_ROW_STRIDE == 0
+                ):
+                    row_checkpoints.setdefault(state["ordinal"], {})[row_index] = state["previous"]
+                if state["ordinal"] is None or row_window is None or (
+                    row_index >= row_start_index and (row_end_index is None or row_index < row_end_index)
+                ):
+                    state["rows"].append(row["cells"])
+                else:
+                    state["rows"].append(None)
+                state["previous"] = row["tcs"]
+                state["element"].clear()
+                if (
+                    stop_after_table is not None
+                    and state["ordinal"] == stop_after_table
+                    and row_end_index is not None
+                    and len(state["rows"]) >= row_end_index
+                ):
+                    yield "table", state["rows"]
+                    return
+        elif tag == W_TBL:
+            state = tables.pop()
+            if parent == W_BODY:
+                yield "table", state["rows"]
+                body.clear()
+            elem.clear()
+
+
+def iter_docx_body(
     file_path: str,
-    paragraph_start: Optional[int] = None,
-    paragraph_end: Optional[int] = None,
-    table_start: Optional[int] = None,
-    table_end: Optional[int] = None,
-    include_content: bool = True,
-    output_mode: str = "full"
+    row_window: Optional[Tuple[int, Optional[int]]] = None,
+    stop_after_table: Optional[int] = None,
+    row_checkpoints: Optional[Dict[int, dict]] = None,
+    new_rows: Callable[[], list] = list
+) -> Iterator[Tuple[str, object]]:
+    with open_package(file_path) as package:
+        with package.open(find_main_document(package)) as stream:
+            yield from profile_iter("parse_body", walk_docx_body(
+                iterparse(stream, events=("start", "end")), row_window, stop_after_table, row_checkpoints,
+                new_rows=new_rows
+            ))
+
+
+def scan_docx_offsets(stream: IO[bytes]) -> Optional[dict]:
+    head = stream.read(SCAN_CHUNK_SIZE)
+    match = re.search(rb'xmlns(?::([\w.-]+))?="' + re.escape(W_NS[1:-1].encode("ascii")) + b'"', head)
+    if match is None:
+        return None
+    prefix = match.group(1) + b":" if match.group(1) else b""
+    pattern = re.compile(
+        rb"<(/?)" + re.escape(prefix) + rb"(body|p|tbl|tr|sdt|customXml)(?=[\s/>])[^>]*>"
+    )
+    elements = []
+    stack = []
+    prefix_end = None
+    body_end = None
+    suffix = None
+    buffer = b""
+    base = 0
+    chunk = head
+    while True:
+        data = buffer + chunk
+        cut = data.rfind(b"<") if chunk else len(data)
+        if cut < 0:
+            cut = len(data)
+        for match in pattern.finditer(data, 0, cut):
+            start, end = base + match.start(), base + match.end()
+            closing, name = match.group(1), match.group(2)
+            if prefix_end is None:
+                if name == b"body" and not closing:
+                    prefix_end = end
+                continue
+            if closing:
+                if not stack:
+                    if name != b"body":
+                        return None
+                    body_end = start
+                    suffix = data[match.start():]
+                    break
+                if stack.pop() != name:
+                    return None
+                if not stack and name in (b"p", b"tbl"):
+                    elements[-1]["end"] = end
+                continue
+            self_closing = match.group(0).endswith(b"/>")
+            if not stack and name in (b"p", b"tbl"):
+                elements.append({
+                    "kind": name,
+                    "start": start,
+                    "end": end,
+                    "open": match.group(0).decode("utf-8"),
+                    "rows": []
+                })
+            elif name == b"tr" and stack == [b"tbl"]:
+                elements[-1]["rows"].append(start)
+            if not self_closing:
+                stack.append(name)
+        if suffix is not None:
+            suffix += stream.read()
+            break
+        if not chunk:
+            return None
+        buffer = data[cut:]
+        base += cut
+        chunk = stream.read(SCAN_CHUNK_SIZE)
+    return {
+        "prefix_end": prefix_end,
+        "body_end": body_end,
+        "suffix": suffix.decode("utf-8"),
+        "elements": elements
+    }
+
+
+def scan_docx_part(file_path: str) -> Tuple[str, Optional[dict]]:
+    with open_package(file_path) as package:
+        part_name = find_main_document(package)
+        with package.open(part_name) as stream:
+            return part_name, scan_docx_offsets(stream)
+
+
+def build_docx_index(
+    file_path: str,
+    body_items: List[Tuple[str, int]],
+    row_checkpoints: Dict[int, dict],
+    scanned: Optional[Tuple[str, Optional[dict]]] = None
+) -> Optional[dict]:
+    part_name, offsets = scanned or scan_docx_part(file_path)
+    if offsets is None or len(offsets["elements"]) != len(body_items):
+        return None
+    blocks = []
+    tables = []
+    paragraph_count = 0
+    raw_paragraph_count = 0
+    for element, (kind, value) in zip(offsets["elements"], body_items):
+        if kind == "paragraph":
+            if element["kind"] != b"p":
+                return None
+            if raw_paragraph_count % INDEX_BLOCK_STRIDE == 0:
+                blocks.append([element["start"], paragraph_count, len(tables)])
+            raw_paragraph_count += 1
+            paragraph_count += value
+            continue
+        if element["kind"] != b"tbl" or len(element["rows"]) != value:
+            return None
+        blocks.append([element["start"], paragraph_count, len(tables)])
+        checkpoints = row_checkpoints.get(len(tables) + 1, {})
+        tables.append({
+            "start": element["start"],
+            "end": element["end"],
+            "open": element["open"],
+            "row_count": value,
+            "rows": [
+                [row_index, element["rows"][row_index], sorted(checkpoints[row_index])]
+                for row_index in sorted(checkpoints)
+            ]
+        })
+    return {
+        "part": part_name,
+        "prefix_end": offsets["prefix_end"],
+        "body_end": offsets["body_end"],
+        "suffix": offsets["suffix"],
+        "paragraph_count": paragraph_count,
+        "table_row_counts": [table["row_count"] for table in tables],
+        "blocks": blocks,
+        "tables": tables
+    }
+
+
+def store_docx_index(
+    file_path: str,
+    body_items: List[Tuple[str, int]],
+    row_checkpoints: Dict[int, dict],
+    scanned: Optional[Tuple[str, Optional[dict]]] = None
+) -> None:
+    try:
+        with profile_phase("index_build"):
+            index = build_docx_index(file_path, body_items, row_checkpoints, scanned)
+    except (OSError, zipfile.BadZipFile, KeyError):
+        return
+    if index is not None:
+        store_units("docx-index", file_path, index)
+
+
+def iter_segment_events(
+    stream: IO[bytes],
+    prefix: bytes,
+    suffix: bytes,
+    start: int,
+    end: int,
+    open_tag: bytes = b""
+) -> Iterator[Tuple[str, object]]:
+    parser = XMLPullParser(events=("start", "end"))
+    parser.feed(prefix + open_tag)
+    stream.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        chunk = stream.read(min(SCAN_CHUNK_SIZE, remaining))
+        if not chunk:
+            break
+        remaining -= len(chunk)
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.feed(suffix)
+    parser.close()
+    yield from parser.read_events()
+
+
+def init_table_worker(file_path: str, part_name: str, prefix_end: int, suffix: bytes) -> None:
+    global _worker_document
+    _worker_document = (file_path, part_name, prefix_end, suffix)
+
+
+def read_table_rows(task: Tuple[int, int, bytes, int, int]) -> Tuple[List[List[str]], Dict[int, set]]:
+    start, end, open_tag, row_start, row_end = task
+    file_path, part_name, prefix_end, suffix = _worker_document
+    row_checkpoints = {}
+    with open_package(file_path) as package:
+        with package.open(part_name) as stream:
+            prefix = stream.read(prefix_end)
+            events = iter_segment_events(stream, prefix, suffix, start, end, open_tag)
+            for kind, rows in walk_docx_body(
+                events, (row_start, row_end), 1, row_checkpoints, row_seed=(max(0, row_start - 1), set())
+            ):
+                if kind == "table":
+                    return rows[row_start:row_end], row_checkpoints.get(1, {})
+    raise ValueError("表格行解析不完整")
+
+
+def table_tasks(table: dict, workers: int) -> List[Tuple[int, int, bytes, int, int]]:
+    rows = table["rows"]
+    size = -(-len(rows) // workers)
+    size = max(ROWS_PER_TASK, -(-size // INDEX_ROW_STRIDE) * INDEX_ROW_STRIDE)
+    tasks = []
+    for row_start in range(0, len(rows), size):
+        row_end = min(len(rows), row_start + size)
+        if row_start:
+            start, open_tag = rows[row_start - 1], table["open"].encode("utf-8")
+        else:
+            start, open_tag = table["start"], b""
+        end = rows[row_end] if row_end < len(rows) else table["end"]
+        tasks.append((start, end, open_tag, row_start, row_end))
+    return tasks
+
+
+def iter_docx_body_parallel(
+    file_path: str,
+    scanned: Tuple[str, dict],
+    workers: int,
+    row_checkpoints: Optional[Dict[int, dict]] = None,
+    new_rows: Callable[[], list] = list
+) -> Iterator[Tuple[str, object]]:
+    part_name, offsets = scanned
+    suffix = offsets["suffix"].encode("utf-8")
+    large = []
+    ordinal = 0
+    for element in offsets["elements"]:
+        if element["kind"] == b"tbl":
+            ordinal += 1
+            if len(element["rows"]) >= PARALLEL_TABLE_ROWS:
+                large.append((ordinal, element))
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_table_worker,
+        initargs=(file_path, part_name, offsets["prefix_end"], suffix)
+    ) as executor:
+        pending = [
+            [executor.submit(read_table_rows, task) for task in table_tasks(element, workers)]
+            for _, element in large
+        ]
+        with open_package(file_path) as package:
+            with package.open(part_name) as stream:
+                prefix = stream.read(offsets["prefix_end"])
+                position = offsets["prefix_end"]
+                tables_before = 0
+                for (ordinal, element), futures in zip(large, pending):
+                    events = iter_segment_events(stream, prefix, suffix, position, element["start"])
+                    yield from profile_iter("parse_body", walk_docx_body(
+                        events, row_checkpoints=row_checkpoints, tables_before=tables_before, new_rows=new_rows
+                    ))
+                    rows = new_rows()
+                    for future in futures:
+                        with profile_phase("worker_pool"):
+                            chunk, checkpoints = future.result()
+                        for cells in chunk:
+                            rows.append(cells)
+                        if row_checkpoints is not None and checkpoints:
+                            row_checkpoints.setdefault(ordinal, {}).update(checkpoints)
+                    yield "table", rows
+                    position = element["end"]
+                    tables_before = ordinal
+                events = iter_segment_events(stream, prefix, suffix, position, offsets["body_end"])
+                yield from profile_iter("parse_body", walk_docx_body(
+                    events, row_checkpoints=row_checkpoints, tables_before=tables_before, new_rows=new_rows
+                ))
+
+
+def scan_large_tables(file_path: str) -> Optional[Tuple[str, dict]]:
+    with profile_phase("scan_tables"):
+        part_name, offsets = scan_docx_part(file_path)
+    if offsets is None or not any(
+        element["kind"] == b"tbl" and len(element["rows"]) >= PARALLEL_TABLE_ROWS for element in offsets["elements"]
+    ):
+        return None
+    return part_name, offsets
+
+
+def text_span(text: str) -> Tuple[int, int, int]:
+    return len(text), len(text) - len(text.lstrip()), len(text) - len(text.rstrip())
+
+
+def concat_spans(left: Tuple[int, int, int], right: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    return (
+        left[0] + right[0],
+        left[1] + right[1] if left[1] == left[0] else left[1],
+        left[2] + right[2] if right[2] == right[0] else right[2]
+    )
+
+
+def join_spans(spans: Iterable[Tuple[int, int, int]], separator: str) -> Tuple[int, int, int]:
+    joined = (0, 0, 0)
+    gap = text_span(separator)
+    for index, span in enumerate(spans):
+        joined = concat_spans(concat_spans(joined, gap), span) if index else span
+    return joined
+
+
+def stripped_length(span: Tuple[int, int, int]) -> int:
+    return max(0, span[0] - span[1] - span[2])
+
+
+class TableCounter:
+    def __init__(self):
+        self.count = 0
+        self.span = (0, 0, 0)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, cells: List[str]) -> None:
+        row_span = text_span("\t".join([cell.strip() for cell in cells]))
+        self.span = concat_spans(concat_spans(self.span, text_span("\n")), row_span) if self.count else row_span
+        self.count += 1
+
+    def close(self) -> None:
+        pass
+
+
+def count_docx_units(file_path: str, use_index: bool = False) -> Tuple[List[int], List[TableCounter]]:
+    paragraph_lengths = []
+    tables = []
+    body_items = []
+    row_checkpoints = {} if use_index else None
+    for kind, value in iter_docx_body(file_path, row_checkpoints=row_checkpoints, new_rows=TableCounter):
+        if kind == "paragraph":
+            text = value.strip()
+            if text:
+                paragraph_lengths.append(len(text))
+            body_items.append((kind, 1 if text else 0))
+        else:
+            tables.append(value)
+            body_items.append((kind, len(value)))
+    if use_index:
+        store_docx_index(file_path, body_items, row_checkpoints)
+    return paragraph_lengths, tables
+
+
+def read_docx_units(file_path: str, use_index: bool = False, workers: int = 1) -> DocumentModel:
+    builder = DocumentBuilder()
+    body_items = []
+    row_checkpoints = {} if use_index else None
+    scanned = scan_large_tables(file_path) if workers > 1 else None
+    if scanned is None:
+        items = iter_docx_body(
+            file_path, row_checkpoints=row_checkpoints, new_rows=lambda: TableSink(builder, strip=True)
+        )
+    else:
+        items = iter_docx_body_parallel(
+            file_path, scanned, workers, row_checkpoints, new_rows=lambda: TableSink(builder, strip=True)
+        )
+    for kind, value in items:
+        if kind == "paragraph":
+            text = value.strip()
+            if text:
+                builder.add_paragraph(text)
+            body_items.append((kind, 1 if text else 0))
+        else:
+            value.close()
+            body_items.append((kind, len(value)))
+    if use_index:
+        store_docx_index(file_path, body_items, row_checkpoints, scanned)
+    return builder.build()
+
+
+def read_docx_index_range(
+    file_path: str,
+    index: dict,
+    paragraph_range: Tuple[int, int],
+    table_range: Tuple[int, int]
+) -> DocumentModel:
+    paragraph_start_index, paragraph_end_index = paragraph_range
+    table_start_index, table_end_index = table_range
+    segments = []
+    if paragraph_start_index < paragraph_end_index:
+        blocks = index["blocks"]
+        first = max(i for i, block in enumerate(blocks) if block[1] <= paragraph_start_index)
+        end = next(
+            (block[0] for block in blocks[first + 1:] if block[1] >= paragraph_end_index),
+            index["body_end"]
+        )
+        segments.append((blocks[first][0], end, blocks[first][1], blocks[first][2]))
+    for table_index in range(table_start_index, table_end_index):
+        table = index["tables"][table_index]
+        if segments and segments[0][0] <= table["start"] and table["end"] <= segments[0][1]:
+            continue
+        segments.append((table["start"], table["end"], 0, table_index))
+    segments.sort()
+
+    builder = DocumentBuilder()
+    with open_package(file_path) as package:
+        with package.open(index["part"]) as stream:
+            prefix = stream.read(index["prefix_end"])
+            suffix = index["suffix"].encode("utf-8")
+            for start, end, paragraph_index, table_index in segments:
+                events = iter_segment_events(stream, prefix, suffix, start, end)
+                for kind, value in profile_iter("parse_range", walk_docx_body(events)):
+                    if kind == "paragraph":
+                        text = value.strip()
+                        if not text:
+                            continue
+                        if paragraph_start_index <= paragraph_index < paragraph_end_index:
+                            builder.add_paragraph(text)
+                        paragraph_index += 1
+                    else:
+                        if table_start_index <= table_index < table_end_index:
+                            builder.add_table([cell.strip() for cell in cells] for cells in value)
+                        table_index += 1
+    return builder.build()
+
+
+def iter_document_table_rows(table) -> Iterator[List[str]]:
+    from docx.table import _Cell
+
+    previous = set()
+    for tr in table._tbl.tr_lst:
+        offset = tr.grid_before
+        tcs = set()
+        cells = []
+        for tc in tr.tc_lst:
+            tcs.add(offset)
+            if tc.vMerge == "continue" and offset in previous:
+                cells.append(MERGED_UP)
+            else:
+                cells.append(escape_cell_text(_Cell(tc, table).text.strip()))
+            cells.extend([MERGED_LEFT] * (tc.grid_span - 1))
+            offset += tc.grid_span
+        previous = tcs
+        yield cells
+
+
+def read_docx_document_units(file_path: str) -> DocumentModel:
+    from docx import Document
+
+    with profile_phase("python_docx"):
+        document = Document(file_path)
+        builder = DocumentBuilder()
+        for p in document.paragraphs:
+            if p.text and p.text.strip():
+                builder.add_paragraph(p.text.strip())
+        for table in document.tables:
+            builder.add_table(iter_document_table_rows(table))
+    return builder.build()
+
+
+def parse_columns(value: str) -> List[int]:
+    columns = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            start, end = int(start), int(end)
+            if start < 1 or end < start:
+                raise ValueError("columns 格式错误: " + value)
+            columns.extend(range(start, end + 1))
+        else:
+            column = int(part)
+            if column < 1:
+                raise ValueError("columns 格式错误: " + value)
+            columns.append(column)
+    if not columns:
+        raise ValueError("columns 格式错误: " + value)
+    return columns
+
+
+def select_columns(cells: List[str], columns: Optional[List[int]]) -> List[str]:
+    if columns is None:
+        return cells
+    return [cells[column - 1] for column in columns if column <= len(cells)]
+
+
+def read_docx_index_tables(
+    file_path: str,
+    index: dict,
+    table_range: Tuple[int, int],
+    row_window: Tuple[int, Optional[int]]
+) -> List[list]:
+    row_start_index, row_end_index = row_window
+    suffix = index["suffix"].encode("utf-8")
+    tables = []
+    with open_package(file_path) as package:
+        with package.open(index["part"]) as stream:
+            prefix = stream.read(index["prefix_end"])
+            for table_index in range(*table_range):
+                table = index["tables"][table_index]
+                start, open_tag, row_seed = table["start"], b"", None
+                for row_index, offset, previous in table["rows"]:
+                    if row_index > row_start_index:
+                        break
+                    start, open_tag = offset, table["open"].encode("utf-8")
+                    row_seed = (row_index, set(previous))
+                events = iter_segment_events(stream, prefix, suffix, start, table["end"], open_tag)
+                stop_after_table = table_index + 1 if row_end_index is not None else None
+                for kind, value in profile_iter("parse_range", walk_docx_body(
+                    events, row_window, stop_after_table, tables_before=table_index, row_seed=row_seed
+                )):
+                    if kind == "table":
+                        tables.append(value)
+                        break
+    return tables
+
+
+def read_docx_table_window(
+    file_path: str,
+    table_start: Optional[int],
+    table_end: Optional[int],
+    row_start: Optional[int],
+    row_end: Optional[int],
+    use_cache: bool = True,
+    use_index: bool = True
+) -> Tuple[List[list], List[int], int, int]:
+    row_start_index = 0 if row_start is None else max(1, int(row_start)) - 1
+    row_end_index = None if row_end is None else max(0, int(row_end))
+
+    model = load_model("docx", file_path) if use_cache else None
+    if model is not None:
+        table_row_counts = model.table_row_counts()
+        table_start_index, table_end_index = normalize_range(model.table_count, table_start, table_end)
+        windows = [
+            model.rows(table_index, row_start_index, row_end_index)
+            for table_index in range(table_start_index, table_end_index)
+        ]
+        return windows, table_row_counts, table_start_index, table_end_index
+
+    index = load_units("docx-index", file_path) if use_index else None
+    if index is not None:
+        table_row_counts = index["table_row_counts"]
+        table_start_index, table_end_index = normalize_range(len(table_row_counts), table_start, table_end)
+        tables = read_docx_index_tables(
+            file_path, index, (table_start_index, table_end_index), (row_start_index, row_end_index)
+        )
+    else:
+        try:
+            body_items = []
+            row_checkpoints = {} if use_index else None
+            tables = []
+            for kind, value in iter_docx_body(file_path, (row_start_index, row_end_index), None, row_checkpoints):
+                if kind == "paragraph":
+                    body_items.append((kind, 1 if value.strip() else 0))
+                else:
+                    tables.append(value)
+                    body_items.append((kind, len(value)))
+            if use_index:
+                store_docx_index(file_path, body_items, row_checkpoints)
+        except ValueError:
+            model = read_docx_document_units(file_path)
+            tables = [model.rows(table_index) for table_index in range(model.table_count)]
+        table_row_counts = [len(table_rows) for table_rows in tables]
+        table_start_index, table_end_index = normalize_range(len(tables), table_start, table_end)
+        tables = tables[table_start_index:table_end_index]
+
+    windows = []
+    for table_rows in tables:
+        windows.append([
+            [cell.strip() for cell in cells]
+            for cells in table_rows[row_start_index:row_end_index] if cells is not None
+        ])
+    return windows, table_row_counts, table_start_index, table_end_index
+
+
+def iter_docx_paragraph_texts(
+    file_path: str,
+    index: Optional[dict],
+    start: int,
+    end: Optional[int]
+) -> Iterator[Tuple[int, str]]:
+    def paragraphs_from(items: Iterable[Tuple[str, object]], paragraph_index: int) -> Iterator[Tuple[int, str]]:
+        for kind, value in items:
+            if kind != "paragraph":
+                continue
+            text = value.strip()
+            if not text:
+                continue
+            if end is not None and paragraph_index >= end:
+                return
+            if paragraph_index >= start:
+                yield paragraph_index, text
+            paragraph_index += 1
+
+    if index is None:
+        yield from paragraphs_from(iter_docx_body(file_path), 0)
+        return
+    blocks = [block for block in index["blocks"] if block[1] <= start]
+    if not blocks:
+        return
+    position = blocks[-1][0]
+    segments = []
+    for table in index["tables"]:
+        if table["start"] >= position:
+            segments.append((position, table["start"]))
+            position = table["end"]
+    segments.append((position, index["body_end"]))
+    suffix = index["suffix"].encode("utf-8")
+    with open_package(file_path) as package:
+        with package.open(index["part"]) as stream:
+            prefix = stream.read(index["prefix_end"])
+            items = profile_iter("parse_range", chain.from_iterable(
+                walk_docx_body(iter_segment_events(stream, prefix, suffix, segment_start, segment_end))
+                for segment_start, segment_end in segments if segment_start < segment_end
+            ))
+            yield from paragraphs_from(items, blocks[-1][1])
+
+
+def iter_docx_table_rows(
+    file_path: str,
+    index: Optional[dict],
+    start: int,
+    row_start: int,
+    end: Optional[int]
+) -> Iterator[Tuple[int, Iterable[List[str]]]]:
+    if index is None:
+        table_index = 0
+        for kind, value in iter_docx_body(file_path):
+            if kind != "table":
+                continue
+            if end is not None and table_index >= end:
+                return
+            if table_index >= start:
+                first_row = row_start if table_index == start else 0
+                yield table_index, [[cell.strip() for cell in cells] for cells in value[first_row:]]
+            table_index += 1
+        return
+    table_count = len(index["tables"]) if end is None else min(end, len(index["tables"]))
+    for table_index in range(start, table_count):
+        yield table_index, iter_docx_index_rows(file_path, index, table_index, row_start if table_index == start else 0)
+
+
+def iter_docx_index_rows(file_path: str, index: dict, table_index: int, first_row: int) -> Iterator[List[str]]:
+    for row_start in range(first_row, index["tables"][table_index]["row_count"], INDEX_ROW_STRIDE):
+        rows = read_docx_index_tables(
+            file_path, index, (table_index, table_index + 1), (row_start, row_start + INDEX_ROW_STRIDE)
+        )[0]
+        for cells in rows[row_start:]:
+            if cells is not None:
+                yield [cell.strip() for cell in cells]
+
+
+def extract_docx_chunk(
+    file_path: str,
+    paragraph_start: Optional[int],
+    paragraph_end: Optional[int],
+    table_start: Optional[int],
+    table_end: Optional[int],
+    include_content: bool,
+    output_mode: str,
+    use_cache: bool,
+    use_index: bool,
+    columns: Optional[List[int]],
+    max_chars: Optional[int],
+    max_tokens: Optional[int],
+    cursor: Optional[str]
 ) -> dict:
-    if not os.path.isfile(file_path):
+    paragraph_start_index = 0 if paragraph_start is None else max(1, int(paragraph_start)) - 1
+    paragraph_end_index = None if paragraph_end is None else max(0, int(paragraph_end))
+    table_start_index = 0 if table_start is None else max(1, int(table_start)) - 1
+    table_end_index = None if table_end is None else max(0, int(table_end))
+    positions = {"paragraph": paragraph_start_index, "table": table_start_index, "row": 0}
+    error = check_budget(max_chars, max_tokens)
+    if error is None and cursor:
+        try:
+            resumed = parse_cursor(cursor, file_path, ["paragraph", "table", "row"])
+        except ValueError as exc:
+            error = str(exc)
+        else:
+            if "paragraph" in resumed:
+                positions["paragraph"] = max(paragraph_start_index, resumed["paragraph"])
+            else:
+                positions = {"table": max(table_start_index, resumed.get("table", 0)), "row": resumed.get("row", 0)}
+    if error:
         return {
             "success": False,
             "file_path": file_path,
@@ -52,10 +910,47 @@ def extract_docx(
                 "table_row_counts": [],
                 "char_count": 0
             },
-            "error": "文件不存在"
+            "next_cursor": None,
+            "error": error
         }
 
-    if not file_path.lower().endswith(".docx"):
+    def model_chunk(model: DocumentModel) -> dict:
+        return collect_document_chunk(
+            model.iter_paragraphs(positions.get("paragraph", 0), paragraph_end_index),
+            lambda start, row_start: model.iter_tables(start, table_end_index, row_start),
+            positions,
+            ChunkBudget(max_chars, max_tokens),
+            columns
+        )
+
+    try:
+        model = load_model("docx", file_path) if use_cache else None
+        index = load_units("docx-index", file_path) if use_index and model is None else None
+        if model is None and index is None and cursor:
+            try:
+                model = read_docx_units(file_path, use_index)
+            except ValueError:
+                model = read_docx_document_units(file_path)
+            if use_cache:
+                store_model("docx", file_path, model)
+        if model is not None:
+            chunk = model_chunk(model)
+        else:
+            try:
+                chunk = collect_document_chunk(
+                    iter_docx_paragraph_texts(file_path, index, positions.get("paragraph", 0), paragraph_end_index),
+                    lambda start, row_start: iter_docx_table_rows(file_path, index, start, row_start, table_end_index),
+                    positions,
+                    ChunkBudget(max_chars, max_tokens),
+                    columns
+                )
+            except ValueError:
+                chunk = model_chunk(read_docx_document_units(file_path))
+    except (zipfile.BadZipFile, KeyError):
+        error = "无法读取docx文件"
+    except Exception as exc:
+        error = str(exc)
+    if error:
         return {
             "success": False,
             "file_path": file_path,
@@ -68,10 +963,55 @@ def extract_docx(
                 "table_row_counts": [],
                 "char_count": 0
             },
-            "error": "仅支持.docx格式"
+            "next_cursor": None,
+            "error": error
         }
 
-    if output_mode not in ["full", "list"]:
+    content_parts = []
+    if chunk["paragraphs"]:
+        content_parts.append("\n".join(chunk["paragraphs"]))
+    if chunk["tables"]:
+        content_parts.append("\n\n".join(chunk["tables"]))
+    content = "\n\n".join(content_parts).strip()
+    return {
+        "success": True,
+        "file_path": file_path,
+        "content": content if output_mode == "full" and include_content else "",
+        "paragraphs": chunk["paragraphs"] if output_mode == "list" else [],
+        "tables": chunk["tables"] if output_mode == "list" else [],
+        "statistics": {
+            "paragraph_count": len(chunk["paragraphs"]),
+            "table_count": len(chunk["tables"]),
+            "paragraph_range": chunk["paragraph_range"],
+            "table_range": chunk["table_range"],
+            "table_row_ranges": chunk["table_row_ranges"],
+            "char_count": len(content),
+            "token_count": estimate_tokens(content)
+        },
+        "next_cursor": format_cursor(file_path, chunk["next"]) if chunk["next"] else None,
+        "error": None
+    }
+
+
+def extract_docx(
+    file_path: str,
+    paragraph_start: Optional[int] = None,
+    paragraph_end: Optional[int] = None,
+    table_start: Optional[int] = None,
+    table_end: Optional[int] = None,
+    include_content: bool = True,
+    output_mode: str = "full",
+    use_cache: bool = True,
+    table_row_start: Optional[int] = None,
+    table_row_end: Optional[int] = None,
+    columns: Optional[List[int]] = None,
+    use_index: bool = True,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[str] = None,
+    workers: int = 1
+) -> dict:
+    if not os.path.isfile(file_path):
         return {
             "success": False,
             "file_path": file_path,
@@ -84,12 +1024,10 @@ def extract_docx(
                 "table_row_counts": [],
                 "char_count": 0
             },
-            "error": 'output_mode 仅限 ["full", "list"]'
+            "error": "文件不存在"
         }
 
-    try:
-        document = Document(file_path)
-    except PackageNotFoundError:
+    if not file_path.lower().endswith(".docx"):
         return {
             "success": False,
             "file_path": file_path,
@@ -102,9 +1040,10 @@ def extract_docx(
                 "table_row_counts": [],
                 "char_count": 0
             },
-            "error": "无法读取docx文件"
+            "error": "仅支持.docx格式"
         }
-    except Exception as exc:
+
+    if output_mode not in ["full", "list"]:
         return {
             "success": False,
             "file_path": file_path,
@@ -117,42 +1056,197 @@ def extract_docx(
                 "table_row_counts": [],
                 "char_count": 0
             },
-            "error": str(exc)
+            "error": 'output_mode 仅限 ["full", "list"]'
         }
 
-    paragraphs = [p.text.strip() for p in document.paragraphs if p.text and p.text.strip()]
-    tables = []
-    table_row_counts = []
+    if max_chars is not None or max_tokens is not None or cursor is not None:
+        return extract_docx_chunk(
+            file_path, paragraph_start, paragraph_end, table_start, table_end, include_content,
+            output_mode, use_cache, use_index, columns, max_chars, max_tokens, cursor
+        )
 
-    for table in document.tables:
-        table_rows = []
-        for row in table.rows:
-            row_cells = [cell.text.strip() for cell in row.cells]
-            table_rows.append(row_cells)
-        tables.append(table_rows)
-        table_row_counts.append(len(table_rows))
+    if table_row_start is not None or table_row_end is not None or columns is not None:
+        try:
+            windows, table_row_counts, table_start_index, table_end_index = read_docx_table_window(
+                file_path, table_start, table_end, table_row_start, table_row_end, use_cache, use_index
+            )
+        except (zipfile.BadZipFile, KeyError):
+            return {
+                "success": False,
+                "file_path": file_path,
+                "content": "",
+                "paragraphs": [],
+                "tables": [],
+                "statistics": {
+                    "paragraph_count": 0,
+                    "table_count": 0,
+                    "table_row_counts": [],
+                    "char_count": 0
+                },
+                "error": "无法读取docx文件"
+            }
+        except Exception as exc:
+            return {
+                "success": False,
+                "file_path": file_path,
+                "content": "",
+                "paragraphs": [],
+                "tables": [],
+                "statistics": {
+                    "paragraph_count": 0,
+                    "table_count": 0,
+                    "table_row_counts": [],
+                    "char_count": 0
+                },
+                "error": str(exc)
+            }
 
-    paragraph_start_index, paragraph_end_index = normalize_range(
-        len(paragraphs), paragraph_start, paragraph_end
-    )
-    table_start_index, table_end_index = normalize_range(len(tables), table_start, table_end)
+        row_start_index = 0 if table_row_start is None else max(1, int(table_row_start)) - 1
+        table_text_blocks = []
+        table_row_ranges = []
+        for table_rows in windows:
+            rows = ["\t".join(select_columns(cells, columns)) for cells in table_rows]
+            table_text_blocks.append("\n".join(rows))
+            if table_rows:
+                table_row_ranges.append([row_start_index + 1, row_start_index + len(table_rows)])
+            else:
+                table_row_ranges.append([0, 0])
 
-    selected_paragraphs = paragraphs[paragraph_start_index:paragraph_end_index]
-    selected_tables = tables[table_start_index:table_end_index]
-    selected_table_row_counts = table_row_counts[table_start_index:table_end_index]
+        content = "\n\n".join(table_text_blocks).strip()
+        char_count = len(content)
+        return {
+            "success": True,
+            "file_path": file_path,
+            "content": content if output_mode == "full" and include_content else "",
+            "paragraphs": [],
+            "tables": table_text_blocks if output_mode == "list" else [],
+            "statistics": {
+                "paragraph_count": 0,
+                "table_count": len(windows),
+                "table_row_counts": table_row_counts[table_start_index:table_end_index],
+                "table_row_ranges": table_row_ranges,
+                "char_count": char_count
+            },
+            "error": None
+        }
 
-    table_text_blocks = []
-    for table in selected_tables:
-        rows = ["\t".join(cells) for cells in table]
-        table_text_blocks.append("\n".join(rows))
+    model = load_model("docx", file_path) if use_cache else None
+    index = load_units("docx-index", file_path) if use_index and model is None else None
+    if index is not None:
+        paragraph_range = normalize_range(index["paragraph_count"], paragraph_start, paragraph_end)
+        table_range = normalize_range(len(index["table_row_counts"]), table_start, table_end)
+        if paragraph_range == (0, index["paragraph_count"]) and table_range == (0, len(index["table_row_counts"])):
+            index = None
+    if model is None and index is None and output_mode == "full" and not include_content:
+        try:
+            paragraph_lengths, tables = count_docx_units(file_path, use_index)
+        except ValueError:
+            tables = None
+        except (zipfile.BadZipFile, KeyError):
+            return {
+                "success": False,
+                "file_path": file_path,
+                "content": "",
+                "paragraphs": [],
+                "tables": [],
+                "statistics": {
+                    "paragraph_count": 0,
+                    "table_count": 0,
+                    "table_row_counts": [],
+                    "char_count": 0
+                },
+                "error": "无法读取docx文件"
+            }
+        except Exception as exc:
+            return {
+                "success": False,
+                "file_path": file_path,
+                "content": "",
+                "paragraphs": [],
+                "tables": [],
+                "statistics": {
+                    "paragraph_count": 0,
+                    "table_count": 0,
+                    "table_row_counts": [],
+                    "char_count": 0
+                },
+                "error": str(exc)
+            }
+        if tables is not None:
+            paragraph_range = normalize_range(len(paragraph_lengths), paragraph_start, paragraph_end)
+            table_range = normalize_range(len(tables), table_start, table_end)
+            spans = []
+            if paragraph_range[0] < paragraph_range[1]:
+                spans.append(join_spans(
+                    [(length, 0, 0) for length in paragraph_lengths[paragraph_range[0]:paragraph_range[1]]], "\n"
+                ))
+            if table_range[0] < table_range[1]:
+                spans.append(join_spans([table.span for table in tables[table_range[0]:table_range[1]]], "\n\n"))
+            return {
+                "success": True,
+                "file_path": file_path,
+                "content": "",
+                "paragraphs": [],
+                "tables": [],
+                "statistics": {
+                    "paragraph_count": paragraph_range[1] - paragraph_range[0],
+                    "table_count": table_range[1] - table_range[0],
+                    "table_row_counts": [len(table) for table in tables[table_range[0]:table_range[1]]],
+                    "char_count": stripped_length(join_spans(spans, "\n\n"))
+                },
+                "error": None
+            }
 
-    content_parts = []
-    if selected_paragraphs:
-        content_parts.append("\n".join(selected_paragraphs))
-    if table_text_blocks:
-        content_parts.append("\n\n".join(table_text_blocks))
+    if model is None:
+        try:
+            if index is not None:
+                model = read_docx_index_range(file_path, index, paragraph_range, table_range)
+            else:
+                try:
+                    model = read_docx_units(file_path, use_index, workers)
+                except ValueError:
+                    model = read_docx_document_units(file_path)
+        except (zipfile.BadZipFile, KeyError):
+            return {
+                "success": False,
+                "file_path": file_path,
+                "content": "",
+                "paragraphs": [],
+                "tables": [],
+                "statistics": {
+                    "paragraph_count": 0,
+                    "table_count": 0,
+                    "table_row_counts": [],
+                    "char_count": 0
+                },
+                "error": "无法读取docx文件"
+            }
+        except Exception as exc:
+            return {
+                "success": False,
+                "file_path": file_path,
+                "content": "",
+                "paragraphs": [],
+                "tables": [],
+                "statistics": {
+                    "paragraph_count": 0,
+                    "table_count": 0,
+                    "table_row_counts": [],
+                    "char_count": 0
+                },
+                "error": str(exc)
+            }
+        if use_cache and index is None:
+            store_model("docx", file_path, model)
 
-    content = "\n\n".join(content_parts).strip()
+    if index is not None:
+        paragraph_range = (0, model.paragraph_count)
+        table_range = (0, model.table_count)
+    else:
+        paragraph_range = normalize_range(model.paragraph_count, paragraph_start, paragraph_end)
+        table_range = normalize_range(model.table_count, table_start, table_end)
+
+    content = model.content(paragraph_range, table_range)
     char_count = len(content)
     if output_mode != "full" or not include_content:
         content = ""
@@ -161,19 +1255,248 @@ def extract_docx(
         "success": True,
         "file_path": file_path,
         "content": content if output_mode == "full" else "",
-        "paragraphs": selected_paragraphs if output_mode == "list" else [],
-        "tables": table_text_blocks if output_mode == "list" else [],
+        "paragraphs": model.paragraphs(*paragraph_range) if output_mode == "list" else [],
+        "tables": model.table_texts(*table_range) if output_mode == "list" else [],
         "statistics": {
-            "paragraph_count": len(selected_paragraphs),
-            "table_count": len(selected_tables),
-            "table_row_counts": selected_table_row_counts,
+            "paragraph_count": paragraph_range[1] - paragraph_range[0],
+            "table_count": table_range[1] - table_range[0],
+            "table_row_counts": model.table_row_counts(*table_range),
             "char_count": char_count
         },
         "error": None
     }
 
 
-def main():
+def search_docx(
+    file_path: str,
+    pattern: str,
+    use_regex: bool = False,
+    ignore_case: bool = False,
+    max_hits: Optional[int] = 100,
+    paragraph_start: Optional[int] = None,
+    paragraph_end: Optional[int] = None,
+    table_start: Optional[int] = None,
+    table_end: Optional[int] = None,
+    use_cache: bool = True,
+    use_index: bool = True,
+    cursor: Optional[str] = None
+) -> dict:
+    error = None
+    regex = None
+    paragraph_start_index = 0 if paragraph_start is None else max(1, int(paragraph_start)) - 1
+    paragraph_end_index = None if paragraph_end is None else max(0, int(paragraph_end))
+    table_start_index = 0 if table_start is None else max(1, int(table_start)) - 1
+    table_end_index = None if table_end is None else max(0, int(table_end))
+    positions = {"paragraph": paragraph_start_index, "table": table_start_index, "row": 0}
+    if not os.path.isfile(file_path):
+        error = "文件不存在"
+    elif not file_path.lower().endswith(".docx"):
+        error = "仅支持.docx格式"
+    else:
+        error = check_max_hits(max_hits)
+    if error is None:
+        try:
+            regex = compile_search(pattern, use_regex, ignore_case)
+            if cursor:
+                resumed = parse_cursor(cursor, file_path, ["paragraph", "table", "row", "offset"])
+                if "paragraph" in resumed:
+                    positions["paragraph"] = max(paragraph_start_index, resumed["paragraph"])
+                    positions["offset"] = resumed.get("offset", 0) if positions["paragraph"] == resumed["paragraph"] else 0
+                else:
+                    positions = {"table": max(table_start_index, resumed.get("table", 0))}
+                    positions["row"] = resumed.get("row", 0) if positions["table"] == resumed.get("table", 0) else 0
+                    positions["offset"] = resumed.get("offset", 0) if positions["row"] == resumed.get("row", 0) else 0
+        except ValueError as exc:
+            error = str(exc)
+
+    collector = SearchCollector(regex, max_hits)
+    next_position = None
+
+    def search_model(model: DocumentModel) -> Optional[Dict[str, int]]:
+        return search_document(
+            collector,
+            model.iter_paragraphs(positions.get("paragraph", 0), paragraph_end_index),
+            lambda start, row_start: model.iter_tables(start, table_end_index, row_start),
+            positions
+        )
+
+    if error is None:
+        try:
+            model = load_model("docx", file_path) if use_cache else None
+            if model is not None:
+                next_position = search_model(model)
+            else:
+                index = load_units("docx-index", file_path) if use_index else None
+                try:
+                    next_position = search_document(
+                        collector,
+                        iter_docx_paragraph_texts(file_path, index, positions.get("paragraph", 0), paragraph_end_index),
+                        lambda start, row_start: iter_docx_table_rows(file_path, index, start, row_start, table_end_index),
+                        positions
+                    )
+                except ValueError:
+                    collector = SearchCollector(regex, max_hits)
+                    next_position = search_model(read_docx_document_units(file_path))
+        except (zipfile.BadZipFile, KeyError):
+            error = "无法读取docx文件"
+        except Exception as exc:
+            error = str(exc)
+    if error:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "hits": [],
+            "statistics": {
+                "unit_count": 0,
+                "hit_count": 0
+            },
+            "next_cursor": None,
+            "error": error
+        }
+
+    return {
+        "success": True,
+        "file_path": file_path,
+        "hits": collector.hits,
+        "statistics": {
+            "unit_count": collector.unit_count,
+            "hit_count": len(collector.hits)
+        },
+        "next_cursor": format_cursor(file_path, next_position) if next_position is not None else None,
+        "error": None
+    }
+
+
+def stream_docx(
+    file_path: str,
+    paragraph_start: Optional[int] = None,
+    paragraph_end: Optional[int] = None,
+    table_start: Optional[int] = None,
+    table_end: Optional[int] = None,
+    include_content: bool = True,
+    table_row_start: Optional[int] = None,
+    table_row_end: Optional[int] = None,
+    columns: Optional[List[int]] = None
+) -> Iterator[dict]:
+    error = None
+    if not os.path.isfile(file_path):
+        error = "文件不存在"
+    elif not file_path.lower().endswith(".docx"):
+        error = "仅支持.docx格式"
+    if error:
+        yield {
+            "type": "statistics",
+            "success": False,
+            "file_path": file_path,
+            "statistics": {
+                "paragraph_count": 0,
+                "table_count": 0,
+                "table_row_counts": [],
+                "char_count": 0
+            },
+            "error": error
+        }
+        return
+
+    paragraph_start_index = 0 if paragraph_start is None else max(1, int(paragraph_start)) - 1
+    paragraph_end_index = None if paragraph_end is None else int(paragraph_end)
+    table_start_index = 0 if table_start is None else max(1, int(table_start)) - 1
+    table_end_index = None if table_end is None else int(table_end)
+    table_window = table_row_start is not None or table_row_end is not None or columns is not None
+    row_start_index = 0 if table_row_start is None else max(1, int(table_row_start)) - 1
+    row_end_index = None if table_row_end is None else max(0, int(table_row_end))
+    paragraph_count = 0
+    paragraph_chars = 0
+    paragraph_index = 0
+    table_row_counts = []
+    table_chars = 0
+    table_index = 0
+    try:
+        for kind, value in iter_docx_body(file_path, (row_start_index, row_end_index) if table_window else None):
+            if kind == "paragraph":
+                if table_window:
+                    continue
+                text = value.strip()
+                if not text:
+                    continue
+                paragraph_index += 1
+                if paragraph_index <= paragraph_start_index:
+                    continue
+                if paragraph_end_index is not None and paragraph_index > paragraph_end_index:
+                    continue
+                paragraph_chars += len(text) + (1 if paragraph_count else 0)
+                paragraph_count += 1
+                record = {
+                    "type": "paragraph",
+                    "paragraph_index": paragraph_index,
+                    "char_count": len(text)
+                }
+                if include_content:
+                    record["text"] = text
+                yield record
+            else:
+                table_index += 1
+                if table_index <= table_start_index:
+                    continue
+                if table_end_index is not None and table_index > table_end_index:
+                    continue
+                table_rows = [
+                    select_columns([cell.strip() for cell in cells], columns)
+                    for cells in value if cells is not None
+                ]
+                table_text = "\n".join(["\t".join(cells) for cells in table_rows])
+                table_chars += len(table_text) + (2 if table_row_counts else 0)
+                table_row_counts.append(len(value))
+                record = {
+                    "type": "table",
+                    "table_index": table_index,
+                    "row_count": len(value),
+                    "char_count": len(table_text)
+                }
+                if table_window:
+                    record["row_range"] = [row_start_index + 1, row_start_index + len(table_rows)] if table_rows else [0, 0]
+                if include_content:
+                    record["text"] = table_text
+                    record["rows"] = table_rows
+                yield record
+    except (zipfile.BadZipFile, KeyError):
+        error = "无法读取docx文件"
+    except Exception as exc:
+        error = str(exc)
+    if error:
+        yield {
+            "type": "statistics",
+            "success": False,
+            "file_path": file_path,
+            "statistics": {
+                "paragraph_count": paragraph_count,
+                "table_count": len(table_row_counts),
+                "table_row_counts": table_row_counts,
+                "char_count": paragraph_chars + table_chars
+            },
+            "error": error
+        }
+        return
+
+    char_count = paragraph_chars + table_chars
+    if paragraph_count and table_row_counts:
+        char_count += 2
+
+    yield {
+        "type": "statistics",
+        "success": True,
+        "file_path": file_path,
+        "statistics": {
+            "paragraph_count": paragraph_count,
+            "table_count": len(table_row_counts),
+            "table_row_counts": table_row_counts,
+            "char_count": char_count
+        },
+        "error": None
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("file_path")
     parser.add_argument("--paragraph-start", type=int, default=None)
@@ -182,18 +1505,91 @@ def main():
     parser.add_argument("--table-end", type=int, default=None)
     parser.add_argument("--include-content", type=parse_bool, default=True)
     parser.add_argument("--output-mode", choices=["full", "list"], default="full")
+    parser.add_argument("--cache", type=parse_bool, default=True)
+    parser.add_argument("--stream", type=parse_bool, default=False)
+    parser.add_argument("--table-row-start", type=int, default=None)
+    parser.add_argument("--table-row-end", type=int, default=None)
+    parser.add_argument("--columns", type=parse_columns, default=None)
+    parser.add_argument("--index", type=parse_bool, default=True)
+    parser.add_argument("--max-chars", type=int, default=None)
+    parser.add_argument("--max-tokens", type=int, default=None)
+    parser.add_argument("--cursor", default=None)
+    parser.add_argument("--search", default=None)
+    parser.add_argument("--regex", type=parse_bool, default=False)
+    parser.add_argument("--ignore-case", type=parse_bool, default=False)
+    parser.add_argument("--max-hits", type=int, default=100)
+    parser.add_argument("--profile", type=parse_bool, default=False)
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="pretty")
+    parser.add_argument("--workers", type=int, default=1)
+    return parser
+
 
-    args = parser.parse_args()
-    result = extract_docx(
+def run_cli(args: argparse.Namespace, write: Optional[Callable[[dict], None]] = None) -> dict:
+    with profile_session("docx", args.file_path, args.profile) as profiler:
+        result = run_reader(args)
+    return finish_profile(profiler, result, args.profile, write)
+
+
+def run_reader(args: argparse.Namespace) -> dict:
+    if args.search is not None:
+        return search_docx(
+            args.file_path,
+            args.search,
+            use_regex=args.regex,
+            ignore_case=args.ignore_case,
+            max_hits=args.max_hits,
+            paragraph_start=args.paragraph_start,
+            paragraph_end=args.paragraph_end,
+            table_start=args.table_start,
+            table_end=args.table_end,
+            use_cache=args.cache,
+            use_index=args.index,
+            cursor=args.cursor
+        )
+    return extract_docx(
         args.file_path,
         paragraph_start=args.paragraph_start,
         paragraph_end=args.paragraph_end,
         table_start=args.table_start,
         table_end=args.table_end,
         include_content=args.include_content,
-        output_mode=args.output_mode
+        output_mode=args.output_mode,
+        use_cache=args.cache,
+        table_row_start=args.table_row_start,
+        table_row_end=args.table_row_end,
+        columns=args.columns,
+        use_index=args.index,
+        max_chars=args.max_chars,
+        max_tokens=args.max_tokens,
+        cursor=args.cursor,
+        workers=args.workers
     )
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+def stream_cli(args: argparse.Namespace) -> Iterator[dict]:
+    return profile_stream("docx", args.file_path, args.profile, stream_docx(
+        args.file_path,
+        paragraph_start=args.paragraph_start,
+        paragraph_end=args.paragraph_end,
+        table_start=args.table_start,
+        table_end=args.table_end,
+        include_content=args.include_content,
+        table_row_start=args.table_row_start,
+        table_row_end=args.table_row_end,
+        columns=args.columns
+    ))
+
+
+def main():
+    run_via_daemon("docx")
+    args = build_parser().parse_args()
+    if args.stream:
+        record = write_records(stream_cli(args), args.output_format, sys.stdout, sys.stderr)
+        if not record.get("success", True):
+            sys.exit(1)
+        return
+
+    result = run_cli(args, lambda result: write_result(result, args.output_format, sys.stdout, sys.stderr))
 
     if not result["success"]:
         sys.exit(1)
@@ -0,0 +1,71 @@
+import math
+import re
+from collections import Counter
+from typing import Iterable, List, Set, Tuple
+
+SAMPLE_PAGES = 16
+MIN_PAGES = 3
+PAGE_RATIO = 0.5
+EDGE_LINES = 3
+MAX_LINE_CHARS = 200
+NUMBERED_LINE_CHARS = 60
+DIGITS = re.compile(r"\d+")
+
+
+def line_keys(line: str) -> Tuple[str, ...]:
+    if len(line) > MAX_LINE_CHARS * 2:
+        return ()
+    text = " ".join(line.split())
+    if not text or len(text) > MAX_LINE_CHARS:
+        return ()
+    if len(text) <= NUMBERED_LINE_CHARS and DIGITS.search(text):
+        return text, "\0" + DIGITS.sub("#", text)
+    return (text,)
+
+
+def edge_indexes(line_count: int) -> List[int]:
+    head = min(EDGE_LINES, line_count)
+    return list(range(head)) + list(range(max(head, line_count - EDGE_LINES), line_count))
+
+
+def sample_page_indexes(start: int, end: int, count: int = SAMPLE_PAGES) -> List[int]:
+    total = end - start
+    if total <= count:
+        return list(range(start, end))
+    return sorted({start + index * (total - 1) // (count - 1) for index in range(count)})
+
+
+def detect_repeated_lines(pages: Iterable[str]) -> Set[str]:
+    counts = Counter()
+    page_count = 0
+    for page in pages:
+        if not page:
+            continue
+        page_count += 1
+        lines = page.split("\n")
+        counts.update({key for index in edge_indexes(len(lines)) for key in line_keys(lines[index])})
+    if page_count < MIN_PAGES:
+        return set()
+    threshold = max(MIN_PAGES, int(math.ceil(page_count * PAGE_RATIO)))
+    return {key for key, count in counts.items() if count >= threshold}
+
+
+def strip_page(page: str, repeated: Set[str]) -> Tuple[str, int]:
+    if not page or not repeated:
+        return page, 0
+    lines = page.split("\n")
+    removed = {index for index in edge_indexes(len(lines)) if not repeated.isdisjoint(line_keys(lines[index]))}
+    if not removed:
+        return page, 0
+    return "\n".join(line for index, line in enumerate(lines) if index not in removed).strip(), len(removed)
+
+
+def strip_repeated_lines(pages: List[str]) -> Tuple[List[str], int]:
+    repeated = detect_repeated_lines(pages[index] for index in sample_page_indexes(0, len(pages)))
+    stripped = []
+    removed_lines = 0
+    for page in pages:
+        text, removed = strip_page(page, repeated)
+        stripped.append(text)
+        removed_lines += removed
+    return stripped, removed_lines
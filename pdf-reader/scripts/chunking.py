@@ -0,0 +1,152 @@
+import hashlib
+import os
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+CJK_CHARACTER = re.compile("[\u2e80-\u9fff\u3040-\u30ff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]")
+
+
+def estimate_tokens(text: str) -> int:
+    cjk_count = len(CJK_CHARACTER.findall(text))
+    return cjk_count + (len(text) - cjk_count + 3) // 4
+
+
+def file_fingerprint(file_path: str) -> str:
+    stat = os.stat(file_path)
+    identity = "{0}:{1}".format(stat.st_mtime_ns, stat.st_size)
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:12]
+
+
+def format_cursor(file_path: str, positions: Dict[str, int]) -> str:
+    body = ",".join("{0}={1}".format(key, value) for key, value in positions.items())
+    return body + "@" + file_fingerprint(file_path)
+
+
+def parse_cursor(cursor: str, file_path: str, keys: List[str]) -> Dict[str, int]:
+    body, _, fingerprint = cursor.partition("@")
+    positions = {}
+    try:
+        for part in body.split(","):
+            key, value = part.split("=", 1)
+            if key not in keys or int(value) < 0:
+                raise ValueError(cursor)
+            positions[key] = int(value)
+    except ValueError:
+        raise ValueError("cursor 格式错误: " + cursor)
+    if fingerprint != file_fingerprint(file_path):
+        raise ValueError("文件已修改，cursor 已失效，请去掉 --cursor 重新读取")
+    return positions
+
+
+def check_budget(max_chars: Optional[int], max_tokens: Optional[int]) -> Optional[str]:
+    if max_chars is not None and max_chars <= 0:
+        return "max-chars 必须为正整数"
+    if max_tokens is not None and max_tokens <= 0:
+        return "max-tokens 必须为正整数"
+    return None
+
+
+class ChunkBudget:
+    def __init__(self, max_chars: Optional[int] = None, max_tokens: Optional[int] = None):
+        self.max_chars = max_chars
+        self.max_tokens = max_tokens
+        self.char_count = 0
+        self.token_count = 0
+
+    @property
+    def empty(self) -> bool:
+        return self.char_count == 0
+
+    def fits(self, text: str, separator: str = "") -> bool:
+        return self.fits_length(len(text), len(CJK_CHARACTER.findall(text)), separator)
+
+    def fits_length(self, length: int, cjk_count: int, separator: str = "") -> bool:
+        if not length:
+            return True
+        if self.empty:
+            separator = ""
+        length += len(separator)
+        if self.max_chars is not None and self.char_count + length > self.max_chars:
+            return False
+        if self.max_tokens is not None and self.token_count + cjk_count + (length - cjk_count + 3) // 4 > self.max_tokens:
+            return False
+        return True
+
+    def add(self, text: str, separator: str = "") -> bool:
+        if not self.empty and not self.fits(text, separator):
+            return False
+        if text:
+            if self.empty:
+                separator = ""
+            self.char_count += len(separator) + len(text)
+            self.token_count += estimate_tokens(separator + text)
+        return True
+
+
+def collect_document_chunk(
+    paragraphs: Iterable[Tuple[int, str]],
+    tables: Callable[[int, int], Iterable[Tuple[int, Iterable[List[str]]]]],
+    positions: Dict[str, int],
+    budget: ChunkBudget,
+    columns: Optional[List[int]] = None
+) -> dict:
+    chunk = {
+        "paragraphs": [],
+        "paragraph_range": [0, 0],
+        "tables": [],
+        "table_range": [0, 0],
+        "table_row_ranges": [],
+        "next": None
+    }
+    if "paragraph" in positions:
+        for paragraph_index, text in paragraphs:
+            if not budget.add(text, "\n"):
+                chunk["next"] = {"paragraph": paragraph_index}
+                return chunk
+            if not chunk["paragraphs"]:
+                chunk["paragraph_range"][0] = paragraph_index + 1
+            chunk["paragraph_range"][1] = paragraph_index + 1
+            chunk["paragraphs"].append(text)
+
+    table_start_index = positions.get("table", 0)
+    row_start_index = positions.get("row", 0)
+    for table_index, rows in tables(table_start_index, row_start_index):
+        first_row = row_start_index if table_index == table_start_index else 0
+        rows = iter(rows)
+        row_texts = []
+        table_length = 0
+        table_cjk_count = 0
+        fits = True
+        for cells in rows:
+            row_text = "\t".join(
+                cells if columns is None else [cells[column - 1] for column in columns if column <= len(cells)]
+            )
+            table_length += len(row_text) + (1 if row_texts else 0)
+            table_cjk_count += len(CJK_CHARACTER.findall(row_text))
+            row_texts.append(row_text)
+            if not budget.fits_length(table_length, table_cjk_count, "\n\n"):
+                fits = False
+                break
+        if fits:
+            budget.add("\n".join(row_texts), "\n\n")
+            taken = len(row_texts)
+        elif not budget.empty:
+            chunk["next"] = {"table": table_index, "row": first_row}
+            return chunk
+        else:
+            taken = 0
+            for row_text in row_texts:
+                if not budget.add(row_text, "\n" if taken else "\n\n"):
+                    break
+                taken += 1
+            if taken == len(row_texts) and next(rows, None) is None:
+                fits = True
+        if not chunk["tables"]:
+            chunk["table_range"][0] = table_index + 1
+        chunk["table_range"][1] = table_index + 1
+        chunk["tables"].append("\n".join(row_texts[:taken]))
+        chunk["table_row_ranges"].append([first_row + 1, first_row + taken] if taken else [0, 0])
+        if not fits:
+            chunk["next"] = {"table": table_index, "row": first_row + taken}
+            return chunk
+    return chunk
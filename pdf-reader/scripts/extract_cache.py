@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Optional
+from profiling import add_bytes_read, profile_phase
+
+CACHE_VERSION = 4
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+USAGE_FILE = "usage"
+
+
+def cache_dir() -> str:
+    directory = os.environ.get("DOC_READER_CACHE_DIR")
+    if directory:
+        return directory
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "my-agent-skills", "extract")
+
+
+def cache_max_bytes() -> int:
+    try:
+        return int(os.environ.get("DOC_READER_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+    except ValueError:
+        return DEFAULT_MAX_BYTES
+
+
+def cache_disabled() -> bool:
+    return os.environ.get("DOC_READER_NO_CACHE", "").lower() in ("1", "true", "yes", "y")
+
+
+def cache_key(reader: str, file_path: str) -> Optional[str]:
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    identity = "\0".join([
+        str(CACHE_VERSION),
+        reader,
+        os.path.abspath(file_path),
+        str(stat.st_mtime_ns),
+        str(stat.st_size)
+    ])
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def load_units(reader: str, file_path: str) -> Optional[dict]:
+    if cache_disabled():
+        return None
+    key = cache_key(reader, file_path)
+    if key is None:
+        return None
+    entry_path = os.path.join(cache_dir(), key + ".json")
+    try:
+        with profile_phase("cache_load"), open(entry_path, "r", encoding="utf-8") as handle:
+            units = json.load(handle)
+            add_bytes_read("cache", os.fstat(handle.fileno()).st_size)
+        os.utime(entry_path, None)
+    except (OSError, ValueError):
+        return None
+    return units
+
+
+def store_units(reader: str, file_path: str, units: dict) -> None:
+    if cache_disabled():
+        return
+    key = cache_key(reader, file_path)
+    if key is None:
+        return
+    directory = cache_dir()
+    entry_path = os.path.join(directory, key + ".json")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        try:
+            old_size = os.path.getsize(entry_path)
+        except OSError:
+            old_size = 0
+        with profile_phase("cache_store"):
+            handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as stream:
+                    json.dump(units, stream, ensure_ascii=False, separators=(",", ":"))
+                new_size = os.path.getsize(temp_path)
+                os.replace(temp_path, entry_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+        update_usage(directory, new_size - old_size, cache_max_bytes())
+    except OSError:
+        return
+
+
+def read_usage(directory: str) -> Optional[int]:
+    try:
+        with open(os.path.join(directory, USAGE_FILE), "r", encoding="ascii") as handle:
+            return int(handle.read())
+    except (OSError, ValueError):
+        return None
+
+
+def write_usage(directory: str, total: int) -> None:
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "w", encoding="ascii") as stream:
+            stream.write(str(total))
+        os.replace(temp_path, os.path.join(directory, USAGE_FILE))
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def update_usage(directory: str, delta: int, max_bytes: int) -> None:
+    total = read_usage(directory)
+    if total is None or total + delta > max_bytes:
+        total = evict(directory, max_bytes)
+    else:
+        total += delta
+    write_usage(directory, total)
+
+
+def evict(directory: str, max_bytes: int) -> int:
+    entries = []
+    total = 0
+    for entry in os.scandir(directory):
+        if not entry.name.endswith(".json"):
+            continue
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total += stat.st_size
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+    return total
@@ -0,0 +1,145 @@
+import importlib.util
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+from profiling import profile_phase, profile_unit
+
+BACKENDS = ["auto", "pypdf2", "pdfminer"]
+BACKEND_ORDER = ["pypdf2", "pdfminer"]
+PROBE_MIN_PAGES = 4
+PROBE_PAGE_OFFSET = 2
+
+
+def installed_backends() -> List[str]:
+    return [name for name in BACKEND_ORDER if name == "pypdf2" or importlib.util.find_spec("pdfminer") is not None]
+
+
+def check_backend(backend: str) -> Optional[str]:
+    if backend not in BACKENDS:
+        return "backend 仅限 [{0}]".format(", ".join('"{0}"'.format(name) for name in BACKENDS))
+    if backend != "auto" and backend not in installed_backends():
+        return "未安装 pdfminer.six，无法使用 pdfminer 后端"
+    return None
+
+
+class PdfMinerPages:
+    def __init__(self, file_path: str):
+        from pdfminer.converter import PDFPageAggregator
+        from pdfminer.layout import LAParams, LTTextContainer
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser
+
+        logging.getLogger("pdfminer").setLevel(logging.ERROR)
+        self.handle = open(file_path, "rb")
+        try:
+            document = PDFDocument(PDFParser(self.handle))
+            self.pages = PDFPage.create_pages(document)
+        except BaseException:
+            self.handle.close()
+            raise
+        self.loaded = []
+        self.text_container = LTTextContainer
+        resources = PDFResourceManager(caching=True)
+        self.device = PDFPageAggregator(resources, laparams=LAParams())
+        self.interpreter = PDFPageInterpreter(resources, self.device)
+
+    def page(self, index: int):
+        while len(self.loaded) <= index:
+            page = next(self.pages, None)
+            if page is None:
+                raise IndexError("页码超出范围")
+            self.loaded.append(page)
+        return self.loaded[index]
+
+    def extract_text(self, index: int) -> str:
+        self.interpreter.process_page(self.page(index))
+        layout = self.device.get_result()
+        return "\n".join(
+            item.get_text().strip() for item in layout if isinstance(item, self.text_container)
+        ).strip()
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+class PageTextExtractor:
+    def __init__(self, file_path: str, pypdf2_text: Callable[[int], str], backend: str = "auto"):
+        self.file_path = file_path
+        self.backend = backend
+        self.fallback_count = 0
+        self.probed: Dict[int, str] = {}
+        self.engines: Dict[str, Optional[Callable[[int], str]]] = {"pypdf2": pypdf2_text}
+        self.pdfminer: Optional[PdfMinerPages] = None
+
+    def engine(self, name: str) -> Optional[Callable[[int], str]]:
+        if name not in self.engines:
+            self.engines[name] = None
+            if name == "pdfminer" and name in installed_backends():
+                try:
+                    with profile_phase("open_pdfminer"):
+                        self.pdfminer = PdfMinerPages(self.file_path)
+                except Exception:
+                    return None
+                self.engines[name] = self.pdfminer.extract_text
+        return self.engines[name]
+
+    def run(self, name: str, index: int) -> Optional[str]:
+        engine = self.engine(name)
+        if engine is None:
+            return None
+        try:
+            return engine(index)
+        except Exception:
+            return None
+
+    def choose(self, page_indexes: List[int]) -> str:
+        if self.backend != "auto":
+            return self.backend
+        candidates = installed_backends()
+        if len(candidates) == 1 or len(page_indexes) < PROBE_MIN_PAGES:
+            self.backend = candidates[0]
+            return self.backend
+        sample = page_indexes[PROBE_PAGE_OFFSET]
+        timings = []
+        with profile_phase("backend_probe"):
+            for name in candidates:
+                started = time.perf_counter()
+                text = self.run(name, sample)
+                if text:
+                    timings.append((time.perf_counter() - started, name, text))
+        if not timings:
+            self.backend = candidates[0]
+            return self.backend
+        _, self.backend, self.probed[sample] = min(timings)
+        return self.backend
+
+    def extract(self, index: int) -> str:
+        with profile_unit("page"):
+            if index in self.probed:
+                return self.probed.pop(index)
+            engine = self.engine(self.backend)
+            error = None
+            try:
+                text = engine(index) if engine is not None else ""
+            except Exception as exc:
+                text, error = "", exc
+            if text:
+                return text
+            for name in installed_backends():
+                if name == self.backend:
+                    continue
+                fallback = self.run(name, index)
+                if fallback:
+                    self.fallback_count += 1
+                    return fallback
+            if error is not None:
+                raise error
+            return text
+
+    def close(self) -> None:
+        if self.pdfminer is not None:
+            self.pdfminer.close()
+            self.pdfminer = None
+            self.engines.pop("pdfminer", None)
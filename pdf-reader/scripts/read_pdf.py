@@ -1,9 +1,39 @@
 import argparse
-import json
 import os
+import re
 import sys
-from typing import Optional, Tuple
-from PyPDF2 import PdfReader
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
+from boilerplate import detect_repeated_lines, sample_page_indexes, strip_page, strip_repeated_lines
+from chunking import ChunkBudget, check_budget, estimate_tokens, format_cursor, parse_cursor
+from daemon_client import run_via_daemon
+from extract_cache import load_units, store_units
+from json_output import OUTPUT_FORMATS, write_records, write_result
+from pdf_backends import BACKENDS, PageTextExtractor, check_backend
+from profiling import (
+    add_bytes_read,
+    finish_profile,
+    profile_iter,
+    profile_phase,
+    profile_session,
+    profile_stream,
+    profile_unit
+)
+from text_search import SearchCollector, check_max_hits, compile_search
+
+if TYPE_CHECKING:
+    from PyPDF2 import PdfReader
+
+PDF_LITERAL_STRING = re.compile(rb"\((?:[^\\()]+|\\.)*\)", re.S)
+PDF_HEX_STRING = re.compile(rb"<[0-9A-Fa-f]+>")
+PDF_TEXT_TOKEN = re.compile(
+    rb"/([^\s/\[\]()<>{}%]+)\s+[-+.\d]+\s+Tf|(" + PDF_LITERAL_STRING.pattern + rb")|(" + PDF_HEX_STRING.pattern + rb")",
+    re.S
+)
+PAGES_PER_TASK = 16
+INHERITABLE_PAGE_ATTRIBUTES = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+
+_worker_extractor = None
 
 
 def parse_bool(value: str) -> bool:
@@ -29,11 +59,348 @@ def normalize_range(total: int, start: Optional[int], end: Optional[int]) -> Tup
     return start - 1, end
 
 
+def read_metadata(reader: "PdfReader") -> dict:
+    if not reader.metadata:
+        return {}
+    return {
+        "title": reader.metadata.title,
+        "author": reader.metadata.author,
+        "creator": reader.metadata.creator,
+        "producer": reader.metadata.producer,
+        "subject": reader.metadata.subject
+    }
+
+
+def open_pdf(file_path: str) -> Tuple[Optional["PdfReader"], Optional[str]]:
+    from PyPDF2 import PdfReader
+
+    try:
+        with profile_phase("open"):
+            reader = PdfReader(file_path)
+        add_bytes_read("source", os.path.getsize(file_path))
+        if reader.is_encrypted:
+            try:
+                with profile_phase("decrypt"):
+                    if reader.decrypt("") == 0:
+                        return None, "PDF已加密，无法读取"
+            except Exception:
+                return None, "PDF已加密，无法读取"
+    except Exception as exc:
+        return None, str(exc)
+    return reader, None
+
+
+def object_location(reader: "PdfReader", idnum: int, generation: int) -> list:
+    if generation == 0 and idnum in reader.xref_objStm:
+        stream_number, position = reader.xref_objStm[idnum]
+        return ["stream", stream_number, position]
+    return ["offset", reader.xref.get(generation, {}).get(idnum)]
+
+
+def build_page_index(reader: "PdfReader") -> Optional[dict]:
+    pages = []
+    with profile_phase("page_index"):
+        for page in reader.pages:
+            reference = page.indirect_reference
+            if reference is None:
+                return None
+            pages.append([reference.idnum, reference.generation] + object_location(
+                reader, reference.idnum, reference.generation
+            ))
+    return {
+        "page_count": len(pages),
+        "pages": pages
+    }
+
+
+def load_page_refs(reader: "PdfReader", page_index: Optional[dict]) -> Optional[list]:
+    if page_index is None:
+        return None
+    page_refs = page_index["pages"]
+    with profile_phase("page_index"):
+        for idnum, generation, *location in page_refs:
+            if object_location(reader, idnum, generation) != location:
+                return None
+    return page_refs
+
+
+def refresh_page_index(reader: "PdfReader", file_path: str) -> None:
+    page_index = build_page_index(reader)
+    if page_index is not None:
+        store_units("pdf-index", file_path, page_index)
+
+
+def get_page(reader: "PdfReader", index: int, page_refs: Optional[list] = None):
+    if page_refs is None:
+        return reader.pages[index]
+    from PyPDF2 import PageObject
+    from PyPDF2.generic import IndirectObject
+
+    reference = IndirectObject(page_refs[index][0], page_refs[index][1], reader)
+    page = reference.get_object()
+    inherited = {}
+    parent = page.get("/Parent")
+    visited = set()
+    while parent is not None and id(parent.get_object()) not in visited:
+        parent = parent.get_object()
+        visited.add(id(parent))
+        for attribute in INHERITABLE_PAGE_ATTRIBUTES:
+            if attribute not in page and attribute not in inherited and attribute in parent:
+                inherited[attribute] = parent[attribute]
+        parent = parent.get("/Parent")
+    page_object = PageObject(reader, reference)
+    page_object.update(page)
+    page_object.update(inherited)
+    return page_object
+
+
+def extract_page_text(reader: "PdfReader", index: int, page_refs: Optional[list] = None) -> str:
+    return (get_page(reader, index, page_refs).extract_text() or "").strip()
+
+
+def open_page_extractor(
+    reader: "PdfReader",
+    file_path: str,
+    page_refs: Optional[list],
+    backend: str
+) -> PageTextExtractor:
+    return PageTextExtractor(file_path, lambda index: extract_page_text(reader, index, page_refs), backend)
+
+
+def load_page_units(file_path: str, backend: str) -> Optional[dict]:
+    units = load_units("pdf", file_path)
+    if units is not None and backend != "auto" and units.get("backend", "pypdf2") not in (None, backend):
+        return None
+    return units
+
+
+def font_code_widths(page) -> Dict[bytes, int]:
+    node = page
+    resources = None
+    while node is not None and resources is None:
+        resources = node.get("/Resources")
+        parent = node.get("/Parent")
+        node = parent.get_object() if parent is not None else None
+    fonts = resources.get_object().get("/Font") if resources is not None else None
+    if fonts is None:
+        return {}
+    widths = {}
+    for name, font in fonts.get_object().items():
+        subtype = font.get_object().get("/Subtype")
+        widths[name.lstrip("/").encode("latin-1", "replace")] = 2 if subtype == "/Type0" else 1
+    return widths
+
+
+def estimate_page_chars(page) -> int:
+    contents = page.get("/Contents")
+    if contents is None:
+        return 0
+    contents = contents.get_object()
+    streams = contents if isinstance(contents, list) else [contents]
+    data = b"\n".join(stream.get_object().get_data() for stream in streams)
+    widths = font_code_widths(page)
+    width = 1
+    char_count = 0
+    for match in PDF_TEXT_TOKEN.finditer(data):
+        font, literal, hex_string = match.groups()
+        if font is not None:
+            width = widths.get(font, 1)
+        elif literal is not None:
+            char_count += (len(literal) - 2 - literal.count(b"\\")) // width
+        else:
+            char_count += (len(hex_string) - 2) // (2 * width)
+    return max(char_count, 0)
+
+
+def init_page_worker(file_path: str, page_refs: Optional[list] = None, backend: str = "pypdf2") -> None:
+    global _worker_extractor
+    reader, error = open_pdf(file_path)
+    if error:
+        raise RuntimeError(error)
+    _worker_extractor = open_page_extractor(reader, file_path, page_refs, backend)
+
+
+def extract_page_chunk(page_indexes: List[int]) -> List[str]:
+    return [_worker_extractor.extract(index) for index in page_indexes]
+
+
+def iter_page_texts(
+    extractor: PageTextExtractor,
+    file_path: str,
+    page_indexes: List[int],
+    workers: int = 1,
+    page_refs: Optional[list] = None
+) -> Iterator[str]:
+    extractor.choose(page_indexes)
+    if workers <= 1 or len(page_indexes) < 2:
+        for index in page_indexes:
+            yield extractor.extract(index)
+        return
+
+    chunk_size = max(1, min(PAGES_PER_TASK, len(page_indexes) // workers))
+    chunks = [page_indexes[i:i + chunk_size] for i in range(0, len(page_indexes), chunk_size)]
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        initializer=init_page_worker,
+        initargs=(file_path, page_refs, extractor.backend)
+    ) as executor:
+        for texts in profile_iter("worker_pool", executor.map(extract_page_chunk, chunks)):
+            for text in texts:
+                yield text
+
+
+def extract_pdf_chunk(
+    file_path: str,
+    page_start: Optional[int],
+    page_end: Optional[int],
+    include_content: bool,
+    use_cache: bool,
+    use_index: bool,
+    max_chars: Optional[int],
+    max_tokens: Optional[int],
+    cursor: Optional[str],
+    backend: str = "auto",
+    strip_boilerplate: bool = False
+) -> dict:
+    error = check_budget(max_chars, max_tokens)
+    resume_index = None
+    if error is None and cursor:
+        try:
+            resume_index = parse_cursor(cursor, file_path, ["page"]).get("page", 0)
+        except ValueError as exc:
+            error = str(exc)
+
+    units = load_page_units(file_path, backend) if use_cache and error is None else None
+    reader = None
+    page_refs = None
+    if units is None and error is None:
+        reader, error = open_pdf(file_path)
+        if reader is not None:
+            page_refs = load_page_refs(reader, load_units("pdf-index", file_path) if use_index else None)
+            if page_refs is None and use_index:
+                refresh_page_index(reader, file_path)
+            units = {
+                "page_count": len(page_refs) if page_refs is not None else len(reader.pages),
+                "metadata": read_metadata(reader),
+                "backend": None,
+                "pages": {}
+            }
+    if error:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "content": "",
+            "metadata": {},
+            "statistics": {
+                "page_count": 0,
+                "char_count": 0
+            },
+            "next_cursor": None,
+            "error": error
+        }
+
+    range_start_index, page_end_index = normalize_range(units["page_count"], page_start, page_end)
+    page_start_index = range_start_index
+    if resume_index is not None:
+        page_start_index = max(page_start_index, resume_index)
+    budget = ChunkBudget(max_chars, max_tokens)
+    texts = []
+    page_range = [0, 0]
+    next_page_index = None
+    units_changed = False
+    extractor = None
+    repeated = set()
+    removed_chars = 0
+    removed_lines = 0
+
+    def page_text(page_index: int) -> Optional[str]:
+        nonlocal reader, page_refs, extractor, units_changed, error
+        key = str(page_index)
+        if key not in units["pages"]:
+            if extractor is None:
+                if reader is None:
+                    reader, error = open_pdf(file_path)
+                    if error:
+                        return None
+                    page_refs = load_page_refs(reader, load_units("pdf-index", file_path) if use_index else None)
+                extractor = open_page_extractor(reader, file_path, page_refs, units.get("backend") or backend)
+                units["backend"] = extractor.choose(list(range(page_index, page_end_index)))
+            units["pages"][key] = extractor.extract(page_index)
+            units_changed = True
+        return units["pages"][key]
+
+    if strip_boilerplate:
+        with profile_phase("strip_boilerplate"):
+            repeated = detect_repeated_lines(
+                page_text(page_index) for page_index in sample_page_indexes(range_start_index, page_end_index)
+            )
+    for page_index in range(page_start_index, page_end_index):
+        text = page_text(page_index)
+        if text is None:
+            break
+        stripped, removed = strip_page(text, repeated)
+        if not budget.add(stripped, "\n\n"):
+            next_page_index = page_index
+            break
+        removed_chars += len(text) - len(stripped)
+        removed_lines += removed
+        text = stripped
+        if text:
+            texts.append(text)
+        page_range = [page_range[0] or page_index + 1, page_index + 1]
+    if extractor is not None:
+        extractor.close()
+    if use_cache and units_changed:
+        store_units("pdf", file_path, units)
+    if error:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "content": "",
+            "metadata": {},
+            "statistics": {
+                "page_count": 0,
+                "char_count": 0
+            },
+            "next_cursor": None,
+            "error": error
+        }
+
+    content = "\n\n".join(texts)
+    statistics = {
+        "page_count": page_range[1] - page_range[0] + 1 if page_range[1] else 0,
+        "page_range": page_range,
+        "char_count": len(content),
+        "token_count": estimate_tokens(content),
+        "backend": units.get("backend")
+    }
+    if strip_boilerplate:
+        statistics["removed_char_count"] = removed_chars
+        statistics["removed_line_count"] = removed_lines
+    return {
+        "success": True,
+        "file_path": file_path,
+        "content": content if include_content else "",
+        "metadata": units["metadata"],
+        "statistics": statistics,
+        "next_cursor": format_cursor(file_path, {"page": next_page_index}) if next_page_index is not None else None,
+        "error": None
+    }
+
+
 def extract_pdf(
     file_path: str,
     page_start: Optional[int] = None,
     page_end: Optional[int] = None,
-    include_content: bool = True
+    include_content: bool = True,
+    use_cache: bool = True,
+    workers: int = 1,
+    use_index: bool = True,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[str] = None,
+    strip_boilerplate: bool = False,
+    backend: str = "auto"
 ) -> dict:
     if not os.path.isfile(file_path):
         return {
@@ -61,35 +428,8 @@ def extract_pdf(
             "error": "仅支持.pdf格式"
         }
 
-    try:
-        reader = PdfReader(file_path)
-        if reader.is_encrypted:
-            try:
-                if reader.decrypt("") == 0:
-                    return {
-                        "success": False,
-                        "file_path": file_path,
-                        "content": "",
-                        "metadata": {},
-                        "statistics": {
-                            "page_count": 0,
-                            "char_count": 0
-                        },
-                        "error": "PDF已加密，无法读取"
-                    }
-            except Exception:
-                return {
-                    "success": False,
-                    "file_path": file_path,
-                    "content": "",
-                    "metadata": {},
-                    "statistics": {
-                        "page_count": 0,
-                        "char_count": 0
-                    },
-                    "error": "PDF已加密，无法读取"
-                }
-    except Exception as exc:
+    error = check_backend(backend)
+    if error:
         return {
             "success": False,
             "file_path": file_path,
@@ -99,62 +439,417 @@ def extract_pdf(
                 "page_count": 0,
                 "char_count": 0
             },
-            "error": str(exc)
+            "error": error
         }
 
-    pages = []
-    char_count = 0
-    for page in reader.pages:
-        text = page.extract_text() or ""
-        page_text = text.strip()
-        pages.append(page_text)
-        char_count += len(page_text)
+    if max_chars is not None or max_tokens is not None or cursor is not None:
+        return extract_pdf_chunk(
+            file_path, page_start, page_end, include_content, use_cache, use_index, max_chars, max_tokens, cursor,
+            backend, strip_boilerplate
+        )
 
-    page_start_index, page_end_index = normalize_range(len(pages), page_start, page_end)
-    selected_pages = pages[page_start_index:page_end_index]
+    units = load_page_units(file_path, backend) if use_cache else None
+    page_index = load_units("pdf-index", file_path) if use_index else None
+    reader = None
+    page_refs = None
+    units_created = units is None
+    if units_created:
+        reader, error = open_pdf(file_path)
+        if error:
+            return {
+                "success": False,
+                "file_path": file_path,
+                "content": "",
+                "metadata": {},
+                "statistics": {
+                    "page_count": 0,
+                    "char_count": 0
+                },
+                "error": error
+            }
+        page_refs = load_page_refs(reader, page_index)
+        units = {
+            "page_count": len(page_refs) if page_refs is not None else len(reader.pages),
+            "metadata": read_metadata(reader),
+            "backend": None,
+            "pages": {}
+        }
+
+    page_start_index, page_end_index = normalize_range(units["page_count"], page_start, page_end)
+    page_keys = [str(page_index) for page_index in range(page_start_index, page_end_index)]
+    missing_keys = [key for key in page_keys if key not in units["pages"]]
+    if missing_keys and reader is None:
+        reader, error = open_pdf(file_path)
+        if error:
+            return {
+                "success": False,
+                "file_path": file_path,
+                "content": "",
+                "metadata": {},
+                "statistics": {
+                    "page_count": 0,
+                    "char_count": 0
+                },
+                "error": error
+            }
+        page_refs = load_page_refs(reader, page_index)
+    if reader is not None and page_refs is None and use_index:
+        refresh_page_index(reader, file_path)
 
+    if not include_content and missing_keys and not strip_boilerplate:
+        char_count = 0
+        non_empty_pages = 0
+        for key in page_keys:
+            if key in units["pages"]:
+                page_chars = len(units["pages"][key])
+            else:
+                with profile_unit("page"):
+                    page_chars = estimate_page_chars(get_page(reader, int(key), page_refs))
+            if page_chars:
+                char_count += page_chars
+                non_empty_pages += 1
+        if non_empty_pages > 1:
+            char_count += 2 * (non_empty_pages - 1)
+        if use_cache and units_created:
+            store_units("pdf", file_path, units)
+        return {
+            "success": True,
+            "file_path": file_path,
+            "content": "",
+            "metadata": units["metadata"],
+            "statistics": {
+                "page_count": len(page_keys),
+                "char_count": char_count,
+                "char_count_estimated": True
+            },
+            "error": None
+        }
+
+    if missing_keys:
+        page_indexes = [int(key) for key in missing_keys]
+        extractor = open_page_extractor(reader, file_path, page_refs, units.get("backend") or backend)
+        try:
+            page_texts = iter_page_texts(extractor, file_path, page_indexes, workers, page_refs)
+            for key, text in zip(missing_keys, page_texts):
+                units["pages"][key] = text
+        finally:
+            extractor.close()
+        units["backend"] = extractor.backend
+        if use_cache:
+            store_units("pdf", file_path, units)
+
+    selected_pages = [units["pages"][key] for key in page_keys]
     content = "\n\n".join([p for p in selected_pages if p]).strip()
     char_count = len(content)
+    statistics = {
+        "page_count": len(selected_pages),
+        "char_count": char_count,
+        "backend": units.get("backend")
+    }
+    if strip_boilerplate:
+        with profile_phase("strip_boilerplate"):
+            stripped_pages, removed_lines = strip_repeated_lines(selected_pages)
+        if removed_lines:
+            content = "\n\n".join([p for p in stripped_pages if p]).strip()
+        statistics["char_count"] = len(content)
+        statistics["removed_char_count"] = char_count - len(content)
+        statistics["removed_line_count"] = removed_lines
     if not include_content:
         content = ""
-    metadata = {}
-    if reader.metadata:
-        metadata = {
-            "title": reader.metadata.title,
-            "author": reader.metadata.author,
-            "creator": reader.metadata.creator,
-            "producer": reader.metadata.producer,
-            "subject": reader.metadata.subject
-        }
 
     return {
         "success": True,
         "file_path": file_path,
         "content": content,
-        "metadata": metadata,
+        "metadata": units["metadata"],
+        "statistics": statistics,
+        "error": None
+    }
+
+
+def search_pdf(
+    file_path: str,
+    pattern: str,
+    use_regex: bool = False,
+    ignore_case: bool = False,
+    max_hits: Optional[int] = 100,
+    page_start: Optional[int] = None,
+    page_end: Optional[int] = None,
+    use_cache: bool = True,
+    use_index: bool = True,
+    cursor: Optional[str] = None,
+    backend: str = "auto"
+) -> dict:
+    error = None
+    regex = None
+    resumed = None
+    if not os.path.isfile(file_path):
+        error = "文件不存在"
+    elif not file_path.lower().endswith(".pdf"):
+        error = "仅支持.pdf格式"
+    else:
+        error = check_backend(backend) or check_max_hits(max_hits)
+    if error is None:
+        try:
+            regex = compile_search(pattern, use_regex, ignore_case)
+            if cursor:
+                resumed = parse_cursor(cursor, file_path, ["page", "offset"])
+        except ValueError as exc:
+            error = str(exc)
+
+    units = load_page_units(file_path, backend) if use_cache and error is None else None
+    reader = None
+    page_refs = None
+    extractor = None
+    if error is None:
+        reader, error = open_pdf(file_path) if units is None else (None, None)
+        if reader is not None:
+            page_refs = load_page_refs(reader, load_units("pdf-index", file_path) if use_index else None)
+            if page_refs is None and use_index:
+                refresh_page_index(reader, file_path)
+    if error:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "hits": [],
+            "statistics": {
+                "page_count": 0,
+                "hit_count": 0
+            },
+            "next_cursor": None,
+            "error": error
+        }
+
+    page_count = units["page_count"] if units is not None else (len(page_refs) if page_refs is not None else len(reader.pages))
+    page_start_index, page_end_index = normalize_range(page_count, page_start, page_end)
+    offset = 0
+    if resumed is not None and "page" in resumed:
+        page_start_index = max(page_start_index, resumed["page"])
+        offset = resumed.get("offset", 0) if resumed["page"] == page_start_index else 0
+    collector = SearchCollector(regex, max_hits)
+    next_position = None
+    for page_index in range(page_start_index, page_end_index):
+        text = units["pages"].get(str(page_index)) if units is not None else None
+        if text is None:
+            if extractor is None:
+                if reader is None:
+                    reader, error = open_pdf(file_path)
+                    if error:
+                        break
+                    page_refs = load_page_refs(reader, load_units("pdf-index", file_path) if use_index else None)
+                extractor = open_page_extractor(
+                    reader, file_path, page_refs, (units.get("backend") if units is not None else None) or backend
+                )
+                extractor.choose(list(range(page_index, page_end_index)))
+            text = extractor.extract(page_index)
+        if not collector.scan({"page_index": page_index + 1}, text, offset):
+            next_position = {"page": page_index, "offset": collector.stop_offset}
+            break
+        offset = 0
+    if extractor is not None:
+        extractor.close()
+    if error:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "hits": [],
+            "statistics": {
+                "page_count": 0,
+                "hit_count": 0
+            },
+            "next_cursor": None,
+            "error": error
+        }
+
+    return {
+        "success": True,
+        "file_path": file_path,
+        "hits": collector.hits,
         "statistics": {
-            "page_count": len(selected_pages),
-            "char_count": char_count
+            "page_count": collector.unit_count,
+            "hit_count": len(collector.hits)
         },
+        "next_cursor": format_cursor(file_path, next_position) if next_position is not None else None,
         "error": None
     }
 
 
-def main():
+def stream_pdf(
+    file_path: str,
+    page_start: Optional[int] = None,
+    page_end: Optional[int] = None,
+    include_content: bool = True,
+    workers: int = 1,
+    use_index: bool = True,
+    backend: str = "auto",
+    strip_boilerplate: bool = False
+) -> Iterator[dict]:
+    reader = None
+    if not os.path.isfile(file_path):
+        error = "文件不存在"
+    elif not file_path.lower().endswith(".pdf"):
+        error = "仅支持.pdf格式"
+    else:
+        error = check_backend(backend)
+        if error is None:
+            reader, error = open_pdf(file_path)
+    if error:
+        yield {
+            "type": "statistics",
+            "success": False,
+            "file_path": file_path,
+            "metadata": {},
+            "statistics": {
+                "page_count": 0,
+                "char_count": 0
+            },
+            "error": error
+        }
+        return
+
+    page_refs = load_page_refs(reader, load_units("pdf-index", file_path) if use_index else None)
+    if page_refs is None and use_index:
+        refresh_page_index(reader, file_path)
+    page_count = len(page_refs) if page_refs is not None else len(reader.pages)
+    page_start_index, page_end_index = normalize_range(page_count, page_start, page_end)
+    char_count = 0
+    non_empty_pages = 0
+    removed_chars = 0
+    removed_lines = 0
+    page_indexes = list(range(page_start_index, page_end_index))
+    extractor = open_page_extractor(reader, file_path, page_refs, backend)
+    sampled = {}
+    repeated = set()
+    if strip_boilerplate:
+        extractor.choose(page_indexes)
+        with profile_phase("strip_boilerplate"):
+            for page_index in sample_page_indexes(page_start_index, page_end_index):
+                sampled[page_index] = extractor.extract(page_index)
+            repeated = detect_repeated_lines(sampled.values())
+    page_texts = iter_page_texts(
+        extractor, file_path, [page_index for page_index in page_indexes if page_index not in sampled], workers, page_refs
+    )
+    for page_index in page_indexes:
+        page_text = sampled.pop(page_index) if page_index in sampled else next(page_texts)
+        stripped, removed = strip_page(page_text, repeated)
+        removed_chars += len(page_text) - len(stripped)
+        removed_lines += removed
+        page_text = stripped
+        if page_text:
+            char_count += len(page_text) + (2 if non_empty_pages else 0)
+            non_empty_pages += 1
+        record = {
+            "type": "page",
+            "page_index": page_index + 1,
+            "char_count": len(page_text)
+        }
+        if include_content:
+            record["text"] = page_text
+        yield record
+    extractor.close()
+
+    statistics = {
+        "page_count": page_end_index - page_start_index,
+        "char_count": char_count,
+        "backend": extractor.backend if page_indexes else None
+    }
+    if strip_boilerplate:
+        statistics["removed_char_count"] = removed_chars
+        statistics["removed_line_count"] = removed_lines
+    yield {
+        "type": "statistics",
+        "success": True,
+        "file_path": file_path,
+        "metadata": read_metadata(reader),
+        "statistics": statistics,
+        "error": None
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("file_path")
     parser.add_argument("--page-start", type=int, default=None)
     parser.add_argument("--page-end", type=int, default=None)
     parser.add_argument("--include-content", type=parse_bool, default=True)
+    parser.add_argument("--cache", type=parse_bool, default=True)
+    parser.add_argument("--stream", type=parse_bool, default=False)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--index", type=parse_bool, default=True)
+    parser.add_argument("--max-chars", type=int, default=None)
+    parser.add_argument("--max-tokens", type=int, default=None)
+    parser.add_argument("--cursor", default=None)
+    parser.add_argument("--search", default=None)
+    parser.add_argument("--regex", type=parse_bool, default=False)
+    parser.add_argument("--ignore-case", type=parse_bool, default=False)
+    parser.add_argument("--max-hits", type=int, default=100)
+    parser.add_argument("--strip-boilerplate", type=parse_bool, default=False)
+    parser.add_argument("--backend", choices=BACKENDS, default="auto")
+    parser.add_argument("--profile", type=parse_bool, default=False)
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="pretty")
+    return parser
+
+
+def run_cli(args: argparse.Namespace, write: Optional[Callable[[dict], None]] = None) -> dict:
+    with profile_session("pdf", args.file_path, args.profile) as profiler:
+        result = run_reader(args)
+    return finish_profile(profiler, result, args.profile, write)
 
-    args = parser.parse_args()
-    result = extract_pdf(
+
+def run_reader(args: argparse.Namespace) -> dict:
+    if args.search is not None:
+        return search_pdf(
+            args.file_path,
+            args.search,
+            use_regex=args.regex,
+            ignore_case=args.ignore_case,
+            max_hits=args.max_hits,
+            page_start=args.page_start,
+            page_end=args.page_end,
+            use_cache=args.cache,
+            use_index=args.index,
+            cursor=args.cursor,
+            backend=args.backend
+        )
+    return extract_pdf(
         args.file_path,
         page_start=args.page_start,
         page_end=args.page_end,
-        include_content=args.include_content
+        include_content=args.include_content,
+        use_cache=args.cache,
+        workers=args.workers,
+        use_index=args.index,
+        max_chars=args.max_chars,
+        max_tokens=args.max_tokens,
+        cursor=args.cursor,
+        strip_boilerplate=args.strip_boilerplate,
+        backend=args.backend
     )
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+def stream_cli(args: argparse.Namespace) -> Iterator[dict]:
+    return profile_stream("pdf", args.file_path, args.profile, stream_pdf(
+        args.file_path,
+        page_start=args.page_start,
+        page_end=args.page_end,
+        include_content=args.include_content,
+        workers=args.workers,
+        use_index=args.index,
+        backend=args.backend,
+        strip_boilerplate=args.strip_boilerplate
+    ))
+
+
+def main():
+    run_via_daemon("pdf")
+    args = build_parser().parse_args()
+    if args.stream:
+        record = write_records(stream_cli(args), args.output_format, sys.stdout, sys.stderr)
+        if not record.get("success", True):
+            sys.exit(1)
+        return
+
+    result = run_cli(args, lambda result: write_result(result, args.output_format, sys.stdout, sys.stderr))
 
     if not result["success"]:
         sys.exit(1)
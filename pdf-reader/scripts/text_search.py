@@ -0,0 +1,84 @@
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+
+SNIPPET_CONTEXT = 40
+WHITESPACE = re.compile(r"\s+")
+
+
+def compile_search(pattern: str, use_regex: bool = False, ignore_case: bool = False) -> Pattern:
+    if not pattern:
+        raise ValueError("search 不能为空")
+    try:
+        return re.compile(pattern if use_regex else re.escape(pattern), re.IGNORECASE if ignore_case else 0)
+    except re.error as exc:
+        raise ValueError("正则表达式错误: " + str(exc))
+
+
+def check_max_hits(max_hits: Optional[int]) -> Optional[str]:
+    if max_hits is not None and max_hits <= 0:
+        return "max-hits 必须为正整数"
+    return None
+
+
+def make_snippet(text: str, start: int, end: int, context: int = SNIPPET_CONTEXT) -> str:
+    left = max(0, start - context)
+    right = min(len(text), end + context)
+    snippet = WHITESPACE.sub(" ", text[left:right]).strip()
+    return ("…" if left else "") + snippet + ("…" if right < len(text) else "")
+
+
+class SearchCollector:
+    def __init__(self, regex: Pattern, max_hits: Optional[int] = None):
+        self.regex = regex
+        self.max_hits = max_hits
+        self.hits = []
+        self.unit_count = 0
+        self.stop_offset = None
+
+    @property
+    def done(self) -> bool:
+        return self.max_hits is not None and len(self.hits) >= self.max_hits
+
+    def scan(self, location: dict, text: str, offset: int = 0) -> bool:
+        if self.done:
+            self.stop_offset = 0
+            return False
+        self.unit_count += 1
+        for match in self.regex.finditer(text, offset):
+            if match.start() == match.end():
+                continue
+            if self.done:
+                self.stop_offset = match.start()
+                return False
+            hit = dict(location)
+            hit["offset"] = match.start()
+            hit["match"] = match.group(0)
+            hit["snippet"] = make_snippet(text, match.start(), match.end())
+            self.hits.append(hit)
+        return True
+
+
+def search_document(
+    collector: SearchCollector,
+    paragraphs: Iterable[Tuple[int, str]],
+    tables: Callable[[int, int], Iterable[Tuple[int, List[List[str]]]]],
+    positions: Dict[str, int]
+) -> Optional[Dict[str, int]]:
+    offset = positions.get("offset", 0)
+    if "paragraph" in positions:
+        for paragraph_index, text in paragraphs:
+            location = {"type": "paragraph", "paragraph_index": paragraph_index + 1}
+            if not collector.scan(location, text, offset if paragraph_index == positions["paragraph"] else 0):
+                return {"paragraph": paragraph_index, "offset": collector.stop_offset}
+        offset = 0
+
+    table_start_index = positions.get("table", 0)
+    row_start_index = positions.get("row", 0)
+    for table_index, rows in tables(table_start_index, row_start_index):
+        first_row = row_start_index if table_index == table_start_index else 0
+        for row_index, cells in enumerate(rows, first_row):
+            location = {"type": "table", "table_index": table_index + 1, "row_index": row_index + 1}
+            resumed = table_index == table_start_index and row_index == row_start_index
+            if not collector.scan(location, "\t".join(cells), offset if resumed else 0):
+                return {"table": table_index, "row": row_index, "offset": collector.stop_offset}
+    return None
@@ -0,0 +1,103 @@
+import json
+import os
+from json.encoder import encode_basestring
+from typing import Callable, Iterable, Iterator, Optional, TextIO
+
+OUTPUT_FORMATS = ["pretty", "compact", "text", "text-trailer"]
+STRING_CHUNK_CHARS = 64 * 1024
+WRITE_BUFFER_CHARS = 256 * 1024
+INLINE_DEPTH = 2
+
+_stdlib_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def fast_encoder() -> Optional[Callable[[object], str]]:
+    if os.environ.get("DOC_READER_JSON_ENCODER", "").lower() == "stdlib":
+        return None
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    def encode(value: object) -> str:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            return _stdlib_encoder.encode(value)
+
+    return encode
+
+
+def iter_json(value: object, encode: Callable[[object], str], depth: int = 0) -> Iterator[str]:
+    if isinstance(value, str):
+        if len(value) <= STRING_CHUNK_CHARS:
+            yield encode_basestring(value)
+            return
+        yield '"'
+        for start in range(0, len(value), STRING_CHUNK_CHARS):
+            yield encode_basestring(value[start:start + STRING_CHUNK_CHARS])[1:-1]
+        yield '"'
+    elif isinstance(value, dict) and depth < INLINE_DEPTH:
+        yield "{"
+        for index, (key, item) in enumerate(value.items()):
+            yield ("," if index else "") + encode_basestring(str(key)) + ":"
+            yield from iter_json(item, encode, depth + 1)
+        yield "}"
+    elif isinstance(value, (list, tuple)) and depth < INLINE_DEPTH:
+        yield "["
+        for index, item in enumerate(value):
+            if index:
+                yield ","
+            yield from iter_json(item, encode, depth + 1)
+        yield "]"
+    else:
+        yield encode(value)
+
+
+def write_json(value: object, stream: TextIO, encode: Optional[Callable[[object], str]] = None) -> None:
+    buffer = []
+    size = 0
+    for chunk in iter_json(value, encode or fast_encoder() or _stdlib_encoder.encode):
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= WRITE_BUFFER_CHARS:
+            stream.write("".join(buffer))
+            buffer = []
+            size = 0
+    buffer.append("\n")
+    stream.write("".join(buffer))
+
+
+def write_text(text: str, stream: TextIO) -> None:
+    for start in range(0, len(text), STRING_CHUNK_CHARS):
+        stream.write(text[start:start + STRING_CHUNK_CHARS])
+    if text and not text.endswith("\n"):
+        stream.write("\n")
+
+
+def write_result(result: dict, output_format: str, stdout: TextIO, stderr: TextIO) -> None:
+    if output_format == "pretty":
+        stdout.write(json.dumps(result, ensure_ascii=False, indent=2) + "\n")
+    elif output_format == "compact":
+        write_json(result, stdout)
+    else:
+        write_text(result.get("content") or "", stdout)
+        trailer = {key: value for key, value in result.items() if key != "content"}
+        write_json(trailer, stdout if output_format == "text-trailer" else stderr)
+    stdout.flush()
+
+
+def write_records(records: Iterable[dict], output_format: str, stdout: TextIO, stderr: TextIO) -> dict:
+    encode = fast_encoder() or _stdlib_encoder.encode
+    record = {}
+    for record in records:
+        if output_format == "pretty":
+            stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+        elif output_format == "compact":
+            write_json(record, stdout, encode)
+        elif record.get("type") != "statistics":
+            write_text(record.get("text") or "", stdout)
+        else:
+            write_json(record, stdout if output_format == "text-trailer" else stderr, encode)
+        stdout.flush()
+    return record
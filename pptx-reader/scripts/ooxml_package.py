@@ -0,0 +1,115 @@
+import io
+import json
+import mmap
+import os
+import sys
+import zipfile
+from typing import IO, List
+from profiling import add_bytes_read, profile_phase
+
+
+def io_stats_enabled() -> bool:
+    return os.environ.get("DOC_READER_IO_STATS", "").lower() in ("1", "true", "yes", "y")
+
+
+class MappedFile(io.RawIOBase):
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.handle = open(file_path, "rb")
+        self.size = os.fstat(self.handle.fileno()).st_size
+        if self.size == 0:
+            self.handle.close()
+            raise zipfile.BadZipFile("File is not a zip file")
+        self.data = mmap.mmap(self.handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.position = 0
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self.position = max(0, offset)
+        return self.position
+
+    def read(self, size: int = -1) -> bytes:
+        end = self.size if size is None or size < 0 else min(self.size, self.position + size)
+        data = self.data[self.position:end]
+        self.position += len(data)
+        self.bytes_read += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self.data.close()
+            self.handle.close()
+        super().close()
+
+
+class OoxmlPackage:
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        with profile_phase("open"):
+            self.file = MappedFile(file_path)
+            try:
+                self.zip = zipfile.ZipFile(self.file)
+            except Exception:
+                self.file.close()
+                raise
+        self.directory_bytes = self.file.bytes_read
+        self.parts_read: List[str] = []
+
+    def __enter__(self) -> "OoxmlPackage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def namelist(self) -> List[str]:
+        return self.zip.namelist()
+
+    def read(self, name: str) -> bytes:
+        data = self.zip.read(name)
+        self.parts_read.append(name)
+        return data
+
+    def open(self, name: str) -> IO[bytes]:
+        stream = self.zip.open(name)
+        self.parts_read.append(name)
+        return stream
+
+    def io_stats(self) -> dict:
+        return {
+            "file_path": self.file_path,
+            "file_size": self.file.size,
+            "bytes_read": self.file.bytes_read,
+            "directory_bytes": self.directory_bytes,
+            "parts_read": list(self.parts_read)
+        }
+
+    def close(self) -> None:
+        if self.file.closed:
+            return
+        add_bytes_read("source", self.file.bytes_read)
+        if io_stats_enabled():
+            sys.stderr.write(json.dumps({"io": self.io_stats()}, ensure_ascii=False) + "\n")
+        self.zip.close()
+        self.file.close()
+
+
+def open_package(file_path: str) -> OoxmlPackage:
+    return OoxmlPackage(file_path)
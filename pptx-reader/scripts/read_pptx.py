@@ -1,10 +1,24 @@
 import argparse
-import json
 import os
+import posixpath
 import sys
-from typing import Optional, Tuple
-from pptx import Presentation
-from pptx.exc import PackageNotFoundError
+import zipfile
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+from chunking import ChunkBudget, check_budget, estimate_tokens, format_cursor, parse_cursor
+from daemon_client import run_via_daemon
+from extract_cache import load_units, store_units
+from ooxml_package import OoxmlPackage, open_package
+from json_output import OUTPUT_FORMATS, write_records, write_result
+from profiling import finish_profile, profile_phase, profile_session, profile_stream, profile_unit
+from text_search import SearchCollector, check_max_hits, compile_search
+
+A_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+P_NS = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PR_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+RT_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+RT_NOTES_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide"
 
 
 def parse_bool(value: str) -> bool:
@@ -30,29 +44,243 @@ def normalize_range(total: int, start: Optional[int], end: Optional[int]) -> Tup
     return start - 1, end
 
 
-def extract_pptx(
-    file_path: str,
-    slide_start: Optional[int] = None,
-    slide_end: Optional[int] = None,
-    include_content: bool = True,
-    output_mode: str = "full"
-) -> dict:
-    if not os.path.isfile(file_path):
+def read_relationships(package: OoxmlPackage, part_name: str) -> Dict[str, Tuple[str, str]]:
+    directory, file_name = posixpath.split(part_name)
+    rels_name = posixpath.join(directory, "_rels", file_name + ".rels")
+    try:
+        root = ElementTree.fromstring(package.read(rels_name))
+    except KeyError:
+        return {}
+    relationships = {}
+    for rel in root.iter(PR_NS + "Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = posixpath.normpath(posixpath.join(directory, rel.get("Target", "")))
+        relationships[rel.get("Id")] = (rel.get("Type"), target.lstrip("/"))
+    return relationships
+
+
+def list_slide_parts(package: OoxmlPackage) -> List[str]:
+    presentation_part = "ppt/presentation.xml"
+    relationships = read_relationships(package, presentation_part)
+    root = ElementTree.fromstring(package.read(presentation_part))
+    slide_parts = []
+    slide_list = root.find(P_NS + "sldIdLst")
+    if slide_list is None:
+        return slide_parts
+    for slide_id in slide_list.findall(P_NS + "sldId"):
+        rel = relationships.get(slide_id.get(R_NS + "id"))
+        if rel and rel[0] == RT_SLIDE:
+            slide_parts.append(rel[1])
+    return slide_parts
+
+
+def load_slide_parts(package: OoxmlPackage, file_path: str, use_index: bool = True) -> List[str]:
+    slide_index = load_units("pptx-index", file_path) if use_index else None
+    if slide_index is not None:
+        return slide_index["slide_parts"]
+    with profile_phase("slide_list"):
+        slide_parts = list_slide_parts(package)
+    if use_index:
+        store_units("pptx-index", file_path, {"slide_parts": slide_parts})
+    return slide_parts
+
+
+def text_body_text(text_body) -> str:
+    paragraphs = []
+    for paragraph in text_body.findall(A_NS + "p"):
+        parts = []
+        for child in paragraph:
+            if child.tag in (A_NS + "r", A_NS + "fld"):
+                parts.append(child.findtext(A_NS + "t") or "")
+            elif child.tag == A_NS + "br":
+                parts.append("\v")
+        paragraphs.append("".join(parts))
+    return "\n".join(paragraphs)
+
+
+def parse_slide_shapes(root) -> list:
+    shapes = []
+    shape_tree = root.find(P_NS + "cSld/" + P_NS + "spTree")
+    if shape_tree is None:
+        return shapes
+    for shape in shape_tree:
+        if shape.tag == P_NS + "sp":
+            text_body = shape.find(P_NS + "txBody")
+            shapes.append(text_body_text(text_body).strip() if text_body is not None else "")
+        elif shape.tag == P_NS + "graphicFrame":
+            table = shape.find(A_NS + "graphic/" + A_NS + "graphicData/" + A_NS + "tbl")
+            if table is not None:
+                rows = []
+                for row in table.findall(A_NS + "tr"):
+                    row_cells = []
+                    for cell in row.findall(A_NS + "tc"):
+                        text_body = cell.find(A_NS + "txBody")
+                        cell_text = text_body_text(text_body) if text_body is not None else ""
+                        row_cells.append(cell_text.strip())
+                    rows.append(row_cells)
+                shapes.append(rows)
+    return shapes
+
+
+def parse_notes_text(root) -> str:
+    shape_tree = root.find(P_NS + "cSld/" + P_NS + "spTree")
+    if shape_tree is None:
+        return ""
+    for shape in shape_tree.findall(P_NS + "sp"):
+        placeholder = shape.find(P_NS + "nvSpPr/" + P_NS + "nvPr/" + P_NS + "ph")
+        if placeholder is not None and placeholder.get("type") == "body":
+            text_body = shape.find(P_NS + "txBody")
+            return text_body_text(text_body) if text_body is not None else ""
+    return ""
+
+
+def read_slide_part(package: OoxmlPackage, part_name: str) -> dict:
+    with profile_unit("slide"):
+        notes_text = ""
+        for rel_type, target in read_relationships(package, part_name).values():
+            if rel_type == RT_NOTES_SLIDE:
+                notes_text = parse_notes_text(ElementTree.fromstring(package.read(target))).strip()
+                break
         return {
-            "success": False,
-            "file_path": file_path,
-            "content": "",
-            "slides": [],
-            "statistics": {
-                "slide_count": 0,
-                "table_count": 0,
-                "table_row_counts": [],
-                "char_count": 0
-            },
-            "error": "文件不存在"
+            "shapes": parse_slide_shapes(ElementTree.fromstring(package.read(part_name))),
+            "notes": notes_text
         }
 
-    if not file_path.lower().endswith(".pptx"):
+
+def parse_columns(value: str) -> List[int]:
+    columns = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            start, end = int(start), int(end)
+            if start < 1 or end < start:
+                raise ValueError("columns 格式错误: " + value)
+            columns.extend(range(start, end + 1))
+        else:
+            column = int(part)
+            if column < 1:
+                raise ValueError("columns 格式错误: " + value)
+            columns.append(column)
+    if not columns:
+        raise ValueError("columns 格式错误: " + value)
+    return columns
+
+
+def select_columns(cells: List[str], columns: Optional[List[int]]) -> List[str]:
+    if columns is None:
+        return cells
+    return [cells[column - 1] for column in columns if column <= len(cells)]
+
+
+def assemble_slide(
+    unit: dict,
+    row_window: Optional[Tuple[int, Optional[int]]] = None,
+    columns: Optional[List[int]] = None,
+    with_lists: bool = True
+) -> Tuple[str, str, List[str], List[int]]:
+    slide_parts = []
+    slide_texts = []
+    slide_tables = []
+    table_row_counts = []
+    for shape in unit["shapes"]:
+        if isinstance(shape, str):
+            if shape:
+                slide_parts.append(shape)
+                slide_texts.append(shape)
+            continue
+        table_row_counts.append(len(shape))
+        rows = shape[row_window[0]:row_window[1]] if row_window else shape
+        table_text = "\n".join(["\t".join(select_columns(cells, columns)) for cells in rows]).strip()
+        if table_text:
+            slide_parts.append(table_text)
+            slide_tables.append(table_text)
+    if unit["notes"]:
+        slide_parts.append(" notes: " + unit["notes"])
+        slide_texts.append(" notes: " + unit["notes"])
+    return (
+        "\n".join(slide_parts),
+        "\n".join(slide_texts).strip() if with_lists else "",
+        slide_tables if with_lists else [],
+        table_row_counts
+    )
+
+
+def extract_pptx_chunk(
+    file_path: str,
+    slide_start: Optional[int],
+    slide_end: Optional[int],
+    include_content: bool,
+    output_mode: str,
+    use_cache: bool,
+    use_index: bool,
+    row_window: Optional[Tuple[int, Optional[int]]],
+    columns: Optional[List[int]],
+    max_chars: Optional[int],
+    max_tokens: Optional[int],
+    cursor: Optional[str]
+) -> dict:
+    error = check_budget(max_chars, max_tokens)
+    resume_index = None
+    if error is None and cursor:
+        try:
+            resume_index = parse_cursor(cursor, file_path, ["slide"]).get("slide", 0)
+        except ValueError as exc:
+            error = str(exc)
+
+    budget = ChunkBudget(max_chars, max_tokens)
+    content_blocks = []
+    table_row_counts = []
+    slides_list = []
+    slide_range = [0, 0]
+    next_slide_index = None
+    if error is None:
+        units = load_units("pptx", file_path) if use_cache else None
+        units_changed = False
+        try:
+            with open_package(file_path) as package:
+                slide_parts = None
+                if units is None:
+                    slide_parts = load_slide_parts(package, file_path, use_index)
+                    units = {
+                        "slide_count": len(slide_parts),
+                        "slides": {}
+                    }
+                slide_start_index, slide_end_index = normalize_range(units["slide_count"], slide_start, slide_end)
+                if resume_index is not None:
+                    slide_start_index = max(slide_start_index, resume_index)
+                for index in range(slide_start_index, slide_end_index):
+                    if str(index) not in units["slides"]:
+                        if slide_parts is None:
+                            slide_parts = load_slide_parts(package, file_path, use_index)
+                        units["slides"][str(index)] = read_slide_part(package, slide_parts[index])
+                        units_changed = True
+                    block, slide_texts, slide_tables, row_counts = assemble_slide(
+                        units["slides"][str(index)], row_window, columns, output_mode == "list"
+                    )
+                    if not budget.add(block, "\n\n"):
+                        next_slide_index = index
+                        break
+                    if block:
+                        content_blocks.append(block)
+                    table_row_counts.extend(row_counts)
+                    if output_mode == "list":
+                        slides_list.append({
+                            "slide_index": index + 1,
+                            "texts": slide_texts,
+                            "tables": slide_tables
+                        })
+                    slide_range = [slide_range[0] or index + 1, index + 1]
+        except (zipfile.BadZipFile, KeyError):
+            error = "无法读取pptx文件"
+        except Exception as exc:
+            error = str(exc)
+        if use_cache and units_changed:
+            store_units("pptx", file_path, units)
+    if error:
         return {
             "success": False,
             "file_path": file_path,
@@ -64,10 +292,45 @@ def extract_pptx(
                 "table_row_counts": [],
                 "char_count": 0
             },
-            "error": "仅支持.pptx格式"
+            "next_cursor": None,
+            "error": error
         }
 
-    if output_mode not in ["full", "list"]:
+    content = "\n\n".join(content_blocks).strip()
+    return {
+        "success": True,
+        "file_path": file_path,
+        "content": content if output_mode == "full" and include_content else "",
+        "slides": slides_list if output_mode == "list" else [],
+        "statistics": {
+            "slide_count": slide_range[1] - slide_range[0] + 1 if slide_range[0] else 0,
+            "slide_range": slide_range,
+            "table_count": len(table_row_counts),
+            "table_row_counts": table_row_counts,
+            "char_count": len(content),
+            "token_count": estimate_tokens(content)
+        },
+        "next_cursor": format_cursor(file_path, {"slide": next_slide_index}) if next_slide_index is not None else None,
+        "error": None
+    }
+
+
+def extract_pptx(
+    file_path: str,
+    slide_start: Optional[int] = None,
+    slide_end: Optional[int] = None,
+    include_content: bool = True,
+    output_mode: str = "full",
+    use_cache: bool = True,
+    table_row_start: Optional[int] = None,
+    table_row_end: Optional[int] = None,
+    columns: Optional[List[int]] = None,
+    use_index: bool = True,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> dict:
+    if not os.path.isfile(file_path):
         return {
             "success": False,
             "file_path": file_path,
@@ -79,12 +342,10 @@ def extract_pptx(
                 "table_row_counts": [],
                 "char_count": 0
             },
-            "error": 'output_mode 仅限 ["full", "list"]'
+            "error": "文件不存在"
         }
 
-    try:
-        presentation = Presentation(file_path)
-    except PackageNotFoundError:
+    if not file_path.lower().endswith(".pptx"):
         return {
             "success": False,
             "file_path": file_path,
@@ -96,9 +357,10 @@ def extract_pptx(
                 "table_row_counts": [],
                 "char_count": 0
             },
-            "error": "无法读取pptx文件"
+            "error": "仅支持.pptx格式"
         }
-    except Exception as exc:
+
+    if output_mode not in ["full", "list"]:
         return {
             "success": False,
             "file_path": file_path,
@@ -110,59 +372,90 @@ def extract_pptx(
                 "table_row_counts": [],
                 "char_count": 0
             },
-            "error": str(exc)
+            "error": 'output_mode 仅限 ["full", "list"]'
         }
 
-    slides = list(presentation.slides)
-    slide_start_index, slide_end_index = normalize_range(len(slides), slide_start, slide_end)
-    selected_slides = slides[slide_start_index:slide_end_index]
+    row_window = None
+    if table_row_start is not None or table_row_end is not None:
+        row_window = (
+            0 if table_row_start is None else max(1, int(table_row_start)) - 1,
+            None if table_row_end is None else max(0, int(table_row_end))
+        )
+    if max_chars is not None or max_tokens is not None or cursor is not None:
+        return extract_pptx_chunk(
+            file_path, slide_start, slide_end, include_content, output_mode, use_cache, use_index,
+            row_window, columns, max_chars, max_tokens, cursor
+        )
+
+    units = load_units("pptx", file_path) if use_cache else None
+    slides_cached = False
+    if units is not None:
+        slide_start_index, slide_end_index = normalize_range(units["slide_count"], slide_start, slide_end)
+        slides_cached = all(
+            str(index) in units["slides"] for index in range(slide_start_index, slide_end_index)
+        )
+
+    if not slides_cached:
+        try:
+            with open_package(file_path) as package:
+                slide_parts = load_slide_parts(package, file_path, use_index)
+                if units is None:
+                    units = {
+                        "slide_count": len(slide_parts),
+                        "slides": {}
+                    }
+                slide_start_index, slide_end_index = normalize_range(len(slide_parts), slide_start, slide_end)
+                for index in range(slide_start_index, slide_end_index):
+                    if str(index) not in units["slides"]:
+                        units["slides"][str(index)] = read_slide_part(package, slide_parts[index])
+        except (zipfile.BadZipFile, KeyError):
+            return {
+                "success": False,
+                "file_path": file_path,
+                "content": "",
+                "slides": [],
+                "statistics": {
+                    "slide_count": 0,
+                    "table_count": 0,
+                    "table_row_counts": [],
+                    "char_count": 0
+                },
+                "error": "无法读取pptx文件"
+            }
+        except Exception as exc:
+            return {
+                "success": False,
+                "file_path": file_path,
+                "content": "",
+                "slides": [],
+                "statistics": {
+                    "slide_count": 0,
+                    "table_count": 0,
+                    "table_row_counts": [],
+                    "char_count": 0
+                },
+                "error": str(exc)
+            }
+        if use_cache and (include_content or output_mode != "full"):
+            store_units("pptx", file_path, units)
 
     content_blocks = []
     table_row_counts = []
-    table_count = 0
     slides_list = []
 
-    for index, slide in enumerate(selected_slides, start=slide_start_index + 1):
-        slide_parts = []
-        slide_texts = []
-        slide_tables = []
-        notes_text = ""
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                text = (shape.text or "").strip()
-                if text:
-                    slide_parts.append(text)
-                    slide_texts.append(text)
-            if shape.has_table:
-                table = shape.table
-                rows = []
-                for row in table.rows:
-                    row_cells = [cell.text.strip() for cell in row.cells]
-                    rows.append(row_cells)
-                table_count += 1
-                table_row_counts.append(len(rows))
-                table_text = "\n".join(["\t".join(cells) for cells in rows]).strip()
-                if table_text:
-                    slide_parts.append(table_text)
-                    slide_tables.append(table_text)
-        if slide.has_notes_slide:
-            notes_frame = slide.notes_slide.notes_text_frame
-            if notes_frame:
-                notes_text = (notes_frame.text or "").strip()
-        if notes_text:
-            slide_parts.append(" notes: " + notes_text)
-            slide_texts.append(" notes: " + notes_text)
-        if slide_parts:
-            content_blocks.append("\n".join(slide_parts))
-        if slide_texts:
-            slide_texts = "\n".join(slide_texts).strip()
-        else:
-            slide_texts = ""
-        slides_list.append({
-            "slide_index": index,
-            "texts": slide_texts,
-            "tables": slide_tables
-        })
+    for index in range(slide_start_index, slide_end_index):
+        block, slide_texts, slide_tables, row_counts = assemble_slide(
+            units["slides"][str(index)], row_window, columns, output_mode == "list"
+        )
+        if block:
+            content_blocks.append(block)
+        table_row_counts.extend(row_counts)
+        if output_mode == "list":
+            slides_list.append({
+                "slide_index": index + 1,
+                "texts": slide_texts,
+                "tables": slide_tables
+            })
 
     content = "\n\n".join(content_blocks).strip()
     char_count = len(content)
@@ -175,8 +468,8 @@ def extract_pptx(
         "content": content if output_mode == "full" else "",
         "slides": slides_list if output_mode == "list" else [],
         "statistics": {
-            "slide_count": len(selected_slides),
-            "table_count": table_count,
+            "slide_count": slide_end_index - slide_start_index,
+            "table_count": len(table_row_counts),
             "table_row_counts": table_row_counts,
             "char_count": char_count
         },
@@ -184,23 +477,261 @@ def extract_pptx(
     }
 
 
-def main():
+def search_pptx(
+    file_path: str,
+    pattern: str,
+    use_regex: bool = False,
+    ignore_case: bool = False,
+    max_hits: Optional[int] = 100,
+    slide_start: Optional[int] = None,
+    slide_end: Optional[int] = None,
+    use_cache: bool = True,
+    use_index: bool = True,
+    cursor: Optional[str] = None
+) -> dict:
+    error = None
+    regex = None
+    resumed = None
+    if not os.path.isfile(file_path):
+        error = "文件不存在"
+    elif not file_path.lower().endswith(".pptx"):
+        error = "仅支持.pptx格式"
+    else:
+        error = check_max_hits(max_hits)
+    if error is None:
+        try:
+            regex = compile_search(pattern, use_regex, ignore_case)
+            if cursor:
+                resumed = parse_cursor(cursor, file_path, ["slide", "offset"])
+        except ValueError as exc:
+            error = str(exc)
+
+    collector = SearchCollector(regex, max_hits)
+    next_position = None
+    if error is None:
+        units = load_units("pptx", file_path) if use_cache else None
+        try:
+            with open_package(file_path) as package:
+                slide_parts = None
+                if units is None:
+                    slide_parts = load_slide_parts(package, file_path, use_index)
+                    units = {
+                        "slide_count": len(slide_parts),
+                        "slides": {}
+                    }
+                slide_start_index, slide_end_index = normalize_range(units["slide_count"], slide_start, slide_end)
+                offset = 0
+                if resumed is not None and "slide" in resumed:
+                    slide_start_index = max(slide_start_index, resumed["slide"])
+                    offset = resumed.get("offset", 0) if resumed["slide"] == slide_start_index else 0
+                for index in range(slide_start_index, slide_end_index):
+                    unit = units["slides"].get(str(index))
+                    if unit is None:
+                        if slide_parts is None:
+                            slide_parts = load_slide_parts(package, file_path, use_index)
+                        unit = read_slide_part(package, slide_parts[index])
+                    if not collector.scan({"slide_index": index + 1}, assemble_slide(unit, with_lists=False)[0], offset):
+                        next_position = {"slide": index, "offset": collector.stop_offset}
+                        break
+                    offset = 0
+        except (zipfile.BadZipFile, KeyError):
+            error = "无法读取pptx文件"
+        except Exception as exc:
+            error = str(exc)
+    if error:
+        return {
+            "success": False,
+            "file_path": file_path,
+            "hits": [],
+            "statistics": {
+                "slide_count": 0,
+                "hit_count": 0
+            },
+            "next_cursor": None,
+            "error": error
+        }
+
+    return {
+        "success": True,
+        "file_path": file_path,
+        "hits": collector.hits,
+        "statistics": {
+            "slide_count": collector.unit_count,
+            "hit_count": len(collector.hits)
+        },
+        "next_cursor": format_cursor(file_path, next_position) if next_position is not None else None,
+        "error": None
+    }
+
+
+def stream_pptx(
+    file_path: str,
+    slide_start: Optional[int] = None,
+    slide_end: Optional[int] = None,
+    include_content: bool = True,
+    table_row_start: Optional[int] = None,
+    table_row_end: Optional[int] = None,
+    columns: Optional[List[int]] = None,
+    use_index: bool = True
+) -> Iterator[dict]:
+    error = None
+    if not os.path.isfile(file_path):
+        error = "文件不存在"
+    elif not file_path.lower().endswith(".pptx"):
+        error = "仅支持.pptx格式"
+    if error:
+        yield {
+            "type": "statistics",
+            "success": False,
+            "file_path": file_path,
+            "statistics": {
+                "slide_count": 0,
+                "table_count": 0,
+                "table_row_counts": [],
+                "char_count": 0
+            },
+            "error": error
+        }
+        return
+
+    row_window = None
+    if table_row_start is not None or table_row_end is not None:
+        row_window = (
+            0 if table_row_start is None else max(1, int(table_row_start)) - 1,
+            None if table_row_end is None else max(0, int(table_row_end))
+        )
+    table_row_counts = []
+    char_count = 0
+    non_empty_slides = 0
+    slide_count = 0
+    try:
+        with open_package(file_path) as package:
+            slide_parts = load_slide_parts(package, file_path, use_index)
+            slide_start_index, slide_end_index = normalize_range(len(slide_parts), slide_start, slide_end)
+            for index in range(slide_start_index, slide_end_index):
+                block, slide_texts, slide_tables, row_counts = assemble_slide(
+                    read_slide_part(package, slide_parts[index]), row_window, columns, include_content
+                )
+                slide_count += 1
+                table_row_counts.extend(row_counts)
+                if block:
+                    char_count += len(block) + (2 if non_empty_slides else 0)
+                    non_empty_slides += 1
+                record = {
+                    "type": "slide",
+                    "slide_index": index + 1,
+                    "table_row_counts": row_counts,
+                    "char_count": len(block)
+                }
+                if include_content:
+                    record["text"] = block
+                    record["texts"] = slide_texts
+                    record["tables"] = slide_tables
+                yield record
+    except (zipfile.BadZipFile, KeyError):
+        error = "无法读取pptx文件"
+    except Exception as exc:
+        error = str(exc)
+
+    yield {
+        "type": "statistics",
+        "success": error is None,
+        "file_path": file_path,
+        "statistics": {
+            "slide_count": slide_count,
+            "table_count": len(table_row_counts),
+            "table_row_counts": table_row_counts,
+            "char_count": char_count
+        },
+        "error": error
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("file_path")
     parser.add_argument("--slide-start", type=int, default=None)
     parser.add_argument("--slide-end", type=int, default=None)
     parser.add_argument("--include-content", type=parse_bool, default=True)
     parser.add_argument("--output-mode", choices=["full", "list"], default="full")
+    parser.add_argument("--cache", type=parse_bool, default=True)
+    parser.add_argument("--stream", type=parse_bool, default=False)
+    parser.add_argument("--table-row-start", type=int, default=None)
+    parser.add_argument("--table-row-end", type=int, default=None)
+    parser.add_argument("--columns", type=parse_columns, default=None)
+    parser.add_argument("--index", type=parse_bool, default=True)
+    parser.add_argument("--max-chars", type=int, default=None)
+    parser.add_argument("--max-tokens", type=int, default=None)
+    parser.add_argument("--cursor", default=None)
+    parser.add_argument("--search", default=None)
+    parser.add_argument("--regex", type=parse_bool, default=False)
+    parser.add_argument("--ignore-case", type=parse_bool, default=False)
+    parser.add_argument("--max-hits", type=int, default=100)
+    parser.add_argument("--profile", type=parse_bool, default=False)
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="pretty")
+    return parser
+
+
+def run_cli(args: argparse.Namespace, write: Optional[Callable[[dict], None]] = None) -> dict:
+    with profile_session("pptx", args.file_path, args.profile) as profiler:
+        result = run_reader(args)
+    return finish_profile(profiler, result, args.profile, write)
 
-    args = parser.parse_args()
-    result = extract_pptx(
+
+def run_reader(args: argparse.Namespace) -> dict:
+    if args.search is not None:
+        return search_pptx(
+            args.file_path,
+            args.search,
+            use_regex=args.regex,
+            ignore_case=args.ignore_case,
+            max_hits=args.max_hits,
+            slide_start=args.slide_start,
+            slide_end=args.slide_end,
+            use_cache=args.cache,
+            use_index=args.index,
+            cursor=args.cursor
+        )
+    return extract_pptx(
         args.file_path,
         slide_start=args.slide_start,
         slide_end=args.slide_end,
         include_content=args.include_content,
-        output_mode=args.output_mode
+        output_mode=args.output_mode,
+        use_cache=args.cache,
+        table_row_start=args.table_row_start,
+        table_row_end=args.table_row_end,
+        columns=args.columns,
+        use_index=args.index,
+        max_chars=args.max_chars,
+        max_tokens=args.max_tokens,
+        cursor=args.cursor
     )
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+def stream_cli(args: argparse.Namespace) -> Iterator[dict]:
+    return profile_stream("pptx", args.file_path, args.profile, stream_pptx(
+        args.file_path,
+        slide_start=args.slide_start,
+        slide_end=args.slide_end,
+        include_content=args.include_content,
+        table_row_start=args.table_row_start,
+        table_row_end=args.table_row_end,
+        columns=args.columns,
+        use_index=args.index
+    ))
+
+
+def main():
+    run_via_daemon("pptx")
+    args = build_parser().parse_args()
+    if args.stream:
+        record = write_records(stream_cli(args), args.output_format, sys.stdout, sys.stderr)
+        if not record.get("success", True):
+            sys.exit(1)
+        return
+
+    result = run_cli(args, lambda result: write_result(result, args.output_format, sys.stdout, sys.stderr))
 
     if not result["success"]:
         sys.exit(1)